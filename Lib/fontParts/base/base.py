@@ -1,4 +1,10 @@
+import asyncio
+import contextvars
+import functools
 import math
+import threading
+import types
+from contextlib import contextmanager
 from copy import deepcopy
 from fontTools.misc import transform
 from fontParts.base.errors import FontPartsError
@@ -76,6 +82,14 @@ class dynamicProperty(object):
         >>> m.foo = 2
         >>> m.foo
         200
+
+    The getter and setter are resolved once for each
+    subclass of :class:`BaseObject` when the subclass is
+    created and bound into a native ``property`` on that
+    subclass. They are resolved again when a getter or
+    setter is set on the class later. Overrides in subclasses
+    behave as shown above, but the attribute lookup is not
+    repeated on every access.
     """
 
     def __init__(self, name, doc=None):
@@ -102,16 +116,197 @@ class dynamicProperty(object):
         else:
             raise FontPartsError("no setter for %r" % self.name)
 
+    def bind(self, cls):
+        """
+        Return a :class:`boundDynamicProperty` with the getter
+        and setter resolved for **cls**. If either of them is
+        not a plain function, ``None`` is returned and the
+        attribute is left to be resolved on every access.
+        """
+        name = self.name
+        getter = getattr(cls, self.getterName, None)
+        setter = getattr(cls, self.setterName, None)
+        if getter is None:
+            def getter(obj):
+                raise FontPartsError("no getter for %r" % name)
+        if setter is None:
+            def setter(obj, value):
+                raise FontPartsError("no setter for %r" % name)
+        if not isinstance(getter, types.FunctionType):
+            return None
+        if not isinstance(setter, types.FunctionType):
+            return None
+        return boundDynamicProperty(self, getter, setter)
+
+
+class boundDynamicProperty(property):
+
+    """
+    A native ``property`` created by :meth:`dynamicProperty.bind`.
+    The originating :class:`dynamicProperty` is available as
+    ``dynamic`` so that it can be bound again for subclasses.
+    """
+
+    def __init__(self, dynamic, getter, setter):
+        super(boundDynamicProperty, self).__init__(
+            getter, setter, None, dynamic.__doc__
+        )
+        self.dynamic = dynamic
+
 
 def interpolate(a, b, v):
     return a + (b - a) * v
 
 
+_sharedProcessPool = contextvars.ContextVar("sharedProcessPool", default=None)
+
+
+@contextmanager
+def sharedProcessPool(workers):
+    """
+    Run every :func:`mapInProcesses` call made inside
+    the block in one pool of **workers** processes
+    instead of starting a pool for each call. If
+    **workers** is ``None`` or less than 2, or a
+    shared pool is already running, this does nothing.
+    The pool is tracked per thread and per asyncio task.
+    """
+    if workers is None or workers < 2 or _sharedProcessPool.get() is not None:
+        yield
+        return
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        token = _sharedProcessPool.set(executor)
+        try:
+            yield
+        finally:
+            _sharedProcessPool.reset(token)
+
+
+def mapInProcesses(function, items, workers, *args, executor=None):
+    """
+    Call **function** with chunks of **items**, followed
+    by **args**, and return the concatenated results in
+    the order of **items**. **function** must return a
+    ``list`` with one result per item. If **workers** is
+    greater than 1, the chunks are processed in a pool of
+    that many processes, so **function**, **items** and
+    **args** must be picklable. The pool is **executor**
+    if it is given, the shared pool inside
+    :func:`sharedProcessPool`, or a new pool otherwise.
+    """
+    items = list(items)
+    if workers is None or workers < 2 or len(items) < 2:
+        return function(items, *args)
+    import concurrent.futures
+
+    chunkCount = min(len(items), workers * 4)
+    chunkSize = -(-len(items) // chunkCount)
+    chunks = [
+        items[i:i + chunkSize] for i in range(0, len(items), chunkSize)
+    ]
+    results = []
+    if executor is None:
+        executor = _sharedProcessPool.get()
+    if executor is not None:
+        futures = [
+            executor.submit(function, chunk, *args) for chunk in chunks
+        ]
+        for future in futures:
+            results.extend(future.result())
+        return results
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(function, chunk, *args) for chunk in chunks
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+_asyncExecutor = None
+_asyncWorkers = None
+_asyncLock = threading.Lock()
+
+
+def setAsyncWorkers(workers):
+    """
+    Set the number of threads in this process that run
+    the blocking work of the ``Async`` functions and
+    methods, such as :meth:`BaseFont.saveAsync
+    <fontParts.base.BaseFont.saveAsync>`. Calls beyond
+    this number wait for a free thread. If **workers** is
+    ``None``, the default of :class:`concurrent.futures.ThreadPoolExecutor`
+    is used. The threads are replaced without waiting:
+    calls that have already been made, including calls
+    still waiting for a thread, are run to completion
+    by the old threads. Later calls use the new threads.
+    """
+    global _asyncExecutor, _asyncWorkers
+    workers = normalizers.normalizeWorkers(workers)
+    with _asyncLock:
+        if _asyncExecutor is not None:
+            _asyncExecutor.shutdown(wait=False)
+            _asyncExecutor = None
+        _asyncWorkers = workers
+
+
+def _getAsyncExecutor():
+    global _asyncExecutor
+    with _asyncLock:
+        if _asyncExecutor is None:
+            import concurrent.futures
+
+            _asyncExecutor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_asyncWorkers, thread_name_prefix="fontParts"
+            )
+        return _asyncExecutor
+
+
+async def runAsync(function, *args, **kwargs):
+    """
+    Call **function** with **args** and **kwargs** in
+    one of the threads set with :func:`setAsyncWorkers`
+    and return its result without blocking the event loop.
+    If the awaiting task is cancelled before the call has
+    started, the call is not made. A call that has already
+    started runs to completion. The call runs in a copy
+    of the current :mod:`contextvars` context, so settings
+    such as :func:`sharedProcessPool` apply to it.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _getAsyncExecutor(),
+        functools.partial(context.run, function, *args, **kwargs)
+    )
+
+
 # ------------
 # Base Objects
 # ------------
 
-class BaseObject(object):
+class _BaseObjectMeta(type):
+
+    """
+    Bind the dynamic properties of a :class:`BaseObject`
+    class again when one of its ``_get_`` or ``_set_``
+    attributes is set or deleted after the class was created.
+    """
+
+    def __setattr__(cls, attr, value):
+        super(_BaseObjectMeta, cls).__setattr__(attr, value)
+        if attr.startswith(("_get_", "_set_")):
+            cls._bindDynamicProperties()
+
+    def __delattr__(cls, attr):
+        super(_BaseObjectMeta, cls).__delattr__(attr)
+        if attr.startswith(("_get_", "_set_")):
+            cls._bindDynamicProperties()
+
+
+class BaseObject(object, metaclass=_BaseObjectMeta):
 
     # --------------
     # Initialization
@@ -120,6 +315,37 @@ class BaseObject(object):
     def __init__(self, *args, **kwargs):
         self._init(*args, **kwargs)
 
+    def __init_subclass__(cls, **kwargs):
+        super(BaseObject, cls).__init_subclass__(**kwargs)
+        cls._bindDynamicProperties()
+
+    @classmethod
+    def _bindDynamicProperties(cls):
+        """
+        Bind every :class:`dynamicProperty` available to this
+        class to the getters and setters resolved for it.
+        This is called when a subclass is created and when a
+        ``_get_`` or ``_set_`` attribute of the class is set
+        or deleted. Subclasses of the class are bound again
+        as well.
+        """
+        properties = {}
+        for base in reversed(cls.__mro__):
+            for attr, value in vars(base).items():
+                if isinstance(value, boundDynamicProperty):
+                    value = value.dynamic
+                if isinstance(value, dynamicProperty):
+                    properties[attr] = value
+                else:
+                    properties.pop(attr, None)
+        for attr, dynamic in properties.items():
+            bound = dynamic.bind(cls)
+            if bound is None:
+                bound = dynamic
+            setattr(cls, attr, bound)
+        for subclass in cls.__subclasses__():
+            subclass._bindDynamicProperties()
+
     def _init(self, *args, **kwargs):
         """
         Subclasses may override this method.
@@ -202,7 +428,8 @@ class BaseObject(object):
         if copyClass is None:
             copyClass = self.__class__
         copied = copyClass()
-        copied.copyData(self)
+        with normalizers.trustedMode():
+            copied.copyData(self)
         return copied
 
     def copyData(self, source):
@@ -245,6 +472,44 @@ class BaseObject(object):
             >>> obj.changed()
         """
 
+    @contextmanager
+    def holdChanges(self):
+        """
+        Hold the environment's change notifications for the
+        object while the block is executed. The changes made
+        in the block are announced when the block exits,
+        coalesced where the environment is able to do so.
+
+            >>> with glyph.holdChanges():
+            ...     glyph.moveBy((10, 0))
+            ...     glyph.width += 20
+
+        Holds may be nested. The behavior of this method will
+        vary from environment to environment.
+        """
+        self._holdChanges()
+        try:
+            yield
+        finally:
+            self._releaseHeldChanges()
+
+    def _holdChanges(self):
+        """
+        This is the environment implementation of the start
+        of :meth:`BaseObject.holdChanges`.
+
+        Subclasses may override this method.
+        """
+
+    def _releaseHeldChanges(self):
+        """
+        This is the environment implementation of the end
+        of :meth:`BaseObject.holdChanges`. This must post
+        any notifications held by :meth:`BaseObject._holdChanges`.
+
+        Subclasses may override this method.
+        """
+
     def naked(self):
         """
         Return the environment's native object
@@ -254,6 +519,34 @@ class BaseObject(object):
         """
         self.raiseNotImplementedError()
 
+    def _getChangeToken(self):
+        """
+        Return an object that compares equal for as long as
+        the environment's native object has not changed, or
+        ``None`` if the environment can't track changes.
+        Objects may cache derived data for as long as the
+        token is unchanged.
+
+        Subclasses may override this method.
+        """
+        return None
+
+
+_immutableValueTypes = (str, int, float, bool)
+
+
+def _copyValue(value):
+    """
+    Return a deep copy of **value**, or **value** itself
+    if it can not be changed in place.
+    """
+    if isinstance(value, _immutableValueTypes):
+        return value
+    if isinstance(value, tuple):
+        if all(isinstance(v, _immutableValueTypes) for v in value):
+            return value
+    return deepcopy(value)
+
 
 class BaseDict(BaseObject):
 
@@ -409,30 +702,40 @@ class BaseDict(BaseObject):
     def _iter(self):
         """
         Subclasses may override this method.
+
+        The keys are normalized one at a time as they are
+        requested. The unnormalized keys are collected before
+        the first key is yielded, so items may be removed
+        during iteration.
         """
-        keys = self.keys()
-        while keys:
-            key = keys[0]
+        keyNormalizer = self.keyNormalizer
+        for key in list(self._keys()):
+            if keyNormalizer is not None:
+                key = keyNormalizer.__func__(key)
             yield key
-            keys = keys[1:]
 
     def update(self, other):
-        other = deepcopy(other)
-        if self.keyNormalizer is not None and self.valueNormalizer is not None:
-            d = {}
-            for key, value in other.items():
-                key = self.keyNormalizer.__func__(key)
-                value = self.valueNormalizer.__func__(value)
-                d[key] = value
-            value = d
-        self._update(other)
+        keyNormalizer = self.keyNormalizer
+        valueNormalizer = self.valueNormalizer
+        d = {}
+        for key, value in other.items():
+            if keyNormalizer is not None:
+                key = keyNormalizer.__func__(key)
+            if valueNormalizer is not None:
+                value = valueNormalizer.__func__(value)
+            d[key] = _copyValue(value)
+        self._update(d)
 
     def _update(self, other):
         """
-        Subclasses may override this method.
+        **other** will be a ``dict`` of keys and values that
+        have already been normalized and copied.
+
+        Subclasses may override this method to pass all
+        items to the environment in one operation.
         """
         for key, value in other.items():
-            self[key] = value
+            self._setItem(key, value)
 
     def clear(self):
         self._clear()
@@ -646,9 +949,10 @@ class InterpolationMixin(object):
 
     compatibilityReporterClass = None
 
-    def isCompatible(self, other, cls):
+    def isCompatible(self, other, cls, **kwargs):
         """
         Evaluate interpolation compatibility with other.
+        **kwargs** are passed to the environment implementation.
         """
         if not isinstance(other, cls):
             raise TypeError(
@@ -656,7 +960,7 @@ class InterpolationMixin(object):
                 instance of %r can not be checked."""
                 % (cls.__name__, other.__class__.__name__))
         reporter = self.compatibilityReporterClass(self, other)
-        self._isCompatible(other, reporter)
+        self._isCompatible(other, reporter, **kwargs)
         return not reporter.fatal, reporter
 
     def _isCompatible(self, other, reporter):
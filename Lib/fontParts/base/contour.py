@@ -1,3 +1,4 @@
+from fontTools.misc import transform
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
     BaseObject,
@@ -252,10 +253,14 @@ class BaseContour(
 
     def _transformBy(self, matrix, **kwargs):
         """
+        This transforms all of the point coordinates in one
+        operation with :meth:`BaseContour._set_coordinates`.
+
         Subclasses may override this method.
         """
-        for point in self.points:
-            point.transformBy(matrix)
+        t = transform.Transform(*matrix)
+        coordinates = t.transformPoints(self._get_coordinates())
+        self._set_coordinates(tuple(coordinates))
 
     # -------------
     # Interpolation
@@ -470,7 +475,27 @@ class BaseContour(
         if segment.contour is None:
             segment.contour = self
 
-    segments = dynamicProperty("segments")
+    segments = dynamicProperty("base_segments")
+
+    _segmentsCache = None
+
+    def _get_base_segments(self):
+        return list(self._getCachedSegments())
+
+    def _getCachedSegments(self):
+        """
+        Return the segments as a ``tuple``. The segments are
+        reused for as long as :meth:`BaseObject._getChangeToken`
+        returns the same token.
+        """
+        token = self._getChangeToken()
+        if token is None:
+            return tuple(self._get_segments())
+        cache = self._segmentsCache
+        if cache is None or cache[0] != token:
+            cache = (token, tuple(self._get_segments()))
+            self._segmentsCache = cache
+        return cache[1]
 
     def _get_segments(self):
         """
@@ -510,19 +535,14 @@ class BaseContour(
         return wrapped
 
     def __getitem__(self, index):
-        return self.segments[index]
+        return self._getCachedSegments()[index]
 
     def __iter__(self):
         return self._iterSegments()
 
     def _iterSegments(self):
-        segments = self.segments
-        count = len(segments)
-        index = 0
-        while count:
-            yield segments[index]
-            count -= 1
-            index += 1
+        for segment in self._getCachedSegments():
+            yield segment
 
     def __len__(self):
         return self._len__segments()
@@ -531,7 +551,7 @@ class BaseContour(
         """
         Subclasses may override this method.
         """
-        return len(self.segments)
+        return len(self._getCachedSegments())
 
     def appendSegment(self, type=None, points=None, smooth=False, segment=None):
         """
@@ -687,7 +707,19 @@ class BaseContour(
     # bPoints
     # -------
 
-    bPoints = dynamicProperty("bPoints")
+    bPoints = dynamicProperty("base_bPoints")
+
+    _bPointsCache = None
+
+    def _get_base_bPoints(self):
+        token = self._getChangeToken()
+        if token is None:
+            return self._get_bPoints()
+        cache = self._bPointsCache
+        if cache is None or cache[0] != token:
+            cache = (token, self._get_bPoints())
+            self._bPointsCache = cache
+        return cache[1]
 
     def _get_bPoints(self):
         bPoints = []
@@ -957,6 +989,90 @@ class BaseContour(
         """
         self.raiseNotImplementedError()
 
+    # -----------
+    # Coordinates
+    # -----------
+
+    coordinates = dynamicProperty(
+        "base_coordinates",
+        """
+        The positions of all points in the contour as a
+        NumPy array with the shape ``(n, 2)``.
+
+            >>> contour.coordinates
+            array([[  0.,   0.],
+                   [  0., 100.],
+                   [100., 100.]])
+            >>> contour.coordinates = contour.coordinates * 2
+
+        The order matches :attr:`BaseContour.points`. When setting,
+        the value must contain one coordinate for every point and
+        all points are moved in one operation. This requires NumPy.
+        """
+    )
+
+    def _get_base_coordinates(self):
+        import numpy
+        value = self._get_coordinates()
+        value = [normalizers.normalizeCoordinateTuple(v) for v in value]
+        return numpy.array(value, dtype=float).reshape(-1, 2)
+
+    def _set_base_coordinates(self, value):
+        value = normalizers.normalizeCoordinateArray(
+            value, self._len__points()
+        )
+        self._set_coordinates(value)
+
+    def _get_coordinates(self):
+        """
+        This must return a ``tuple`` of ``(x, y)`` tuples
+        in the order of the points in the contour.
+
+        Subclasses may override this method.
+        """
+        return tuple((point.x, point.y) for point in self.points)
+
+    def _set_coordinates(self, value):
+        """
+        **value** will be a ``tuple`` containing one ``(x, y)``
+        tuple for each point in the contour, normalized with
+        :func:`normalizers.normalizeCoordinateArray`.
+
+        Subclasses may override this method to set all
+        coordinates in one operation.
+        """
+        for point, (x, y) in zip(self.points, value):
+            point.x = x
+            point.y = y
+
+    pointTypes = dynamicProperty(
+        "base_pointTypes",
+        """
+        The types of all points in the contour as a NumPy
+        array of strings, parallel to :attr:`BaseContour.coordinates`.
+
+            >>> contour.pointTypes
+            array(['line', 'offcurve', 'offcurve', 'curve'], dtype='<U8')
+
+        This attribute is read only and requires NumPy.
+        """
+    )
+
+    def _get_base_pointTypes(self):
+        import numpy
+        value = self._get_pointTypes()
+        value = [normalizers.normalizePointType(v) for v in value]
+        return numpy.array(value, dtype=str)
+
+    def _get_pointTypes(self):
+        """
+        This must return a ``tuple`` of point types
+        in the order of the points in the contour.
+
+        Subclasses may override this method.
+        """
+        return tuple(point.type for point in self.points)
+
     # ---------
     # Selection
     # ---------
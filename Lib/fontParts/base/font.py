@@ -1,14 +1,45 @@
 import os
+import threading
+import weakref
+from array import array
 from fontParts.base.errors import FontPartsError
-from fontParts.base.base import dynamicProperty, InterpolationMixin
+from fontParts.base.base import (
+    dynamicProperty,
+    InterpolationMixin,
+    TransformationMixin,
+    runAsync
+)
 from fontParts.base.layer import _BaseGlyphVendor
 from fontParts.base import normalizers
 from fontParts.base.compatibility import FontCompatibilityReporter
 from fontParts.base.deprecated import DeprecatedFont, RemovedFont
 
 
+_kernOrder = {
+    (True, True): 0,  # group group
+    (True, False): 1,  # group glyph
+    (False, True): 2,  # glyph group
+    (False, False): 3,  # glyph glyph
+}
+
+
+def _flatKerningSortKey(pair):
+    g1, g2 = pair
+    g1grp = g1.startswith("public.kern1.")
+    g2grp = g2.startswith("public.kern2.")
+    return (_kernOrder[g1grp, g2grp], pair)
+
+
+# Saves and generations of one font run one at a time. The
+# locks are keyed by the environment object so that all of
+# the wrappers of a font share a lock.
+_ioLocks = weakref.WeakKeyDictionary()
+_ioLocksLock = threading.Lock()
+
+
 class BaseFont(
                _BaseGlyphVendor,
+               TransformationMixin,
                InterpolationMixin,
                DeprecatedFont,
                RemovedFont
@@ -20,7 +51,7 @@ class BaseFont(
     :ref:`fontparts-world`.
     """
 
-    def __init__(self, pathOrObject=None, showInterface=True):
+    def __init__(self, pathOrObject=None, showInterface=True, lazy=False):
         """
         When constructing a font, the object can be created
         in a new file, from an existing file or from a native
@@ -31,10 +62,18 @@ class BaseFont(
         FontParts. If **pathOrObject** is None, create a new,
         empty font. If **showInterface** is ``False``, the font
         should be created without graphical interface. The default
-        for **showInterface** is ``True``.
-        """
+        for **showInterface** is ``True``. If **lazy** is ``True``,
+        only the font's metadata, such as the layer and glyph names,
+        may be read when the font is opened. Everything else,
+        including the font info and the glyphs, must be read when
+        it is first accessed. The default for **lazy** is ``False``.
+        """
+        kwargs = {}
+        if lazy:
+            kwargs["lazy"] = True
         super(BaseFont, self).__init__(pathOrObject=pathOrObject,
-                                       showInterface=showInterface)
+                                       showInterface=showInterface,
+                                       **kwargs)
 
     def _reprContents(self):
         contents = [
@@ -157,12 +196,14 @@ class BaseFont(
 
     # save
 
-    def save(self, path=None, showProgress=False, formatVersion=None, fileStructure=None):
+    def save(self, path=None, showProgress=False, formatVersion=None, fileStructure=None,
+             incremental=False, workers=None, atomic=False):
         """
         Save the font to **path**.
 
             >>> font.save()
             >>> font.save("/path/to/my/font-2.ufo")
+            >>> font.save(incremental=True)
 
         If **path** is None, use the font's original location.
         The file type must be inferred from the file extension
@@ -184,6 +225,22 @@ class BaseFont(
         either be None, 'zip' or 'package', None will use the existing file
         strucure or the default one for unsaved font. 'package' is the default
         file structure and 'zip' will save the font to .ufoz.
+        If **incremental** is ``True`` and the font is saved into
+        its original location with its original format version and
+        file structure, only the data that has changed since the
+        font was opened or last saved should be written, and
+        nothing is written if nothing has changed. Files for
+        unchanged glyphs, layers and plists keep their modification
+        times. Otherwise the whole font is written. **workers** is
+        the number of processes the environment may use to write
+        the glyphs. If it is ``None``, the glyphs will be written in
+        this process. The written files must be the same either way.
+        If **atomic** is ``True``, the font should be written to a
+        temporary location next to **path** and then moved into place,
+        so that an interrupted save leaves the previous file intact.
+        Environments that can't replace the file in one step must
+        document where the previous file can be found if the save
+        is interrupted while it is being replaced.
 
         .. note::
 
@@ -204,11 +261,34 @@ class BaseFont(
                 formatVersion)
         if fileStructure is not None:
             fileStructure = normalizers.normalizeFileStructure(fileStructure)
-        self._save(path=path, showProgress=showProgress,
-                   formatVersion=formatVersion, fileStructure=fileStructure)
+        incremental = normalizers.normalizeBoolean(incremental)
+        workers = normalizers.normalizeWorkers(workers)
+        atomic = normalizers.normalizeBoolean(atomic)
+        with self._getIOLock():
+            self._save(path=path, showProgress=showProgress,
+                       formatVersion=formatVersion,
+                       fileStructure=fileStructure,
+                       incremental=incremental, workers=workers,
+                       atomic=atomic)
+
+    def _getIOLock(self):
+        """
+        Return the lock that :meth:`BaseFont.save` and
+        :meth:`BaseFont.generate` hold while they call
+        the environment.
+
+        Subclasses may override this method.
+        """
+        naked = self.naked()
+        with _ioLocksLock:
+            lock = _ioLocks.get(naked)
+            if lock is None:
+                lock = _ioLocks[naked] = threading.RLock()
+        return lock
 
     def _save(self, path=None, showProgress=False,
-              formatVersion=None, fileStructure=None, **kwargs):
+              formatVersion=None, fileStructure=None, incremental=False,
+              workers=None, atomic=False, **kwargs):
         """
         This is the environment implementation of
         :meth:`BaseFont.save`. **path** will be a
@@ -223,11 +303,35 @@ class BaseFont(
         or ``None`` indicating the file format version
         to write the data into. It will have been normalized
         with :func:`normalizers.normalizeFileFormatVersion`.
+        **incremental** will be a ``bool`` indicating if only
+        changed data should be written. Environments that can't
+        tell what has changed may write everything. **workers**
+        will be ``None`` or an ``int`` greater than 0. **atomic**
+        will be a ``bool`` indicating if the file should be
+        replaced in one step.
 
         Subclasses must override this method.
         """
         self.raiseNotImplementedError()
 
+    async def saveAsync(self, path=None, showProgress=False, formatVersion=None,
+                        fileStructure=None, incremental=False, workers=None,
+                        atomic=False):
+        """
+        Save the font without blocking the event loop.
+
+            >>> await font.saveAsync()
+            >>> await font.saveAsync("/path/to/my/font-2.ufo", atomic=True)
+
+        The arguments are the same as in :meth:`BaseFont.save`.
+        The save runs with :func:`fontParts.base.base.runAsync`.
+        Saves and generations of the same font wait for each
+        other. The font must not be changed until the save is done.
+        """
+        await runAsync(self.save, path=path, showProgress=showProgress,
+                       formatVersion=formatVersion, fileStructure=fileStructure,
+                       incremental=incremental, workers=workers, atomic=atomic)
+
     # close
 
     def close(self, save=False):
@@ -361,11 +465,12 @@ class BaseFont(
             fileName += ext
             path = os.path.join(path, fileName)
         path = normalizers.normalizeFilePath(path)
-        return self._generate(
-            format=format,
-            path=path,
-            environmentOptions=environmentOptions
-        )
+        with self._getIOLock():
+            return self._generate(
+                format=format,
+                path=path,
+                environmentOptions=environmentOptions
+            )
 
     @staticmethod
     def _isValidGenerateEnvironmentOption(name):
@@ -401,6 +506,21 @@ class BaseFont(
         """
         self.raiseNotImplementedError()
 
+    async def generateAsync(self, format, path=None, **environmentOptions):
+        """
+        Generate the font to another format without
+        blocking the event loop.
+
+            >>> await font.generateAsync("otfcff")
+
+        The arguments are the same as in :meth:`BaseFont.generate`.
+        The generation runs with :func:`fontParts.base.base.runAsync`.
+        Saves and generations of the same font wait for each
+        other. The font must not be changed until it is done.
+        """
+        return await runAsync(self.generate, format, path=path,
+                              **environmentOptions)
+
     # -----------
     # Sub-Objects
     # -----------
@@ -499,24 +619,11 @@ class BaseFont(
 
         Subclasses may override this method.
         """
-        kernOrder = {
-            (True, True): 0,  # group group
-            (True, False): 1,  # group glyph
-            (False, True): 2,  # glyph group
-            (False, False): 3,  # glyph glyph
-        }
-
-        def kerningSortKeyFunc(pair):
-            g1, g2 = pair
-            g1grp = g1.startswith("public.kern1.")
-            g2grp = g2.startswith("public.kern2.")
-            return (kernOrder[g1grp, g2grp], pair)
-
         flatKerning = dict()
         kerning = self.kerning
         groups = self.groups
 
-        for pair in sorted(self.kerning.keys(), key=kerningSortKeyFunc):
+        for pair in sorted(self.kerning.keys(), key=_flatKerningSortKey):
             kern = kerning[pair]
             (left, right) = pair
             if left.startswith("public.kern1."):
@@ -535,6 +642,128 @@ class BaseFont(
 
         return flatKerning
 
+    def iterFlatKerning(self):
+        """
+        Iterate over the font's kerning as flat pairs. ::
+
+            >>> for pair, value in font.iterFlatKerning():
+            ...     print(pair, value)
+            ("A", "V") -100
+
+        This yields each ``(pair, value)`` of :meth:`BaseFont.getFlatKerning`
+        exactly once, without holding the whole flat kerning in memory.
+        The pairs are yielded in the order of the kerning pairs they come
+        from, with group, group pairs first and glyph, glyph pairs last.
+        """
+        return self._iterFlatKerning()
+
+    def _iterFlatKerning(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.iterFlatKerning`.
+
+        Subclasses may override this method.
+        """
+        kerning = dict(self.kerning.items())
+        groups = dict(self.groups.items())
+        # the kerning groups that each glyph belongs to
+        glyphToGroups = ({}, {})
+        for side, prefix in enumerate(("public.kern1.", "public.kern2.")):
+            for groupName, glyphNames in groups.items():
+                if groupName.startswith(prefix):
+                    for glyphName in glyphNames:
+                        glyphToGroups[side].setdefault(glyphName, []).append(
+                            groupName)
+        # glyphs that more than one kerning pair may apply to
+        ambiguous = (set(), set())
+        for side, prefix in enumerate(("public.kern1.", "public.kern2.")):
+            for pair in kerning:
+                if not pair[side].startswith(prefix):
+                    ambiguous[side].add(pair[side])
+            for glyphName, groupNames in glyphToGroups[side].items():
+                if len(groupNames) > 1:
+                    ambiguous[side].add(glyphName)
+        pairs = sorted(kerning, key=_flatKerningSortKey)
+        precedence = {pair: index for index, pair in enumerate(pairs)}
+
+        def winner(left, right):
+            # the index of the last pair that applies to left, right
+            lefts = [left] + glyphToGroups[0].get(left, [])
+            rights = [right] + glyphToGroups[1].get(right, [])
+            return max(
+                precedence.get((l, r), -1) for l in lefts for r in rights
+            )
+
+        for index, pair in enumerate(pairs):
+            value = kerning[pair]
+            left, right = pair
+            if left.startswith("public.kern1."):
+                left = dict.fromkeys(groups.get(left, []))
+            else:
+                left = [left]
+            if right.startswith("public.kern2."):
+                right = dict.fromkeys(groups.get(right, []))
+            else:
+                right = [right]
+            for r in right:
+                rightAmbiguous = r in ambiguous[1]
+                for l in left:
+                    if rightAmbiguous or l in ambiguous[0]:
+                        if winner(l, r) != index:
+                            continue
+                    yield (l, r), value
+
+    def getCompactFlatKerning(self, glyphOrder=None):
+        """
+        Get the font's flat kerning as arrays indexed by glyph index. ::
+
+            >>> compact = font.getCompactFlatKerning()
+            >>> rightIndexes, values = compact[font.glyphOrder.index("A")]
+
+        The keys of the returned ``dict`` are the indexes of the left glyphs
+        in **glyphOrder**. The values are a ``tuple`` of an ``array`` of the
+        sorted indexes of the right glyphs and an ``array`` of the kerning
+        values as floats, so a value can be found with :func:`bisect.bisect_left`.
+        **glyphOrder** defaults to :attr:`BaseFont.glyphOrder`. Pairs with
+        glyphs that are not in **glyphOrder** are skipped.
+        """
+        if glyphOrder is None:
+            glyphOrder = self.glyphOrder
+        glyphOrder = normalizers.normalizeGlyphOrder(glyphOrder)
+        return self._getCompactFlatKerning(glyphOrder)
+
+    def _getCompactFlatKerning(self, glyphOrder):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.getCompactFlatKerning`. **glyphOrder**
+        will be a normalized glyph order.
+
+        Subclasses may override this method.
+        """
+        glyphIndexes = {
+            glyphName: index for index, glyphName in enumerate(glyphOrder)
+        }
+        rows = {}
+        for (left, right), value in self.iterFlatKerning():
+            leftIndex = glyphIndexes.get(left)
+            rightIndex = glyphIndexes.get(right)
+            if leftIndex is None or rightIndex is None:
+                continue
+            row = rows.get(leftIndex)
+            if row is None:
+                row = rows[leftIndex] = (array("l"), array("d"))
+            row[0].append(rightIndex)
+            row[1].append(value)
+        compact = {}
+        for leftIndex in sorted(rows):
+            rightIndexes, values = rows[leftIndex]
+            order = sorted(range(len(rightIndexes)), key=rightIndexes.__getitem__)
+            compact[leftIndex] = (
+                array("l", [rightIndexes[i] for i in order]),
+                array("d", [values[i] for i in order])
+            )
+        return compact
+
     # features
 
     features = dynamicProperty(
@@ -613,6 +842,48 @@ class BaseFont(
         """
         self.raiseNotImplementedError()
 
+    # -------
+    # Preload
+    # -------
+
+    def preload(self, glyphNames=None, workers=None):
+        """
+        Read the glyphs named **glyphNames** in all layers so that
+        later access to them doesn't have to. ::
+
+            >>> font = OpenFont("/path/to/font.ufo", lazy=True)
+            >>> font.preload(["A", "B", "C"], workers=4)
+
+        If **glyphNames** is ``None``, all glyphs will be read. Names
+        that are not in a layer are ignored for that layer. **workers**
+        is the number of processes the environment may use to read the
+        glyphs. If it is ``None``, the glyphs will be read in this process.
+        """
+        if glyphNames is None:
+            glyphNames = set()
+            for layer in self.layers:
+                glyphNames.update(layer.keys())
+            glyphNames = sorted(glyphNames)
+        else:
+            glyphNames = [normalizers.normalizeGlyphName(glyphName)
+                          for glyphName in glyphNames]
+        workers = normalizers.normalizeWorkers(workers)
+        self._preload(glyphNames, workers)
+
+    def _preload(self, glyphNames, workers=None):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.preload`. **glyphNames** will be a
+        ``list`` of normalized glyph names. **workers** will be
+        ``None`` or an ``int`` greater than 0.
+
+        Subclasses may override this method.
+        """
+        for layer in self.layers:
+            for glyphName in glyphNames:
+                if glyphName in layer:
+                    layer[glyphName]
+
     # -----------------
     # Layer Interaction
     # -----------------
@@ -1215,6 +1486,29 @@ class BaseFont(
         layer = self.defaultLayer
         layer.autoUnicodes()
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def _transformBy(self, matrix, **kwargs):
+        """
+        This is the environment implementation of
+        :meth:`BaseFont.transformBy`.
+
+        **matrix** will be a :ref:`type-transformation`
+        that has been normalized with
+        :func:`normalizers.normalizeTransformationMatrix`.
+        This applies the matrix to all glyphs in all layers
+        and to the font-level guidelines. Glyph widths and
+        heights and the font info are not changed.
+
+        Subclasses may override this method.
+        """
+        for layer in self.layers:
+            layer._transformBy(matrix)
+        for guideline in self.guidelines:
+            guideline.transformBy(matrix)
+
     # ----------
     # Guidelines
     # ----------
@@ -1429,8 +1723,9 @@ class BaseFont(
                             % (self.__class__.__name__, maxFont.__class__.__name__))
         round = normalizers.normalizeBoolean(round)
         suppressError = normalizers.normalizeBoolean(suppressError)
-        self._interpolate(factor, minFont, maxFont,
-                          round=round, suppressError=suppressError)
+        with normalizers.trustedMode():
+            self._interpolate(factor, minFont, maxFont,
+                              round=round, suppressError=suppressError)
 
     def _interpolate(self, factor, minFont, maxFont,
                      round=True, suppressError=True):
@@ -1462,7 +1757,7 @@ class BaseFont(
 
     compatibilityReporterClass = FontCompatibilityReporter
 
-    def isCompatible(self, other):
+    def isCompatible(self, other, failFast=False):
         """
         Evaluate interpolation compatibility with **other**.
 
@@ -1476,10 +1771,17 @@ class BaseFont(
         This will return a ``bool`` indicating if the font is
         compatible for interpolation with **other** and a
         :ref:`type-string` of compatibility notes.
+
+        If **failFast** is ``True``, the evaluation stops at the
+        first fatal error and the report will only contain the
+        notes found up to that point.
         """
-        return super(BaseFont, self).isCompatible(other, BaseFont)
+        failFast = normalizers.normalizeBoolean(failFast)
+        return super(BaseFont, self).isCompatible(
+            other, BaseFont, failFast=failFast
+        )
 
-    def _isCompatible(self, other, reporter):
+    def _isCompatible(self, other, reporter, failFast=False):
         """
         This is the environment implementation of
         :meth:`BaseFont.isCompatible`.
@@ -1519,13 +1821,16 @@ class BaseFont(
         for layerName in sorted(layers1.intersection(layers2)):
             layer1 = font1.getLayer(layerName)
             layer2 = font2.getLayer(layerName)
-            layerCompatibility = layer1.isCompatible(layer2)[1]
+            layerCompatibility = layer1.isCompatible(
+                layer2, failFast=failFast)[1]
             if layerCompatibility.fatal or layerCompatibility.warning:
                 if layerCompatibility.fatal:
                     reporter.fatal = True
                 if layerCompatibility.warning:
                     reporter.warning = True
                 reporter.layers.append(layerCompatibility)
+            if failFast and reporter.fatal:
+                break
 
     # -------
     # mapping
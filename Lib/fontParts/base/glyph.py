@@ -4,6 +4,7 @@ except ImportError:
     from itertools import izip_longest as zip_longest
 import collections
 import os
+import weakref
 from copy import deepcopy
 from fontParts.base.errors import FontPartsError
 from fontParts.base.base import (
@@ -11,14 +12,18 @@ from fontParts.base.base import (
     TransformationMixin,
     InterpolationMixin,
     SelectionMixin,
-    dynamicProperty,
-    interpolate
+    dynamicProperty
 )
 from fontParts.base import normalizers
+from fontParts.base.interpolation import _convertMaster, interpolateMathGlyph
 from fontParts.base.compatibility import GlyphCompatibilityReporter
 from fontParts.base.color import Color
 from fontParts.base.deprecated import DeprecatedGlyph, RemovedGlyph
 
+# The cached geometry of glyphs, keyed by the environment
+# object so that all of the wrappers of a glyph share it.
+_geometryCaches = weakref.WeakKeyDictionary()
+
 
 class BaseGlyph(BaseObject,
                 TransformationMixin,
@@ -370,9 +375,9 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_leftMargin(self):
-        value = self._get_leftMargin()
-        value = normalizers.normalizeGlyphLeftMargin(value)
-        return value
+        return self._getCachedGeometry(
+            "leftMargin", self._get_leftMargin, normalizers.normalizeGlyphLeftMargin
+        )
 
     def _set_base_leftMargin(self, value):
         value = normalizers.normalizeGlyphLeftMargin(value)
@@ -416,9 +421,9 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_rightMargin(self):
-        value = self._get_rightMargin()
-        value = normalizers.normalizeGlyphRightMargin(value)
-        return value
+        return self._getCachedGeometry(
+            "rightMargin", self._get_rightMargin, normalizers.normalizeGlyphRightMargin
+        )
 
     def _set_base_rightMargin(self, value):
         value = normalizers.normalizeGlyphRightMargin(value)
@@ -505,9 +510,9 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_bottomMargin(self):
-        value = self._get_bottomMargin()
-        value = normalizers.normalizeGlyphBottomMargin(value)
-        return value
+        return self._getCachedGeometry(
+            "bottomMargin", self._get_bottomMargin, normalizers.normalizeGlyphBottomMargin
+        )
 
     def _set_base_bottomMargin(self, value):
         value = normalizers.normalizeGlyphBottomMargin(value)
@@ -551,9 +556,9 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_topMargin(self):
-        value = self._get_topMargin()
-        value = normalizers.normalizeGlyphTopMargin(value)
-        return value
+        return self._getCachedGeometry(
+            "topMargin", self._get_topMargin, normalizers.normalizeGlyphTopMargin
+        )
 
     def _set_base_topMargin(self, value):
         value = normalizers.normalizeGlyphTopMargin(value)
@@ -927,6 +932,92 @@ class BaseGlyph(BaseObject,
         """
         self.raiseNotImplementedError()
 
+    # Coordinates
+
+    coordinates = dynamicProperty(
+        "base_coordinates",
+        """
+        The positions of all contour points in the glyph as
+        a NumPy array with the shape ``(n, 2)``.
+
+            >>> coordinates = glyph.coordinates
+            >>> glyph.coordinates = coordinates.round()
+
+        The points are ordered contour by contour, following
+        :attr:`BaseContour.coordinates`. When setting, the value
+        must contain one coordinate for every contour point.
+        Components, anchors and guidelines are not included.
+        This requires NumPy.
+        """
+    )
+
+    def _get_base_coordinates(self):
+        import numpy
+        value = self._get_coordinates()
+        value = [normalizers.normalizeCoordinateTuple(v) for v in value]
+        return numpy.array(value, dtype=float).reshape(-1, 2)
+
+    def _set_base_coordinates(self, value):
+        count = sum(contour._len__points() for contour in self.contours)
+        value = normalizers.normalizeCoordinateArray(value, count)
+        self._set_coordinates(value)
+
+    def _get_coordinates(self):
+        """
+        This must return a ``tuple`` of ``(x, y)`` tuples
+        for all contour points in the glyph.
+
+        Subclasses may override this method.
+        """
+        value = []
+        for contour in self.contours:
+            value.extend(contour._get_coordinates())
+        return tuple(value)
+
+    def _set_coordinates(self, value):
+        """
+        **value** will be a ``tuple`` containing one ``(x, y)``
+        tuple for each contour point in the glyph, normalized with
+        :func:`normalizers.normalizeCoordinateArray`.
+
+        Subclasses may override this method.
+        """
+        start = 0
+        for contour in self.contours:
+            end = start + contour._len__points()
+            contour._set_coordinates(value[start:end])
+            start = end
+
+    pointTypes = dynamicProperty(
+        "base_pointTypes",
+        """
+        The types of all contour points in the glyph as a NumPy
+        array of strings, parallel to :attr:`BaseGlyph.coordinates`.
+
+            >>> offCurves = glyph.coordinates[glyph.pointTypes == "offcurve"]
+
+        This attribute is read only and requires NumPy.
+        """
+    )
+
+    def _get_base_pointTypes(self):
+        import numpy
+        value = self._get_pointTypes()
+        value = [normalizers.normalizePointType(v) for v in value]
+        return numpy.array(value, dtype=str)
+
+    def _get_pointTypes(self):
+        """
+        This must return a ``tuple`` of point types
+        for all contour points in the glyph.
+
+        Subclasses may override this method.
+        """
+        value = []
+        for contour in self.contours:
+            value.extend(contour._get_pointTypes())
+        return tuple(value)
+
     # Components
 
     def _setGlyphInComponent(self, component):
@@ -1525,16 +1616,20 @@ class BaseGlyph(BaseObject,
 
     def _transformBy(self, matrix, **kwargs):
         """
+        The matrix has already been normalized, so it is
+        passed directly to the sub-objects' environment
+        implementations.
+
         Subclasses may override this method.
         """
         for contour in self.contours:
-            contour.transformBy(matrix)
+            contour._transformBy(matrix)
         for component in self.components:
-            component.transformBy(matrix)
+            component._transformBy(matrix)
         for anchor in self.anchors:
-            anchor.transformBy(matrix)
+            anchor._transformBy(matrix)
         for guideline in self.guidelines:
-            guideline.transformBy(matrix)
+            guideline._transformBy(matrix)
 
     def scaleBy(self, value, origin=None, width=False, height=False):
         """
@@ -1612,7 +1707,7 @@ class BaseGlyph(BaseObject,
                 color=guideline.color
             )
             mathGlyph.guidelines.append(d)
-        mathGlyph.lib = deepcopy(self.lib)
+        mathGlyph.lib = deepcopy(self.lib.asDict())
         mathGlyph.name = self.name
         mathGlyph.unicodes = self.unicodes
         mathGlyph.width = self.width
@@ -1642,34 +1737,35 @@ class BaseGlyph(BaseObject,
                 copyClass = self.__class__
             copied = copyClass()
         # populate
-        pen = copied.getPointPen()
-        mathGlyph.drawPoints(pen, filterRedundantPoints=True)
-        for anchor in mathGlyph.anchors:
-            a = copied.appendAnchor(
-                name=anchor["name"],
-                position=(anchor["x"], anchor["y"]),
-                color=anchor["color"]
-            )
-            identifier = anchor.get("identifier")
-            if identifier is not None:
-                a._setIdentifier(identifier)
-        for guideline in mathGlyph.guidelines:
-            g = copied.appendGuideline(
-                position=(guideline["x"], guideline["y"]),
-                angle=guideline["angle"],
-                name=guideline["name"],
-                color=guideline["color"]
-            )
-            identifier = guideline.get("identifier")
-            if identifier is not None:
-                g._setIdentifier(identifier)
-        copied.lib.update(mathGlyph.lib)
-        if not toThisGlyph:
-            copied.name = mathGlyph.name
-            copied.unicodes = mathGlyph.unicodes
-        copied.width = mathGlyph.width
-        copied.height = mathGlyph.height
-        copied.note = mathGlyph.note
+        with normalizers.trustedMode():
+            pen = copied.getPointPen()
+            mathGlyph.drawPoints(pen, filterRedundantPoints=True)
+            for anchor in mathGlyph.anchors:
+                a = copied.appendAnchor(
+                    name=anchor["name"],
+                    position=(anchor["x"], anchor["y"]),
+                    color=anchor["color"]
+                )
+                identifier = anchor.get("identifier")
+                if identifier is not None:
+                    a._setIdentifier(identifier)
+            for guideline in mathGlyph.guidelines:
+                g = copied.appendGuideline(
+                    position=(guideline["x"], guideline["y"]),
+                    angle=guideline["angle"],
+                    name=guideline["name"],
+                    color=guideline["color"]
+                )
+                identifier = guideline.get("identifier")
+                if identifier is not None:
+                    g._setIdentifier(identifier)
+            copied.lib.update(mathGlyph.lib)
+            if not toThisGlyph:
+                copied.name = mathGlyph.name
+                copied.unicodes = mathGlyph.unicodes
+            copied.width = mathGlyph.width
+            copied.height = mathGlyph.height
+            copied.note = mathGlyph.note
         return copied
 
     def __mul__(self, factor):
@@ -1763,23 +1859,14 @@ class BaseGlyph(BaseObject,
         """
         Subclasses may override this method.
         """
-        from fontMath.mathFunctions import setRoundIntegerFunction
-
-        setRoundIntegerFunction(normalizers.normalizeVisualRounding)
-
-        minGlyph = minGlyph._toMathGlyph()
-        maxGlyph = maxGlyph._toMathGlyph()
-        try:
-            result = interpolate(minGlyph, maxGlyph, factor)
-        except IndexError:
-            result = None
+        minGlyph = _convertMaster(minGlyph, "mathGlyph", minGlyph._toMathGlyph)
+        maxGlyph = _convertMaster(maxGlyph, "mathGlyph", maxGlyph._toMathGlyph)
+        result = interpolateMathGlyph(factor, minGlyph, maxGlyph, round=round)
         if result is None and not suppressError:
             raise FontPartsError(("Glyphs '%s' and '%s' could not be "
                                   "interpolated.")
                                  % (minGlyph.name, maxGlyph.name))
         if result is not None:
-            if round:
-                result = result.round()
             self._fromMathGlyph(result, toThisGlyph=True)
 
     compatibilityReporterClass = GlyphCompatibilityReporter
@@ -1818,6 +1905,9 @@ class BaseGlyph(BaseObject,
         """
         glyph1 = self
         glyph2 = other
+        # identical structure
+        if glyph1._getCompatibilityData() == glyph2._getCompatibilityData():
+            return
         # contour count
         if len(self.contours) != len(glyph2.contours):
             reporter.fatal = True
@@ -1921,6 +2011,39 @@ class BaseGlyph(BaseObject,
                     missing_from_glyph2.elements()
                 )
 
+    def _getCompatibilityData(self):
+        """
+        Return a picklable summary of the data that is evaluated
+        by :meth:`BaseGlyph.isCompatible`. If the summaries of
+        two glyphs are equal, :meth:`BaseGlyph.isCompatible`
+        must not report any fatal errors or warnings for them.
+        The summary is reused until the glyph changes.
+        """
+        return self._getCachedGeometry(
+            "compatibilityData", self._get_compatibilityData, None
+        )
+
+    def _get_compatibilityData(self):
+        """
+        Line and curve segments are treated as the same type
+        because they can be interpolated with each other.
+
+        Subclasses may override this method.
+        """
+        contours = tuple(
+            tuple(
+                "curve" if segment.type == "line" else segment.type
+                for segment in contour.segments
+            )
+            for contour in self.contours
+        )
+        components = tuple(
+            component.baseGlyph for component in self.components
+        )
+        anchors = tuple(anchor.name for anchor in self.anchors)
+        guidelines = tuple(guideline.name for guideline in self.guidelines)
+        return (contours, components, anchors, guidelines)
+
     # ------------
     # Data Queries
     # ------------
@@ -1947,7 +2070,7 @@ class BaseGlyph(BaseObject,
         return pen.getResult()
 
     bounds = dynamicProperty(
-        "bounds",
+        "base_bounds",
         """
         The bounds of the glyph in the form
         ``(x minimum, y minimum, x maximum, y maximum)`` or,
@@ -1959,10 +2082,7 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_bounds(self):
-        value = self._get_bounds()
-        if value is not None:
-            value = normalizers.normalizeBoundingBox(value)
-        return value
+        return self._getCachedGeometry("bounds", self._get_bounds, None)
 
     def _get_bounds(self):
         """
@@ -1974,7 +2094,7 @@ class BaseGlyph(BaseObject,
         return pen.bounds
 
     area = dynamicProperty(
-        "area",
+        "base_area",
         """
         The area of the glyph as a :ref:`type-int-float` or,
         in the case of empty glyphs ``None``.
@@ -1985,10 +2105,7 @@ class BaseGlyph(BaseObject,
     )
 
     def _get_base_area(self):
-        value = self._get_area()
-        if value is not None:
-            value = normalizers.normalizeArea(value)
-        return value
+        return self._getCachedGeometry("area", self._get_area, None)
 
     def _get_area(self):
         """
@@ -1999,6 +2116,47 @@ class BaseGlyph(BaseObject,
         self.draw(pen)
         return abs(pen.value)
 
+    _geometryCache = None
+
+    def _getCachedGeometry(self, key, getter, normalizer):
+        """
+        Return the value of **getter** normalized with
+        **normalizer**. ``None`` is not normalized and
+        **normalizer** may be ``None``. The values are
+        reused for as long as :meth:`BaseObject._getChangeToken`
+        returns the same token, also by other wrappers of
+        the same environment object. **key** identifies the
+        value in the cache.
+        """
+        token = self._getChangeToken()
+        if token is not None:
+            cache = self._getGeometryCache(token)
+            if key in cache:
+                return cache[key]
+        value = getter()
+        if value is not None and normalizer is not None:
+            value = normalizer(value)
+        if token is not None:
+            cache[key] = value
+        return value
+
+    def _getGeometryCache(self, token):
+        naked = self.naked()
+        try:
+            cache = _geometryCaches.get(naked)
+        except TypeError:
+            # The environment object can't be weakly referenced,
+            # so the cache is kept by this wrapper.
+            naked = None
+            cache = self._geometryCache
+        if cache is None or cache[0] != token:
+            cache = (token, {})
+            if naked is None:
+                self._geometryCache = cache
+            else:
+                _geometryCaches[naked] = cache
+        return cache[1]
+
     # -----------------
     # Layer Interaction
     # -----------------
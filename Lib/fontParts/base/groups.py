@@ -80,11 +80,80 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
 
         Subclasses may override this method.
         """
-        found = []
-        for key, groupList in self.items():
-            if glyphName in groupList:
-                found.append(key)
-        return found
+        glyphIndex, _ = self._getGlyphIndex()
+        return list(glyphIndex.get(glyphName, ()))
+
+    def _getGlyphIndex(self):
+        """
+        Return a ``tuple`` of a ``dict`` mapping glyph names to
+        the groups that contain them and a ``dict`` mapping group
+        names to their members. The index is kept up to date when
+        the groups are changed through this object and rebuilt
+        when they are changed in any other way.
+        """
+        return self._getCached("glyphIndex", self._makeGlyphIndex)
+
+    def _makeGlyphIndex(self):
+        glyphIndex = {}
+        members = {}
+        for groupName, glyphNames in self._items():
+            glyphNames = tuple(glyphNames)
+            members[groupName] = glyphNames
+            for glyphName in glyphNames:
+                glyphIndex.setdefault(glyphName, {})[groupName] = None
+        return glyphIndex, members
+
+    def _getCurrentGlyphIndex(self):
+        # Return the index if it is up to date, otherwise None.
+        token = self._getChangeToken()
+        cache = self._cache
+        if token is None or cache is None or cache[0] != token:
+            return None
+        return cache[1].get("glyphIndex")
+
+    def _reindexGroups(self, index, groupNames):
+        # Update an index that was up to date before the
+        # groups named **groupNames** were changed.
+        if index is None:
+            return
+        glyphIndex, members = index
+        for groupName in groupNames:
+            groupName = normalizers.normalizeGroupKey(groupName)
+            for glyphName in members.pop(groupName, ()):
+                found = glyphIndex[glyphName]
+                found.pop(groupName, None)
+                if not found:
+                    del glyphIndex[glyphName]
+            if self._contains(groupName):
+                glyphNames = tuple(self._getItem(groupName))
+                members[groupName] = glyphNames
+                for glyphName in glyphNames:
+                    glyphIndex.setdefault(glyphName, {})[groupName] = None
+        token = self._getChangeToken()
+        if token is None:
+            self._cache = None
+        else:
+            self._cache = (token, {"glyphIndex": index})
+
+    _cache = None
+
+    def _getCached(self, key, getter):
+        """
+        Return the value of **getter**. The value is reused
+        for as long as :meth:`BaseObject._getChangeToken`
+        returns the same token. **key** identifies the value
+        in the cache.
+        """
+        token = self._getChangeToken()
+        if token is None:
+            return getter()
+        cache = self._cache
+        if cache is None or cache[0] != token:
+            cache = (token, {})
+            self._cache = cache
+        if key not in cache[1]:
+            cache[1][key] = getter()
+        return cache[1][key]
 
     # --------------
     # Kerning Groups
@@ -105,13 +174,12 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
     )
 
     def _get_base_side1KerningGroups(self):
-        kerningGroups = self._get_side1KerningGroups()
-        normalized = {}
-        for name, members in kerningGroups.items():
-            name = normalizers.normalizeGroupKey(name)
-            members = normalizers.normalizeGroupValue(members)
-            normalized[name] = members
-        return normalized
+        kerningGroups = self._getCached(
+            "side1KerningGroups",
+            lambda: self._normalizeKerningGroups(
+                self._get_side1KerningGroups())
+        )
+        return dict(kerningGroups)
 
     def _get_side1KerningGroups(self):
         """
@@ -138,13 +206,12 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
     )
 
     def _get_base_side2KerningGroups(self):
-        kerningGroups = self._get_side2KerningGroups()
-        normalized = {}
-        for name, members in kerningGroups.items():
-            name = normalizers.normalizeGroupKey(name)
-            members = normalizers.normalizeGroupValue(members)
-            normalized[name] = members
-        return normalized
+        kerningGroups = self._getCached(
+            "side2KerningGroups",
+            lambda: self._normalizeKerningGroups(
+                self._get_side2KerningGroups())
+        )
+        return dict(kerningGroups)
 
     def _get_side2KerningGroups(self):
         """
@@ -156,6 +223,36 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
                 found[name] = contents
         return found
 
+    @staticmethod
+    def _normalizeKerningGroups(kerningGroups):
+        normalized = {}
+        for name, members in kerningGroups.items():
+            name = normalizers.normalizeGroupKey(name)
+            members = normalizers.normalizeGroupValue(members)
+            normalized[name] = members
+        return normalized
+
+    def _getKerningGroupIndex(self):
+        """
+        Return a ``tuple`` of two ``dict``\s mapping glyph names
+        to the side 1 and side 2 kerning group they belong to.
+        The index is reused for as long as
+        :meth:`BaseObject._getChangeToken` returns the same
+        token.
+
+        Subclasses may override this method.
+        """
+        return self._getCached("kerningGroupIndex", self._makeKerningGroupIndex)
+
+    def _makeKerningGroupIndex(self):
+        index = ({}, {})
+        for side, prefix in enumerate(("public.kern1.", "public.kern2.")):
+            for name, contents in self.items():
+                if name.startswith(prefix):
+                    for glyphName in contents:
+                        index[side][glyphName] = name
+        return index
+
     # ---------------------
     # RoboFab Compatibility
     # ---------------------
@@ -204,7 +301,9 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
 
             >>> del font.groups["myGroup"]
         """
+        index = self._getCurrentGlyphIndex()
         super(BaseGroups, self).__delitem__(groupName)
+        self._reindexGroups(index, [groupName])
 
     def __getitem__(self, groupName):
         """
@@ -256,7 +355,9 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
 
             >>> font.groups["myGroup"] = ["A", "B", "C"]
         """
+        index = self._getCurrentGlyphIndex()
         super(BaseGroups, self).__setitem__(groupName, glyphNames)
+        self._reindexGroups(index, [groupName])
 
     def clear(self):
         """
@@ -265,7 +366,11 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
 
             >>> font.groups.clear()
         """
+        index = self._getCurrentGlyphIndex()
         super(BaseGroups, self).clear()
+        if index is not None:
+            index = ({}, {})
+        self._reindexGroups(index, [])
 
     def get(self, groupName, default=None):
         """
@@ -320,7 +425,10 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
             >>> font.groups.pop("myGroup")
             ("A", "B", "C")
         """
-        return super(BaseGroups, self).pop(groupName, default)
+        index = self._getCurrentGlyphIndex()
+        value = super(BaseGroups, self).pop(groupName, default)
+        self._reindexGroups(index, [groupName])
+        return value
 
     def update(self, otherGroups):
         """
@@ -333,7 +441,9 @@ class BaseGroups(BaseDict, DeprecatedGroups, RemovedGroups):
 
             >>> font.groups.update(newGroups)
         """
+        index = self._getCurrentGlyphIndex()
         super(BaseGroups, self).update(otherGroups)
+        self._reindexGroups(index, list(otherGroups.keys()))
 
     def values(self):
         """
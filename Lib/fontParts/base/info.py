@@ -6,6 +6,7 @@ from fontParts.base.base import (
 )
 from fontParts.base import normalizers
 from fontParts.base.errors import FontPartsError
+from fontParts.base.interpolation import _convertMaster
 from fontParts.base.deprecated import DeprecatedInfo, RemovedInfo
 
 
@@ -297,8 +298,8 @@ class BaseInfo(BaseObject, DeprecatedInfo, RemovedInfo):
 
         setRoundIntegerFunction(normalizers.normalizeVisualRounding)
 
-        minInfo = minInfo._toMathInfo()
-        maxInfo = maxInfo._toMathInfo()
+        minInfo = _convertMaster(minInfo, "mathInfo", minInfo._toMathInfo)
+        maxInfo = _convertMaster(maxInfo, "mathInfo", maxInfo._toMathInfo)
         result = interpolate(minInfo, maxInfo, factor)
         if result is None and not suppressError:
             raise FontPartsError(("Info from font '%s' and font '%s' could not be "
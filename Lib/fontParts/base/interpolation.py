@@ -0,0 +1,96 @@
+"""
+Interpolation of glyph data outside of the environment.
+
+The environment objects are converted to objects following the
+`MathGlyph protocol <https://github.com/typesupply/fontMath>`_
+before they are given to the functions in this module.
+"""
+import contextvars
+from fontParts.base.base import interpolate
+from fontParts.base import normalizers
+
+# The conversions of the masters of the InterpolationSession
+# that is interpolating, or None.
+_masterConversions = contextvars.ContextVar("masterConversions",
+                                            default=None)
+
+
+def interpolateMathGlyph(factor, minMathGlyph, maxMathGlyph, round=True):
+    """
+    Interpolate **minMathGlyph** and **maxMathGlyph** at **factor**
+    and return the resulting math glyph. If **round** is ``True``
+    the result will be rounded. ``None`` is returned if the glyphs
+    can not be interpolated.
+    """
+    from fontMath.mathFunctions import setRoundIntegerFunction
+
+    setRoundIntegerFunction(normalizers.normalizeVisualRounding)
+
+    try:
+        result = interpolate(minMathGlyph, maxMathGlyph, factor)
+    except IndexError:
+        result = None
+    if result is not None and round:
+        result = result.round()
+    return result
+
+
+def _convertMaster(master, key, convert):
+    """
+    Return the result of **convert** for **master**. While an
+    :class:`InterpolationSession` is interpolating, the result
+    is stored under **key** and the naked object of **master**
+    and reused the next time the same master is converted.
+    """
+    conversions = _masterConversions.get()
+    if conversions is None:
+        return convert()
+    naked = master.naked()
+    cacheKey = (key, id(naked))
+    if cacheKey not in conversions:
+        # The naked object is kept so that its id can not be reused.
+        conversions[cacheKey] = (naked, convert())
+    return conversions[cacheKey][1]
+
+
+class InterpolationSession(object):
+
+    """
+    An object that interpolates any number of fonts between
+    **minFont** and **maxFont**. The glyphs, kerning and info
+    of the masters are converted the first time they are
+    needed and the conversions are reused for every following
+    instance.
+
+        >>> session = InterpolationSession(light, bold)
+        >>> for factor, font in zip(factors, fonts):
+        ...     session.interpolate(factor, font)
+
+    The fonts are interpolated with :meth:`BaseFont.interpolate`,
+    so the result is the same. The masters must not be changed
+    while the session is used.
+    """
+
+    def __init__(self, minFont, maxFont):
+        from fontParts.base.font import BaseFont
+
+        for font in (minFont, maxFont):
+            if not isinstance(font, BaseFont):
+                raise TypeError("Interpolation masters must be fonts, not %r."
+                                % font.__class__.__name__)
+        self.minFont = minFont
+        self.maxFont = maxFont
+        self._conversions = {}
+
+    def interpolate(self, factor, font, round=True, suppressError=True):
+        """
+        Replace the contents of **font** with the interpolation
+        of the masters at **factor**. **factor**, **round** and
+        **suppressError** are the same as in :meth:`BaseFont.interpolate`.
+        """
+        token = _masterConversions.set(self._conversions)
+        try:
+            font.interpolate(factor, self.minFont, self.maxFont,
+                             round=round, suppressError=suppressError)
+        finally:
+            _masterConversions.reset(token)
@@ -1,13 +1,215 @@
+import collections
+import importlib.util
+import math
 from fontParts.base.base import (
     BaseDict,
     dynamicProperty,
-    interpolate,
     reference
 )
 from fontParts.base import normalizers
+from fontParts.base.interpolation import _convertMaster
 from fontParts.base.deprecated import DeprecatedKerning, RemovedKerning
 
 
+_notFound = object()
+
+# The number of resolved pairs that BaseKerning.find and
+# BaseKerning.findMany keep between calls.
+_findCacheSize = 4096
+
+
+class KerningMatrix(object):
+
+    """
+    A matrix view of kerning. This object is normally created
+    with :meth:`BaseKerning.asMatrix`. This requires NumPy.
+
+    * **side1Groups** and **side2Groups** are ``tuple``\s of the
+      kerning group names used on each side of the pairs.
+    * **groupValues** is a NumPy array of floats with the shape
+      ``(len(side1Groups), len(side2Groups))`` holding the value
+      of each side 1 group and side 2 group pair. Pairs that are
+      not defined are NaN.
+    * **exceptionPairs** is a ``tuple`` of the pairs that have a
+      glyph on one or both sides.
+    * **exceptionValues** is a NumPy array of floats with the
+      values of **exceptionPairs**.
+
+    :meth:`KerningMatrix.scaleBy` and :meth:`KerningMatrix.round`
+    are array operations that don't touch the kerning. Use
+    :meth:`BaseKerning.fromMatrix` to write the result back.
+    """
+
+    def __init__(self, side1Groups=(), side2Groups=(), groupValues=None,
+                 exceptionPairs=(), exceptionValues=None):
+        import numpy
+        self.side1Groups = tuple(side1Groups)
+        self.side2Groups = tuple(side2Groups)
+        shape = (len(self.side1Groups), len(self.side2Groups))
+        if groupValues is None:
+            groupValues = numpy.full(shape, numpy.nan)
+        groupValues = numpy.array(groupValues, dtype=float)
+        if groupValues.size != shape[0] * shape[1]:
+            raise ValueError("The group values must have one value for "
+                             "each side 1 and side 2 group pair.")
+        self.groupValues = groupValues.reshape(shape)
+        self.exceptionPairs = tuple(exceptionPairs)
+        if exceptionValues is None:
+            exceptionValues = numpy.zeros(len(self.exceptionPairs))
+        self.exceptionValues = numpy.array(exceptionValues, dtype=float)
+        if self.exceptionValues.shape != (len(self.exceptionPairs),):
+            raise ValueError("The exception values must have one value for "
+                             "each exception pair.")
+
+    @classmethod
+    def fromItems(cls, items):
+        """
+        Create a matrix from an iterable of ``(pair, value)`` items.
+        """
+        import numpy
+        groupPairs = []
+        groupValues = []
+        exceptionPairs = []
+        exceptionValues = []
+        for pair, value in items:
+            side1, side2 = pair
+            if side1.startswith("public.kern1.") \
+                    and side2.startswith("public.kern2."):
+                groupPairs.append(pair)
+                groupValues.append(value)
+            else:
+                exceptionPairs.append(pair)
+                exceptionValues.append(value)
+        side1Groups = sorted(set(side1 for side1, _ in groupPairs))
+        side2Groups = sorted(set(side2 for _, side2 in groupPairs))
+        side1Indexes = {name: index for index, name in enumerate(side1Groups)}
+        side2Indexes = {name: index for index, name in enumerate(side2Groups)}
+        values = numpy.full((len(side1Groups), len(side2Groups)), numpy.nan)
+        if groupPairs:
+            rows = [side1Indexes[side1] for side1, _ in groupPairs]
+            columns = [side2Indexes[side2] for _, side2 in groupPairs]
+            values[rows, columns] = groupValues
+        return cls(side1Groups, side2Groups, values,
+                   exceptionPairs, exceptionValues)
+
+    def __len__(self):
+        import numpy
+        defined = numpy.count_nonzero(~numpy.isnan(self.groupValues))
+        return int(defined) + len(self.exceptionValues)
+
+    def items(self):
+        """
+        Iterate over the ``(pair, value)`` items of the matrix.
+        Values without a fraction are given as ``int``\s.
+        """
+        import numpy
+        rows, columns = numpy.nonzero(~numpy.isnan(self.groupValues))
+        values = self.groupValues[rows, columns]
+        for row, column, value in zip(rows.tolist(), columns.tolist(),
+                                      values.tolist()):
+            pair = (self.side1Groups[row], self.side2Groups[column])
+            yield pair, _intIfIntegral(value)
+        for pair, value in zip(self.exceptionPairs,
+                               self.exceptionValues.tolist()):
+            yield pair, _intIfIntegral(value)
+
+    def copy(self):
+        """
+        Return a copy of the matrix.
+        """
+        return self.__class__(self.side1Groups, self.side2Groups,
+                              self.groupValues, self.exceptionPairs,
+                              self.exceptionValues)
+
+    def scaleBy(self, factor):
+        """
+        Multiply all values by **factor**.
+        """
+        self.groupValues = self.groupValues * factor
+        self.exceptionValues = self.exceptionValues * factor
+
+    def round(self, multiple=1):
+        """
+        Round all values to increments of **multiple**.
+        """
+        import numpy
+
+        # This rounds halves up, as normalizeVisualRounding does.
+        def roundValues(values):
+            return numpy.floor(values / float(multiple) + 0.5) * multiple
+
+        self.groupValues = roundValues(self.groupValues)
+        self.exceptionValues = roundValues(self.exceptionValues)
+
+
+def _hasNumPy():
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _kerningGroups(groups):
+    return {
+        name: list(members) for name, members in groups.items()
+        if name.startswith(("public.kern1.", "public.kern2."))
+    }
+
+
+def _interpolateKerning(factor, minPairs, maxPairs, groupIndex):
+    # This gives the same result as interpolating fontMath
+    # MathKerning objects, including the removal of pairs
+    # with a value of 0 that are not exceptions, in one pass.
+    glyphToFirstGroup, glyphToSecondGroup = groupIndex
+
+    def lookup(kerning, pair):
+        if pair in kerning:
+            return kerning[pair]
+        side1, side2 = pair
+        if side1.startswith("public.kern1."):
+            side1Group = side1
+            side1 = None
+        else:
+            side1Group = glyphToFirstGroup.get(side1)
+        if side2.startswith("public.kern2."):
+            side2Group = side2
+            side2 = None
+        else:
+            side2Group = glyphToSecondGroup.get(side2)
+        for candidate in ((side1Group, side2), (side1, side2Group),
+                          (side1Group, side2Group)):
+            if candidate in kerning:
+                return kerning[candidate]
+        return 0
+
+    def isException(pair):
+        side1, side2 = pair
+        if not side1.startswith("public.kern1.") \
+                and side1 in glyphToFirstGroup:
+            return True
+        if not side2.startswith("public.kern2.") \
+                and side2 in glyphToSecondGroup:
+            return True
+        return False
+
+    differences = {}
+    for pair in set(minPairs) | set(maxPairs):
+        difference = (lookup(maxPairs, pair) - lookup(minPairs, pair)) * factor
+        if difference or isException(pair):
+            differences[pair] = difference
+    kerning = {}
+    for pair in set(minPairs) | set(differences):
+        value = lookup(minPairs, pair) + differences.get(pair, 0)
+        if value or isException(pair):
+            if int(value) == value:
+                value = int(value)
+            kerning[pair] = value
+    return kerning
+
+
+def _intIfIntegral(value):
+    if value.is_integer():
+        return int(value)
+    return value
+
+
 class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
 
     """
@@ -81,10 +283,16 @@ class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
 
         Subclasses may override this method.
         """
-        factor = factor[0]
-        for k, v in self.items():
-            v *= factor
-            self[k] = v
+        if not _hasNumPy():
+            factor = factor[0]
+            for k, v in self.items():
+                v *= factor
+                self[k] = v
+            return
+        with normalizers.trustedMode():
+            matrix = self.asMatrix()
+            matrix.scaleBy(factor[0])
+            self.fromMatrix(matrix)
 
     # -------------
     # Normalization
@@ -109,10 +317,85 @@ class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
 
         Subclasses may override this method.
         """
-        for pair, value in self.items():
-            value = int(normalizers.normalizeVisualRounding(
-                        value / float(multiple))) * multiple
-            self[pair] = value
+        if not _hasNumPy():
+            for pair, value in self.items():
+                value = int(normalizers.normalizeVisualRounding(
+                            value / float(multiple))) * multiple
+                self[pair] = value
+            return
+        with normalizers.trustedMode():
+            matrix = self.asMatrix()
+            matrix.round(multiple)
+            self.fromMatrix(matrix)
+
+    # ------
+    # Matrix
+    # ------
+
+    def asMatrix(self):
+        """
+        Return the kerning as a :class:`KerningMatrix`. ::
+
+            >>> matrix = font.kerning.asMatrix()
+            >>> matrix.scaleBy(0.5)
+            >>> font.kerning.fromMatrix(matrix)
+
+        The matrix is a copy. Changes to it are not reflected in
+        the kerning until it is written back with
+        :meth:`BaseKerning.fromMatrix`. This requires NumPy.
+        """
+        return self._asMatrix()
+
+    def _asMatrix(self):
+        """
+        This is the environment implementation of
+        :meth:`BaseKerning.asMatrix`.
+
+        Subclasses may override this method.
+        """
+        return KerningMatrix.fromItems(self.items())
+
+    def fromMatrix(self, matrix):
+        """
+        Replace the kerning with the pairs in **matrix**, a
+        :class:`KerningMatrix`.
+
+            >>> font.kerning.fromMatrix(matrix)
+        """
+        if not isinstance(matrix, KerningMatrix):
+            raise TypeError("Kerning can not be set from an instance of %r."
+                            % matrix.__class__.__name__)
+        self._fromMatrix(matrix)
+
+    def _fromMatrix(self, matrix):
+        """
+        This is the environment implementation of
+        :meth:`BaseKerning.fromMatrix`. **matrix** will be
+        a :class:`KerningMatrix`.
+
+        Subclasses may override this method.
+        """
+        kerning = {}
+        for pair, value in matrix.items():
+            pair = normalizers.normalizeKerningKey(pair)
+            kerning[pair] = normalizers.normalizeKerningValue(value)
+        self._replace(kerning)
+
+    def _replace(self, kerning):
+        """
+        Replace all pairs with the pairs in **kerning**, a ``dict``
+        of normalized pairs and values, in as few changes to the
+        environment as possible.
+
+        Subclasses may override this method.
+        """
+        current = dict(self._items())
+        for pair in current:
+            if pair not in kerning:
+                self._delItem(pair)
+        for pair, value in kerning.items():
+            if current.get(pair, _notFound) != value:
+                self._setItem(pair, value)
 
     # -------------
     # Interpolation
@@ -169,10 +452,6 @@ class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
 
         Subclasses may override this method.
         """
-        import fontMath
-        from fontMath.mathFunctions import setRoundIntegerFunction
-
-        setRoundIntegerFunction(normalizers.normalizeVisualRounding)
         kerningGroupCompatibility = self._testKerningGroupCompatibility(
                                                         minKerning,
                                                         maxKerning,
@@ -180,16 +459,40 @@ class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
                                                         )
         if not kerningGroupCompatibility:
             self.clear()
+            return
+        minPairs, minGroups = _convertMaster(
+            minKerning, "kerning", minKerning._getInterpolationData)
+        maxPairs, maxGroups = _convertMaster(
+            maxKerning, "kerning", maxKerning._getInterpolationData)
+        kerning = _interpolateKerning(
+            factor[0], minPairs, maxPairs,
+            minKerning.font.groups._getKerningGroupIndex()
+        )
+        if round:
+            from fontMath.mathFunctions import round2
+            kerning = {
+                pair: int(round2(value)) for pair, value in kerning.items()
+            }
+        if minGroups == maxGroups or not minGroups or not maxGroups:
+            groups = minGroups or maxGroups
         else:
-            minKerning = fontMath.MathKerning(
-                kerning=minKerning, groups=minKerning.font.groups)
-            maxKerning = fontMath.MathKerning(
-                kerning=maxKerning, groups=maxKerning.font.groups)
-            result = interpolate(minKerning, maxKerning, factor)
-            if round:
-                result.round()
-            self.clear()
-            result.extractKerning(self.font)
+            groups = {
+                name: sorted(set(minGroups.get(name, ()))
+                             | set(maxGroups.get(name, ())))
+                for name in set(minGroups) | set(maxGroups)
+            }
+        self._replace(kerning)
+        self.font.groups.update(groups)
+
+    def _getInterpolationData(self):
+        """
+        Get the pairs and the kerning groups that are interpolated
+        by :meth:`BaseKerning._interpolate`.
+
+        Subclasses may override this method.
+        """
+        with normalizers.trustedMode():
+            return dict(self.items()), _kerningGroups(self.font.groups)
 
     @staticmethod
     def _testKerningGroupCompatibility(minKerning, maxKerning, suppressError=False):
@@ -362,21 +665,83 @@ class BaseKerning(BaseDict, DeprecatedKerning, RemovedKerning):
             -25
         """
         pair = normalizers.normalizeKerningKey(pair)
-        value = self._find(pair, default)
-        if value != default:
-            value = normalizers.normalizeKerningValue(value)
-        return value
+        return self._findPairs([pair], default)[0]
+
+    def findMany(self, pairs, default=None):
+        """
+        Returns a ``list`` with the value of each pair in **pairs**,
+        found the same way as :meth:`BaseKerning.find`. Pairs
+        that are not found are returned as **default**. ::
+
+            >>> font.kerning.findMany([("A", "V"), ("A", "A")])
+            [-25, None]
+        """
+        pairs = [normalizers.normalizeKerningKey(pair) for pair in pairs]
+        return self._findPairs(pairs, default)
+
+    _findCache = None
+
+    def _findPairs(self, pairs, default):
+        # Resolved values are reused for as long as the
+        # change token of the kerning is the same. The least
+        # recently used pairs are dropped when the cache is full.
+        token = self._getChangeToken()
+        cache = self._findCache
+        if token is None:
+            found = collections.OrderedDict()
+        elif cache is not None and cache[0] == token:
+            found = cache[1]
+        else:
+            found = collections.OrderedDict()
+            self._findCache = (token, found)
+        values = []
+        for pair in pairs:
+            if pair in found:
+                value = found[pair]
+                found.move_to_end(pair)
+            else:
+                value = self._find(pair, _notFound)
+                if value is not _notFound:
+                    value = normalizers.normalizeKerningValue(value)
+                found[pair] = value
+                if len(found) > _findCacheSize:
+                    found.popitem(last=False)
+            if value is _notFound:
+                value = default
+            values.append(value)
+        return values
 
     def _find(self, pair, default=None):
         """
         This is the environment implementation of
         :attr:`BaseKerning.find`. This must return an
         :ref:`type-int-float` or `default`.
+
+        Subclasses may override this method.
         """
-        from fontTools.ufoLib.kerning import lookupKerningValue
-        font = self.font
-        groups = font.groups
-        return lookupKerningValue(pair, self, groups, fallback=default)
+        groups = self.font.groups
+        glyphToFirstGroup, glyphToSecondGroup = groups._getKerningGroupIndex()
+        first, second = pair
+        if first.startswith("public.kern1."):
+            firstGroup = first
+        else:
+            firstGroup = glyphToFirstGroup.get(first)
+        if second.startswith("public.kern2."):
+            secondGroup = second
+        else:
+            secondGroup = glyphToSecondGroup.get(second)
+        candidates = (
+            (first, second),
+            (first, secondGroup),
+            (firstGroup, second),
+            (firstGroup, secondGroup)
+        )
+        for candidate in candidates:
+            if None in candidate:
+                continue
+            if self._contains(candidate):
+                return self._getItem(candidate)
+        return default
 
     def items(self):
         """
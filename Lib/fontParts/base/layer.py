@@ -2,6 +2,7 @@ from fontParts.base.base import (
     BaseObject,
     InterpolationMixin,
     SelectionMixin,
+    TransformationMixin,
     dynamicProperty,
     reference
 )
@@ -366,7 +367,8 @@ class _BaseGlyphVendor(
     has_key = __contains__
 
 
-class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLayer):
+class BaseLayer(_BaseGlyphVendor, TransformationMixin, InterpolationMixin,
+                DeprecatedLayer, RemovedLayer):
 
     def _reprContents(self):
         contents = [
@@ -648,6 +650,27 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
         for glyph in self:
             glyph.autoUnicodes()
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def _transformBy(self, matrix, **kwargs):
+        """
+        This is the environment implementation of
+        :meth:`BaseLayer.transformBy`.
+
+        **matrix** will be a :ref:`type-transformation`
+        that has been normalized with
+        :func:`normalizers.normalizeTransformationMatrix`.
+        This applies the matrix to the contours, components,
+        anchors and guidelines of all glyphs in the layer.
+        Glyph widths and heights are not changed.
+
+        Subclasses may override this method.
+        """
+        for glyph in self:
+            glyph._transformBy(matrix)
+
     # -------------
     # Interpolation
     # -------------
@@ -706,7 +729,7 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
 
     compatibilityReporterClass = LayerCompatibilityReporter
 
-    def isCompatible(self, other):
+    def isCompatible(self, other, failFast=False):
         """
         Evaluate interpolation compatibility with **other**. ::
 
@@ -721,10 +744,17 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
         This will return a ``bool`` indicating if the layer is
         compatible for interpolation with **other** and a
         :ref:`type-string` of compatibility notes.
+
+        If **failFast** is ``True``, the evaluation stops at the
+        first fatal error and the report will only contain the
+        notes found up to that point.
         """
-        return super(BaseLayer, self).isCompatible(other, BaseLayer)
+        failFast = normalizers.normalizeBoolean(failFast)
+        return super(BaseLayer, self).isCompatible(
+            other, BaseLayer, failFast=failFast
+        )
 
-    def _isCompatible(self, other, reporter):
+    def _isCompatible(self, other, reporter, failFast=False):
         """
         This is the environment implementation of
         :meth:`BaseLayer.isCompatible`.
@@ -747,7 +777,8 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
             reporter.warning = True
             reporter.glyphsMissingInLayer1 = list(glyphs2.difference(glyphs1))
         # test glyphs
-        for glyphName in sorted(glyphs1.intersection(glyphs2)):
+        glyphNames = sorted(glyphs1.intersection(glyphs2))
+        for glyphName in glyphNames:
             glyph1 = layer1[glyphName]
             glyph2 = layer2[glyphName]
             glyphCompatibility = glyph1.isCompatible(glyph2)[1]
@@ -757,6 +788,130 @@ class BaseLayer(_BaseGlyphVendor, InterpolationMixin, DeprecatedLayer, RemovedLa
                 if glyphCompatibility.warning:
                     reporter.warning = True
                 reporter.glyphs.append(glyphCompatibility)
+            if failFast and reporter.fatal:
+                break
+
+    # ----
+    # GLIF
+    # ----
+
+    def dumpToGLIFs(self, glyphNames=None, glyphFormatVersion=2, workers=None):
+        """
+        Return a ``dict`` mapping the names in **glyphNames**
+        to the glyphs' contents as strings in
+        `GLIF format <http://unifiedfontobject.org/versions/ufo3/glyphs/glif/>`_.
+
+            >>> glifs = layer.dumpToGLIFs(["A", "B"], workers=4)
+
+        If **glyphNames** is ``None``, all glyphs are dumped.
+        **glyphFormatVersion** is the same as in
+        :meth:`BaseGlyph.dumpToGLIF`. **workers** is the number
+        of processes the environment may use. To avoid holding
+        all of the strings at once, use :meth:`BaseLayer.iterDumpToGLIFs`.
+        """
+        return dict(self.iterDumpToGLIFs(glyphNames, glyphFormatVersion,
+                                         workers))
+
+    def iterDumpToGLIFs(self, glyphNames=None, glyphFormatVersion=2,
+                        workers=None):
+        """
+        Iterate over ``(glyphName, glifData)`` pairs for the
+        names in **glyphNames**, in order.
+
+            >>> for glyphName, glifData in layer.iterDumpToGLIFs(workers=4):
+            ...     send(glyphName, glifData)
+
+        The arguments are the same as in :meth:`BaseLayer.dumpToGLIFs`.
+        The glyphs are dumped in batches as the pairs are
+        consumed, so only a limited number of strings exist
+        at any time.
+        """
+        if glyphNames is None:
+            glyphNames = self.keys()
+        glyphNames = [normalizers.normalizeGlyphName(glyphName)
+                      for glyphName in glyphNames]
+        for glyphName in glyphNames:
+            if glyphName not in self:
+                raise KeyError("No glyph named '%s'." % glyphName)
+        glyphFormatVersion = normalizers.normalizeGlyphFormatVersion(
+            glyphFormatVersion)
+        workers = normalizers.normalizeWorkers(workers)
+        return self._iterDumpToGLIFs(glyphNames, glyphFormatVersion, workers)
+
+    def _iterDumpToGLIFs(self, glyphNames, glyphFormatVersion, workers=None):
+        """
+        This is the environment implementation of
+        :meth:`BaseLayer.iterDumpToGLIFs`. **glyphNames**
+        will be a ``list`` of normalized names of glyphs
+        in the layer. **glyphFormatVersion** will have been
+        normalized with :func:`normalizers.normalizeGlyphFormatVersion`.
+        **workers** will be ``None`` or an ``int`` greater
+        than 0. This must return an iterator.
+
+        Subclasses may override this method.
+        """
+        for glyphName in glyphNames:
+            yield glyphName, self[glyphName].dumpToGLIF(glyphFormatVersion)
+
+    def loadFromGLIFs(self, glifs, workers=None):
+        """
+        Read **glifs**, a mapping of glyph names to strings in
+        `GLIF format <http://unifiedfontobject.org/versions/ufo3/glyphs/glif/>`_,
+        into new glyphs in this layer. Existing glyphs with the
+        same names are replaced.
+
+            >>> layer.loadFromGLIFs({"A": glifA, "B": glifB}, workers=4)
+            >>> layer.loadFromGLIFs(otherLayer.iterDumpToGLIFs())
+
+        **glifs** may also be an iterable of ``(glyphName, glifData)``
+        pairs. The glyphs are given the names they are paired with,
+        not the names in the GLIF data. **workers** is the number of
+        processes the environment may use.
+
+        All of the data is read before any glyph is replaced. If
+        the data for any glyph is not valid, an error is raised
+        and the layer is left unchanged.
+        """
+        if hasattr(glifs, "items"):
+            glifs = glifs.items()
+        workers = normalizers.normalizeWorkers(workers)
+        glifs = (
+            (normalizers.normalizeGlyphName(glyphName), glifData)
+            for glyphName, glifData in glifs
+        )
+        self._loadFromGLIFs(glifs, workers)
+
+    def _loadFromGLIFs(self, glifs, workers=None):
+        """
+        This is the environment implementation of
+        :meth:`BaseLayer.loadFromGLIFs`. **glifs** will be an
+        iterator of ``(glyphName, glifData)`` pairs with normalized
+        glyph names. **workers** will be ``None`` or an ``int``
+        greater than 0.
+
+        Subclasses may override this method.
+        """
+        created = []
+        loaded = []
+        try:
+            for glyphName, glifData in glifs:
+                if glyphName not in self:
+                    created.append(glyphName)
+                glyph = self.newGlyph(glyphName, clear=False)
+                copyClass = glyph.copyClass
+                if copyClass is None:
+                    copyClass = glyph.__class__
+                copied = copyClass()
+                copied.loadFromGLIF(glifData)
+                copied.name = glyphName
+                loaded.append(copied)
+        except Exception:
+            for glyphName in created:
+                self.removeGlyph(glyphName)
+            raise
+        with self.holdChanges():
+            for glyph in loaded:
+                self[glyph.name] = glyph
 
     # -------
     # mapping
@@ -1,8 +1,45 @@
 # -*- coding: utf8 -*-
 
+import contextvars
 from collections import Counter
+from contextlib import contextmanager
 from fontTools.misc.fixedTools import otRound
 
+# ------------
+# Trusted Mode
+# ------------
+
+_trustedMode = contextvars.ContextVar("trustedMode", default=False)
+
+
+@contextmanager
+def trustedMode():
+    """
+    Skip validation for data that fontParts produced itself.
+
+        >>> with normalizers.trustedMode():
+        ...     glyph.fromMathGlyph(mathGlyph)
+
+    Inside this context, the normalizers that walk through their
+    input (kerning keys, group values, lib values, identifiers and
+    coordinate tuples) only convert the value to the type they
+    return. Invalid values will not raise an error, so this must
+    only be used for values that are known to be valid. The mode
+    is tracked per thread and per asyncio task.
+    """
+    token = _trustedMode.set(True)
+    try:
+        yield
+    finally:
+        _trustedMode.reset(token)
+
+
+def isTrustedMode():
+    """
+    Return a ``bool`` indicating if :func:`trustedMode` is active.
+    """
+    return _trustedMode.get()
+
 # ----
 # Font
 # ----
@@ -117,6 +154,8 @@ def normalizeKerningKey(value):
     * Returned value will be a two member ``tuple`` of unencoded
       ``unicode`` strings.
     """
+    if _trustedMode.get():
+        return tuple(value)
     if not isinstance(value, (tuple, list)):
         raise TypeError("Kerning key must be a tuple instance, not %s."
                         % type(value).__name__)
@@ -182,6 +221,8 @@ def normalizeGroupValue(value):
       :func:`normalizeGlyphName`.
     * Returned value will be a ``tuple`` of unencoded ``unicode`` strings.
     """
+    if _trustedMode.get():
+        return tuple(value)
     if not isinstance(value, (tuple, list)):
         raise TypeError("Group value must be a list, not %s."
                         % type(value).__name__)
@@ -233,6 +274,8 @@ def normalizeLibValue(value):
     * **value** must not be ``None``.
     * Returned value is the same type as the input value.
     """
+    if _trustedMode.get():
+        return value
     if value is None:
         raise ValueError("Lib value must not be None.")
     if isinstance(value, (list, tuple)):
@@ -769,6 +812,8 @@ def normalizeIdentifier(value):
     * **value** must not contain a character out the range of 0x20 - 0x7E.
     * Returned value is an unencoded ``unicode`` string.
     """
+    if _trustedMode.get():
+        return value
     if value is None:
         return value
     if not isinstance(value, str):
@@ -828,6 +873,8 @@ def normalizeCoordinateTuple(value):
     * Returned value is a ``tuple`` of two values of the same type as
       the input values.
     """
+    if _trustedMode.get():
+        return tuple(value)
     if not isinstance(value, (tuple, list)):
         raise TypeError("Coordinates must be tuple instances, not %s."
                         % type(value).__name__)
@@ -840,6 +887,40 @@ def normalizeCoordinateTuple(value):
     return (x, y)
 
 
+def normalizeCoordinateArray(value, count=None):
+    """
+    Normalizes an array of coordinates.
+
+    * **value** must be convertible to a NumPy array with
+      the shape ``(n, 2)``.
+    * **value** items must be finite :ref:`type-int-float`.
+    * If **count** is not ``None``, **value** must contain
+      exactly **count** coordinates.
+    * Returned value will be a ``tuple`` of ``(x, y)`` tuples.
+      Whole numbers will be ``int``.
+    """
+    import numpy
+    try:
+        array = numpy.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        raise TypeError("Coordinate arrays must contain numbers, not %s."
+                        % type(value).__name__)
+    if array.size == 0:
+        array = array.reshape(0, 2)
+    if array.ndim != 2 or array.shape[1] != 2:
+        raise ValueError("Coordinate arrays must have the shape (n, 2), "
+                         "not %r." % (array.shape,))
+    if count is not None and len(array) != count:
+        raise ValueError("Coordinate arrays must contain %d coordinates, "
+                         "not %d." % (count, len(array)))
+    if not numpy.isfinite(array).all():
+        raise ValueError("Coordinate arrays must contain finite numbers.")
+    return tuple(
+        tuple(int(v) if v.is_integer() else v for v in coordinate)
+        for coordinate in array.tolist()
+    )
+
+
 def normalizeBoundingBox(value):
     """
     Normalizes bounding box.
@@ -992,6 +1073,27 @@ def normalizeInterpolationFactor(value):
     return value
 
 
+# Workers
+
+def normalizeWorkers(value):
+    """
+    Normalizes the number of worker processes.
+
+    * **value** must be an ``int`` or ``None``.
+    * **value** must be greater than or equal to 1.
+    * Returned value is the same type as the input value.
+    """
+    if value is None:
+        return value
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError("Workers must be None or an int, not %s."
+                        % type(value).__name__)
+    if value < 1:
+        raise ValueError("Workers must be greater than or equal to 1, "
+                         "not %d." % value)
+    return value
+
+
 # ---------------
 # Transformations
 # ---------------
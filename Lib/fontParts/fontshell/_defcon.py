@@ -0,0 +1,130 @@
+import defcon
+
+# Everything in fontshell that uses private attributes of
+# defcon or fontTools.ufoLib is kept in this module. It is
+# written against defcon 0.10 and fontTools 4.28, the minimum
+# versions in setup.py, and must be checked against new
+# versions of either.
+
+
+class LazyLayerSet(defcon.LayerSet):
+
+    # Skip the check that every glyph file listed
+    # in the contents exists when the layers are
+    # opened. Missing files surface on first access.
+    # Reading and parsing the glyphs is still validated,
+    # see restoreGlyphReadValidation.
+    ufoLibReadValidate = False
+
+    def newLayer(self, name, glyphSet=None):
+        layer = super(LazyLayerSet, self).newLayer(name, glyphSet=glyphSet)
+        restoreGlyphReadValidation([layer])
+        return layer
+
+    def _fontSaveWasCompleted(self):
+        super(LazyLayerSet, self)._fontSaveWasCompleted()
+        restoreGlyphReadValidation(self)
+
+
+# ----
+# Font
+# ----
+
+def setFontPath(font, path):
+    # The path setter requires an existing path,
+    # so it can't restore the None of a new font.
+    font._path = path
+
+
+def closeFont(font):
+    # Font.close deletes the reader, so closing
+    # again or reopening would fail without this.
+    font.close()
+    font._reader = None
+
+
+def reopenGlyphSets(font):
+    # defcon calls this at the end of Font.save to read the
+    # glyphs that haven't been loaded from the saved font.
+    font.layers._fontSaveWasCompleted()
+
+
+# ------
+# Layers
+# ------
+
+def getLoadedGlyphs(layer):
+    return layer._glyphs
+
+
+def getGlyphSet(layer):
+    return layer._glyphSet
+
+
+def restoreGlyphReadValidation(layers):
+    # A glyph set opened with validateRead=False doesn't check that
+    # the files in its contents exist, but it also reads every glyph
+    # without validation. Only the check is meant to be skipped, so
+    # reads are validated again as defcon.Layer would have them.
+    for layer in layers:
+        glyphSet = layer._glyphSet
+        if glyphSet is not None:
+            glyphSet._validateRead = layer.ufoLibReadValidate
+
+
+def writeGLIFData(glyphSet, glyphName, data):
+    # This mirrors fontTools.ufoLib.glifLib.GlyphSet.writeGlyph
+    # with the GLIF data already made. writeGlyph can't be used
+    # because it makes the data from a glyph object, which is
+    # the work that RFont.save does in other processes. The
+    # file name caches of the glyph set are kept up to date so
+    # that glyphs written with writeGlyph get unique names.
+    fileName = glyphSet.contents.get(glyphName)
+    if fileName is None:
+        if glyphSet._existingFileNames is None:
+            glyphSet._existingFileNames = {
+                fileName.lower() for fileName in glyphSet.contents.values()
+            }
+        fileName = glyphSet.glyphNameToFileName(glyphName,
+                                                glyphSet._existingFileNames)
+        glyphSet.contents[glyphName] = fileName
+        glyphSet._existingFileNames.add(fileName.lower())
+        if glyphSet._reverseContents is not None:
+            glyphSet._reverseContents[fileName.lower()] = glyphName
+    if (glyphSet._havePreviousFile
+            and glyphSet.fs.exists(fileName)
+            and data == glyphSet.fs.readbytes(fileName)):
+        return
+    glyphSet.fs.writebytes(fileName, data)
+
+
+def insertLoadedGlyph(layer, glyphName, glifData, modTime, load):
+    # This mirrors defcon.Layer.loadGlyph with the contents
+    # of the glyph set by calling load with the glyph.
+    glyph = layer.instantiateGlyphObject()
+    glyph.disableNotifications()
+    glyph._isLoading = True
+    glyph.name = glyphName
+    setGLIFDataOnDisk(glyph, glifData, modTime)
+    layer._insertGlyph(glyph)
+    load(glyph)
+    glyph.dirty = False
+    glyph._isLoading = False
+    glyph.enableNotifications()
+
+
+# ------
+# Glyphs
+# ------
+
+def getImageData(glyph):
+    # Reading glyph.image would create an empty image.
+    if not glyph._image:
+        return None
+    return dict(glyph._image.items())
+
+
+def setGLIFDataOnDisk(glyph, glifData, modTime):
+    glyph._dataOnDisk = glifData
+    glyph._dataOnDiskTimeStamp = modTime
+
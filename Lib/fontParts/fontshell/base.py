@@ -1,3 +1,18 @@
+import defcon
+
+
+def _changeTokenFactory(obj):
+    return object()
+
+
+for _cls in (defcon.Contour, defcon.Glyph, defcon.Groups, defcon.Kerning):
+    defcon.registerRepresentationFactory(
+        _cls,
+        "fontParts.changeToken",
+        _changeTokenFactory
+    )
+
+
 class RBaseObject(object):
 
     wrapClass = None
@@ -11,6 +26,49 @@ class RBaseObject(object):
     def changed(self):
         self.naked().dirty = True
 
+    def _holdChanges(self):
+        # Only the object's own change notification is held. The
+        # specific notifications that defcon uses to destroy its
+        # representations and to keep the layer's name map current
+        # (Glyph.NameChanged, Contour.PointsChanged and so on) are
+        # still posted, so the object can be read inside the block.
+        naked = self.naked()
+        if naked.dispatcher is None:
+            return
+        naked.holdNotifications(
+            notification=naked.changeNotificationName,
+            note="Requested by fontParts holdChanges."
+        )
+
+    def _releaseHeldChanges(self):
+        naked = self.naked()
+        if naked.dispatcher is None:
+            return
+        naked.releaseHeldNotifications(
+            notification=naked.changeNotificationName
+        )
+
+    def _getRepresentation(self, name):
+        # Representations destroyed by the held change notification
+        # are rebuilt on every read until the hold is released.
+        naked = self.naked()
+        if self._areChangesHeld():
+            naked.destroyRepresentation(name)
+        return naked.getRepresentation(name)
+
+    def _getRepresentationChangeToken(self):
+        # Held notifications don't destroy representations,
+        # so don't cache anything until they are released.
+        if self._areChangesHeld():
+            return None
+        return self.naked().getRepresentation("fontParts.changeToken")
+
+    def _areChangesHeld(self):
+        dispatcher = self.naked().dispatcher
+        if dispatcher is None:
+            return False
+        return bool(dispatcher.getHeldNotifications())
+
     def naked(self):
         if hasattr(self, "_wrapped"):
             return self._wrapped
@@ -40,6 +40,13 @@ class RContour(RBaseObject, BaseContour):
         point = point.naked()
         return contour.generateIdentifierForPoint(point)
 
+    # ------------
+    # Change Token
+    # ------------
+
+    def _getChangeToken(self):
+        return self._getRepresentationChangeToken()
+
     # ----
     # Open
     # ----
@@ -109,3 +116,23 @@ class RContour(RBaseObject, BaseContour):
         contour = self.naked()
         point = contour[index]
         contour.removePoint(point)
+
+    # -----------
+    # Coordinates
+    # -----------
+
+    def _get_coordinates(self):
+        return tuple((point.x, point.y) for point in self.naked())
+
+    def _set_coordinates(self, value):
+        contour = self.naked()
+        for point, (x, y) in zip(contour, value):
+            point.x = x
+            point.y = y
+        contour.postNotification("Contour.PointsChanged")
+        contour.dirty = True
+
+    def _get_pointTypes(self):
+        return tuple(
+            point.segmentType or "offcurve" for point in self.naked()
+        )
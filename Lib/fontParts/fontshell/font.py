@@ -1,19 +1,195 @@
 import defcon
+import errno
+import functools
 import os
+import shutil
+import sys
+import tempfile
+from fontTools.ufoLib import UFOFileStructure, UFOFormatVersion
+from fontTools.ufoLib.glifLib import GLIFFormatVersion
 from fontParts.base import BaseFont
+from fontParts.base.base import mapInProcesses
+from fontParts.fontshell._defcon import (
+    LazyLayerSet, closeFont, getGlyphSet, getLoadedGlyphs,
+    insertLoadedGlyph, reopenGlyphSets, restoreGlyphReadValidation,
+    setFontPath
+)
 from fontParts.fontshell.base import RBaseObject
 from fontParts.fontshell.info import RInfo
 from fontParts.fontshell.groups import RGroups
 from fontParts.fontshell.kerning import RKerning
 from fontParts.fontshell.features import RFeatures
 from fontParts.fontshell.lib import RLib
-from fontParts.fontshell.layer import RLayer
+from fontParts.fontshell.layer import (
+    RLayer, _Layer, _applyGLIFData, _getGLIFData, _readGLIFs, _writeGLIFs
+)
 from fontParts.fontshell.guideline import RGuideline
 
 
+class _Font(defcon.Font):
+
+    # defcon serializes the info, groups and lib on every
+    # save and ufoLib then skips the files that haven't
+    # changed. During an incremental save in place, the
+    # ones that aren't dirty aren't serialized at all.
+    _incrementalSave = False
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("layerClass", _Layer)
+        super(_Font, self).__init__(*args, **kwargs)
+
+    def saveInfo(self, writer):
+        if self._incrementalSave and not self.info.dirty:
+            return
+        super(_Font, self).saveInfo(writer)
+
+    def saveGroups(self, writer):
+        if self._incrementalSave and not self.groups.dirty:
+            return
+        super(_Font, self).saveGroups(writer)
+
+    def saveLib(self, writer, saveAs=False, progressBar=None):
+        if self._incrementalSave and not self.lib.dirty:
+            return
+        super(_Font, self).saveLib(writer, saveAs=saveAs,
+                                   progressBar=progressBar)
+
+
+def _getDirtyObjects(font):
+    objects = [font.info, font.groups, font.kerning, font.lib, font.features]
+    for layer in font.layers:
+        objects.append(layer)
+        objects.extend(getLoadedGlyphs(layer).values())
+    return [obj for obj in objects if obj.dirty]
+
+
+def _getDirtyGLIFFileNames(font):
+    fileNames = set()
+    for layer in font.layers:
+        glyphSet = getGlyphSet(layer)
+        if glyphSet is None:
+            continue
+        for glyphName, glyph in getLoadedGlyphs(layer).items():
+            if glyph.dirty and glyphName in glyphSet.contents:
+                fileNames.add(glyphSet.contents[glyphName])
+    return fileNames
+
+
+def _cloneUFO(source, destination, copyFileNames):
+    # ufoLib rewrites files in place, so only GLIF files
+    # that won't be written during the save can be shared
+    # with the source through hard links.
+    if os.path.isfile(source):
+        shutil.copy2(source, destination)
+        return
+    link = True
+    for directory, _, fileNames in os.walk(source):
+        cloneDirectory = os.path.normpath(
+            os.path.join(destination, os.path.relpath(directory, source))
+        )
+        os.makedirs(cloneDirectory, exist_ok=True)
+        for fileName in fileNames:
+            sourcePath = os.path.join(directory, fileName)
+            clonePath = os.path.join(cloneDirectory, fileName)
+            if link and fileName.endswith(".glif") and fileName not in copyFileNames:
+                try:
+                    os.link(sourcePath, clonePath)
+                    continue
+                except OSError:
+                    link = False
+            shutil.copy2(sourcePath, clonePath)
+
+
+def _getBackupPath(path):
+    return path + ".bak"
+
+
+# renameat2 flag and directory descriptor from <linux/fs.h>
+# and <fcntl.h>.
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+@functools.lru_cache(maxsize=None)
+def _getRenameat2():
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return None
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                          ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    return renameat2
+
+
+def _exchangePaths(path1, path2):
+    # Swap two paths in one step with renameat2(RENAME_EXCHANGE).
+    # False is returned if the system or file system can't do it.
+    renameat2 = _getRenameat2()
+    if renameat2 is None:
+        return False
+    import ctypes
+
+    result = renameat2(_AT_FDCWD, os.fsencode(path1),
+                       _AT_FDCWD, os.fsencode(path2), _RENAME_EXCHANGE)
+    if result == 0:
+        return True
+    error = ctypes.get_errno()
+    if error in (errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+        return False
+    raise OSError(error, os.strerror(error), path1, None, path2)
+
+
+def _removePath(path):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def _recoverBackup(path):
+    # Clean up after a save that was interrupted in _replaceUFO.
+    # If it stopped between the two renames, the previous font
+    # is only at the backup path and is moved back. Otherwise
+    # the new font is in place and the backup is removed.
+    backup = _getBackupPath(path)
+    if not os.path.exists(backup):
+        return False
+    if os.path.exists(path):
+        _removePath(backup)
+    else:
+        os.rename(backup, path)
+    return True
+
+
+def _replaceUFO(source, destination):
+    # A directory can't be replaced with os.replace. Where the
+    # system supports it, source and destination are exchanged
+    # in one step. Otherwise the previous font is moved to the
+    # backup path first. If the process stops between the two
+    # renames, there is no font at destination. The previous
+    # font is then at the backup path, and the next atomic save
+    # moves it back with _recoverBackup.
+    if os.path.isdir(destination) or (os.path.exists(destination)
+                                      and os.path.isdir(source)):
+        if _exchangePaths(source, destination):
+            _removePath(source)
+            return
+        backup = _getBackupPath(destination)
+        os.rename(destination, backup)
+        os.rename(source, destination)
+        _removePath(backup)
+    else:
+        os.replace(source, destination)
+
+
 class RFont(RBaseObject, BaseFont):
 
-    wrapClass = defcon.Font
+    wrapClass = _Font
     infoClass = RInfo
     groupsClass = RGroups
     kerningClass = RKerning
@@ -28,13 +204,17 @@ class RFont(RBaseObject, BaseFont):
 
     # Initialize
 
-    def _init(self, pathOrObject=None, showInterface=True, **kwargs):
+    def _init(self, pathOrObject=None, showInterface=True, lazy=False,
+              **kwargs):
+        if hasattr(pathOrObject, "__fspath__"):
+            pathOrObject = os.fspath(pathOrObject)
         if pathOrObject is None:
             font = self.wrapClass()
         elif isinstance(pathOrObject, str):
-            font = self.wrapClass(pathOrObject)
-        elif hasattr(pathOrObject, "__fspath__"):
-            font = self.wrapClass(os.fspath(pathOrObject))
+            if lazy:
+                font = self.wrapClass(pathOrObject, layerSetClass=LazyLayerSet)
+            else:
+                font = self.wrapClass(pathOrObject)
         else:
             font = pathOrObject
         self._wrapped = font
@@ -47,8 +227,170 @@ class RFont(RBaseObject, BaseFont):
     # save
 
     def _save(self, path=None, showProgress=False,
-              formatVersion=None, fileStructure=None, **kwargs):
-        self.naked().save(path=path, formatVersion=formatVersion, structure=fileStructure)
+              formatVersion=None, fileStructure=None, incremental=False,
+              workers=None, atomic=False, **kwargs):
+        font = self.naked()
+        layers = font.layers
+        if incremental:
+            incremental = self._isSaveInPlace(path, formatVersion,
+                                              fileStructure)
+            if incremental and not font.dirty:
+                return
+        validate = layers.ufoLibReadValidate
+        if incremental:
+            # Dirty glyphs are the only ones that are written,
+            # so don't validate the glyph files on disk either.
+            layers.ufoLibReadValidate = False
+            if isinstance(font, _Font):
+                font._incrementalSave = True
+        try:
+            if atomic:
+                self._saveAtomic(path, formatVersion, fileStructure, workers)
+            else:
+                self._saveFont(path, formatVersion, fileStructure, workers)
+        finally:
+            layers.ufoLibReadValidate = validate
+            if incremental:
+                restoreGlyphReadValidation(layers)
+            vars(font).pop("_incrementalSave", None)
+            for layer in layers:
+                if isinstance(layer, _Layer):
+                    layer.clearPreparedGLIFs()
+
+    def _isSaveInPlace(self, path, formatVersion, fileStructure):
+        font = self.naked()
+        if font.path is None or not os.path.exists(font.path):
+            return False
+        if path is not None and not (os.path.exists(path)
+                                     and os.path.samefile(path, font.path)):
+            return False
+        if (formatVersion is not None
+                and UFOFormatVersion(formatVersion) != font.ufoFormatVersionTuple):
+            return False
+        if (fileStructure is not None
+                and UFOFileStructure(fileStructure) != font.ufoFileStructure):
+            return False
+        return True
+
+    def _saveFont(self, path, formatVersion, fileStructure, workers):
+        if workers is not None and workers > 1:
+            self._prepareGLIFs(path, formatVersion, workers)
+        self.naked().save(path=path, formatVersion=formatVersion,
+                          structure=fileStructure)
+
+    def _saveAtomic(self, path, formatVersion, fileStructure, workers):
+        font = self.naked()
+        originalPath = font.path
+        if path is None:
+            path = originalPath
+        path = os.path.abspath(path)
+        if (_recoverBackup(path) and originalPath is not None
+                and os.path.exists(originalPath)
+                and os.path.samefile(path, originalPath)):
+            # The glyph sets were closed by the interrupted save.
+            reopenGlyphSets(font)
+        inPlace = (
+            originalPath is not None
+            and os.path.exists(path)
+            and os.path.exists(originalPath)
+            and os.path.samefile(path, originalPath)
+        )
+        directory, fileName = os.path.split(path)
+        tempDirectory = tempfile.mkdtemp(prefix="." + fileName + "-",
+                                         dir=directory)
+        tempPath = os.path.join(tempDirectory, fileName)
+        dirty = _getDirtyObjects(font)
+        try:
+            if inPlace:
+                _cloneUFO(path, tempPath, _getDirtyGLIFFileNames(font))
+                font.path = tempPath
+                savePath = None
+            else:
+                savePath = tempPath
+            self._saveFont(savePath, formatVersion, fileStructure, workers)
+            # defcon has reopened the glyph sets in the
+            # temporary copy. Close it before it is moved.
+            closeFont(font)
+            _replaceUFO(tempPath, path)
+            font.path = path
+        except BaseException:
+            closeFont(font)
+            setFontPath(font, originalPath)
+            if originalPath is not None and os.path.exists(originalPath):
+                reopenGlyphSets(font)
+            for obj in dirty:
+                obj.dirty = True
+            raise
+        finally:
+            shutil.rmtree(tempDirectory, ignore_errors=True)
+        reopenGlyphSets(font)
+
+    def _prepareGLIFs(self, path, formatVersion, workers):
+        font = self.naked()
+        layers = font.layers
+        # Only the layers made by _Font can save prepared data.
+        if not all(isinstance(layer, _Layer) for layer in layers):
+            return
+        if formatVersion is None:
+            formatVersion = font.ufoFormatVersionTuple or UFOFormatVersion.default()
+        formatVersion = UFOFormatVersion(formatVersion)
+        saveAs = (
+            font.path is None
+            or formatVersion != font.ufoFormatVersionTuple
+            or (path is not None
+                and os.path.abspath(path) != os.path.abspath(font.path))
+        )
+        if saveAs:
+            glyphNames = set()
+            for layer in layers:
+                glyphNames.update(layer.keys())
+            self._preload(sorted(glyphNames), workers)
+        glyphs = []
+        for layer in layers:
+            for glyphName, glyph in sorted(getLoadedGlyphs(layer).items()):
+                if saveAs or glyph.dirty:
+                    data, pointData = _getGLIFData(glyph)
+                    glyphs.append((layer, (glyphName, data, pointData)))
+        glifFormatVersion = GLIFFormatVersion.default(formatVersion)
+        results = mapInProcesses(
+            _writeGLIFs, [item for _, item in glyphs], workers,
+            glifFormatVersion, layers.ufoLibWriteValidate
+        )
+        prepared = {layer.name: {} for layer in layers}
+        for (layer, (glyphName, _, _)), data in zip(glyphs, results):
+            prepared[layer.name][glyphName] = data
+        for layer in layers:
+            layer.setPreparedGLIFs(prepared[layer.name], glifFormatVersion)
+
+    # preload
+
+    def _preload(self, glyphNames, workers=None, **kwargs):
+        if workers is None or workers < 2:
+            super(RFont, self)._preload(glyphNames, workers)
+            return
+        layers = self.naked().layers
+        for layer in layers:
+            glyphSet = getGlyphSet(layer)
+            if glyphSet is None:
+                continue
+            loaded = getLoadedGlyphs(layer)
+            unloaded = [
+                glyphName for glyphName in glyphNames
+                if glyphName in layer
+                and glyphName not in loaded
+                and glyphName in glyphSet
+            ]
+            texts = [glyphSet.getGLIF(glyphName) for glyphName in unloaded]
+            results = mapInProcesses(_readGLIFs, texts, workers,
+                                     layer.ufoLibReadValidate)
+            for glyphName, text, (data, pointData) in zip(unloaded, texts,
+                                                          results):
+                modTime = glyphSet.getGLIFModificationTime(glyphName)
+                insertLoadedGlyph(
+                    layer, glyphName, text, modTime,
+                    functools.partial(_applyGLIFData, data=data,
+                                      pointData=pointData)
+                )
 
     # close
 
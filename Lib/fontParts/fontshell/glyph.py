@@ -43,6 +43,13 @@ class RGlyph(RBaseObject, BaseGlyph):
     def _set_unicodes(self, value):
         self.naked().unicodes = value
 
+    # ------------
+    # Change Token
+    # ------------
+
+    def _getChangeToken(self):
+        return self._getRepresentationChangeToken()
+
     # -------
     # Metrics
     # -------
@@ -218,6 +225,14 @@ class RGlyph(RBaseObject, BaseGlyph):
         guideline = glyph.guidelines[index]
         glyph.removeGuideline(guideline)
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def _transformBy(self, matrix, **kwargs):
+        with self.holdChanges():
+            super(RGlyph, self)._transformBy(matrix, **kwargs)
+
     # -----------------
     # Layer Interaction
     # -----------------
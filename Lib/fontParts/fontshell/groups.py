@@ -7,11 +7,17 @@ class RGroups(RBaseObject, BaseGroups):
 
     wrapClass = defcon.Groups
 
+    def _getChangeToken(self):
+        return self._getRepresentationChangeToken()
+
     def _get_side1KerningGroups(self):
-        return self.naked().getRepresentation("defcon.groups.kerningSide1Groups")
+        return self._getRepresentation("defcon.groups.kerningSide1Groups")
 
     def _get_side2KerningGroups(self):
-        return self.naked().getRepresentation("defcon.groups.kerningSide2Groups")
+        return self._getRepresentation("defcon.groups.kerningSide2Groups")
+
+    def _keys(self):
+        return self.naked().keys()
 
     def _items(self):
         return self.naked().items()
@@ -27,3 +33,12 @@ class RGroups(RBaseObject, BaseGroups):
 
     def _delItem(self, key):
         del self.naked()[key]
+
+    def _update(self, other):
+        self.naked().update({key: list(value) for key, value in other.items()})
+
+    def _getKerningGroupIndex(self):
+        return (
+            self._getRepresentation("defcon.groups.kerningGlyphToSide1Group"),
+            self._getRepresentation("defcon.groups.kerningGlyphToSide2Group")
+        )
@@ -7,6 +7,19 @@ class RKerning(RBaseObject, BaseKerning):
 
     wrapClass = defcon.Kerning
 
+    def _getChangeToken(self):
+        # Lookups depend on the groups too. They share the
+        # kerning's dispatcher, so the hold check covers them.
+        token = self._getRepresentationChangeToken()
+        font = self.naked().font
+        if token is None or font is None:
+            return None
+        groups = font.groups
+        return (token, groups.getRepresentation("fontParts.changeToken"))
+
+    def _keys(self):
+        return self.naked().keys()
+
     def _items(self):
         return self.naked().items()
 
@@ -22,5 +35,16 @@ class RKerning(RBaseObject, BaseKerning):
     def _delItem(self, key):
         del self.naked()[key]
 
+    def _update(self, other):
+        self.naked().update(other)
+
+    def _clear(self):
+        self.naked().clear()
+
+    def _replace(self, kerning):
+        naked = self.naked()
+        naked.clear()
+        naked.update(kerning)
+
     def _find(self, pair, default=0):
         return self.naked().find(pair, default)
@@ -1,10 +1,128 @@
 import defcon
+from itertools import islice
+from fontTools.pens.recordingPen import RecordingPointPen
+from fontTools.ufoLib.glifLib import (
+    GLIFFormatVersion, GlifLibError, readGlyphFromString, writeGlyphToString
+)
 from fontParts.base import BaseLayer
+from fontParts.base.base import _sharedProcessPool, mapInProcesses
+from fontParts.base.errors import FontPartsError
+from fontParts.fontshell._defcon import (
+    getImageData, setGLIFDataOnDisk, writeGLIFData
+)
 from fontParts.fontshell.base import RBaseObject
 from fontParts.fontshell.lib import RLib
 from fontParts.fontshell.glyph import RGlyph
 
 
+class _GLIFData(object):
+
+    pass
+
+
+def _readGLIFs(texts, validate):
+    results = []
+    for text in texts:
+        glyph = _GLIFData()
+        pen = RecordingPointPen()
+        readGlyphFromString(text, glyphObject=glyph, pointPen=pen,
+                            validate=validate)
+        data = vars(glyph)
+        data.pop("name", None)
+        results.append((data, pen.value))
+    return results
+
+
+def _applyGLIFData(glyph, data, pointData):
+    for attr, value in data.items():
+        setattr(glyph, attr, value)
+    pointPen = glyph.getPointPen()
+    for method, args, kwargs in pointData:
+        getattr(pointPen, method)(*args, **kwargs)
+
+
+def _getGLIFData(glyph):
+    data = dict(
+        width=glyph.width,
+        height=glyph.height,
+        unicodes=list(glyph.unicodes),
+        note=glyph.note,
+        guidelines=[dict(guideline.items()) for guideline in glyph.guidelines],
+        anchors=[dict(anchor.items()) for anchor in glyph.anchors],
+        lib=dict(glyph.lib)
+    )
+    image = getImageData(glyph)
+    if image is not None:
+        data["image"] = image
+    pen = RecordingPointPen()
+    glyph.drawPoints(pen)
+    return data, pen.value
+
+
+def _writeGLIFs(glyphs, formatVersion, validate):
+    results = []
+    for glyphName, data, pointData in glyphs:
+        glyph = _GLIFData()
+        vars(glyph).update(data)
+
+        def drawPoints(pointPen):
+            for method, args, kwargs in pointData:
+                getattr(pointPen, method)(*args, **kwargs)
+
+        text = writeGlyphToString(glyphName, glyph, drawPoints,
+                                  formatVersion=formatVersion,
+                                  validate=validate)
+        results.append(text.encode("utf-8"))
+    return results
+
+
+class _Layer(defcon.Layer):
+
+    # defcon.Layer.save calls saveGlyph for every glyph it
+    # writes. RFont.save with workers sets the GLIF data it
+    # made in other processes with setPreparedGLIFs, and the
+    # glyphs that have it are written as they are.
+    _preparedGLIFs = None
+    _preparedFormatVersion = None
+
+    def setPreparedGLIFs(self, glifs, formatVersion):
+        self._preparedGLIFs = glifs
+        self._preparedFormatVersion = formatVersion
+
+    def clearPreparedGLIFs(self):
+        self.setPreparedGLIFs(None, None)
+
+    def saveGlyph(self, glyph, glyphSet, saveAs=False):
+        data = None
+        if self._preparedGLIFs is not None:
+            data = self._preparedGLIFs.pop(glyph.name, None)
+        formatVersion = GLIFFormatVersion.default(
+            glyphSet.ufoFormatVersionTuple
+        )
+        if (data is None or not (glyph.dirty or saveAs)
+                or formatVersion != self._preparedFormatVersion):
+            super(_Layer, self).saveGlyph(glyph, glyphSet, saveAs=saveAs)
+            return
+        writeGLIFData(glyphSet, glyph.name, data)
+        setGLIFDataOnDisk(glyph, data,
+                          glyphSet.getGLIFModificationTime(glyph.name))
+        glyph.dirty = False
+
+
+# The number of glyphs per worker that are dumped
+# at a time by RLayer.iterDumpToGLIFs.
+_glifBatchSize = 256
+
+
+def _batches(items, size):
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
 class RLayer(RBaseObject, BaseLayer):
 
     wrapClass = defcon.Layer
@@ -69,6 +187,66 @@ class RLayer(RBaseObject, BaseLayer):
         layer = self.naked()
         del layer[name]
 
+    # ----
+    # GLIF
+    # ----
+
+    def _iterDumpToGLIFs(self, glyphNames, glyphFormatVersion, workers=None):
+        if workers is None or workers < 2:
+            yield from super(RLayer, self)._iterDumpToGLIFs(
+                glyphNames, glyphFormatVersion
+            )
+            return
+        import concurrent.futures
+
+        # The pool of sharedProcessPool is used if the iteration
+        # starts inside it. The iteration must then end inside it
+        # too. Otherwise the pool belongs to this generator, since
+        # the generator is suspended between batches, and it is
+        # shut down when the generator is exhausted, closed or
+        # garbage collected.
+        layer = self.naked()
+        executor = _sharedProcessPool.get()
+        ownExecutor = executor is None
+        if ownExecutor:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers
+            )
+        try:
+            for batch in _batches(glyphNames, workers * _glifBatchSize):
+                glyphs = [
+                    (glyphName,) + _getGLIFData(layer[glyphName])
+                    for glyphName in batch
+                ]
+                results = mapInProcesses(_writeGLIFs, glyphs, workers,
+                                         glyphFormatVersion, True,
+                                         executor=executor)
+                for glyphName, data in zip(batch, results):
+                    yield glyphName, data.decode("utf-8")
+        finally:
+            if ownExecutor:
+                executor.shutdown()
+
+    def _loadFromGLIFs(self, glifs, workers=None):
+        # All of the data is parsed before any glyph is
+        # replaced, so invalid data leaves the layer as it was.
+        glifs = list(glifs)
+        texts = [glifData for _, glifData in glifs]
+        try:
+            results = mapInProcesses(_readGLIFs, texts, workers, True)
+        except GlifLibError:
+            raise FontPartsError("Not valid glif data")
+        with self.holdChanges():
+            for (glyphName, _), (data, pointData) in zip(glifs, results):
+                glyph = self.newGlyph(glyphName).naked()
+                glyph.holdNotifications(
+                    note="Requested by fontParts loadFromGLIFs."
+                )
+                try:
+                    _applyGLIFData(glyph, data, pointData)
+                finally:
+                    glyph.releaseHeldNotifications()
+
     # -------
     # mapping
     # -------
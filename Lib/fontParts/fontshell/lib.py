@@ -7,6 +7,9 @@ class RLib(RBaseObject, BaseLib):
 
     wrapClass = defcon.Lib
 
+    def _keys(self):
+        return self.naked().keys()
+
     def _items(self):
         return self.naked().items()
 
@@ -21,3 +24,6 @@ class RLib(RBaseObject, BaseLib):
 
     def _delItem(self, key):
         del self.naked()[key]
+
+    def _update(self, other):
+        self.naked().update(other)
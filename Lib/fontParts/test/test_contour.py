@@ -2,6 +2,11 @@ import unittest
 import collections
 from fontParts.base import FontPartsError
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestContour(unittest.TestCase):
 
@@ -574,6 +579,150 @@ class TestContour(unittest.TestCase):
         segments = contour.segments
         self.assertEqual(segments, [])
 
+    def getContour_inFont(self):
+        font, _ = self.objectGenerator("font")
+        glyph = font.newGlyph("A")
+        pen = glyph.getPointPen()
+        pen.beginPath()
+        pen.addPoint((0, 0), "line")
+        pen.addPoint((0, 100), "line")
+        pen.addPoint((100, 100), "line")
+        pen.endPath()
+        return glyph.contours[0]
+
+    def test_segments_index(self):
+        contour = self.getContour_inFont()
+        segments = contour.segments
+        self.assertEqual(
+            [contour[i] for i in range(len(contour))],
+            segments
+        )
+        self.assertEqual(
+            list(contour),
+            segments
+        )
+
+    def test_segments_afterInsertPoint(self):
+        contour = self.getContour_inFont()
+        self.assertEqual(len(contour), 3)
+        contour.insertPoint(1, (50, 50), "line")
+        self.assertEqual(len(contour), 4)
+        self.assertEqual(
+            [(segment.onCurve.x, segment.onCurve.y) for segment in contour],
+            [(50, 50), (0, 100), (100, 100), (0, 0)]
+        )
+
+    def test_segments_insideHoldChanges(self):
+        contour = self.getContour_inFont()
+        self.assertEqual(len(contour), 3)
+        with contour.glyph.holdChanges():
+            contour.insertPoint(1, (50, 50), "line")
+            self.assertEqual(len(contour), 4)
+        self.assertEqual(len(contour), 4)
+
+    def test_segments_afterPointType(self):
+        contour = self.getContour_inFont()
+        contour.points[1].type = "offcurve"
+        self.assertEqual(
+            [len(segment.points) for segment in contour.segments],
+            [2, 1]
+        )
+
+    def test_segments_listNotShared(self):
+        contour = self.getContour_inFont()
+        contour.segments.pop()
+        self.assertEqual(len(contour.segments), 3)
+
+    # -----------
+    # Coordinates
+    # -----------
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_coordinates(self):
+        contour = self.getContour_bounds()
+        coordinates = contour.coordinates
+        self.assertEqual(coordinates.shape, (4, 2))
+        self.assertEqual(
+            coordinates.tolist(),
+            [[0, 0], [0, 100], [100, 100], [100, 0]]
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_coordinates_empty(self):
+        contour, _ = self.objectGenerator("contour")
+        self.assertEqual(contour.coordinates.shape, (0, 2))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates(self):
+        contour = self.getContour_bounds()
+        contour.coordinates = contour.coordinates * 2 + (1, 0.5)
+        self.assertEqual(
+            [point.position for point in contour.points],
+            [(1, 0.5), (1, 200.5), (201, 200.5), (201, 0.5)]
+        )
+        self.assertIsInstance(contour.points[0].x, int)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_list(self):
+        contour = self.getContour_bounds()
+        contour.coordinates = [(1, 2), (3, 4), (5, 6), (7, 8)]
+        self.assertEqual(
+            contour.coordinates.tolist(),
+            [[1, 2], [3, 4], [5, 6], [7, 8]]
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_wrongCount(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.coordinates = [(1, 2), (3, 4)]
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_wrongShape(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.coordinates = [1, 2, 3, 4]
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_invalidType(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(TypeError):
+            contour.coordinates = [("a", 2), (3, 4), (5, 6), (7, 8)]
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_notFinite(self):
+        contour = self.getContour_bounds()
+        with self.assertRaises(ValueError):
+            contour.coordinates = [(numpy.nan, 2), (3, 4), (5, 6), (7, 8)]
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_updatesSegments(self):
+        contour = self.getContour_inFont()
+        self.assertEqual(contour[0].onCurve.position, (0, 100))
+        contour.coordinates = [(1, 2), (3, 4), (5, 6)]
+        self.assertEqual(contour[0].onCurve.position, (3, 4))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_pointTypes(self):
+        contour, _ = self.objectGenerator("contour")
+        contour.appendPoint((0, 0), "line")
+        contour.appendPoint((0, 50), "offcurve")
+        contour.appendPoint((50, 100), "offcurve")
+        contour.appendPoint((100, 100), "curve")
+        self.assertEqual(
+            contour.pointTypes.tolist(),
+            ["line", "offcurve", "offcurve", "curve"]
+        )
+
+    def test_bPoints_afterRemovePoint(self):
+        contour = self.getContour_inFont()
+        self.assertEqual(len(contour.bPoints), 3)
+        contour.removePoint(0)
+        self.assertEqual(
+            [bPoint.anchor for bPoint in contour.bPoints],
+            [(0, 100), (100, 100)]
+        )
+
     def test_segment_insert_open(self):
         # at index 0
         contour, _ = self.objectGenerator("contour")
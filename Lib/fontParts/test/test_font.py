@@ -3,6 +3,8 @@ import collections
 import tempfile
 import os
 import shutil
+from unittest import mock
+from fontParts.test.test_image import testImageData
 
 
 class TestFont(unittest.TestCase):
@@ -161,6 +163,53 @@ class TestFont(unittest.TestCase):
         }
         self.assertEqual(font.getFlatKerning(), expected)
 
+    def getFont_flatKerning(self):
+        font = self.getFont_glyphs()
+        font.groups["public.kern1.O"] = ["O", "Ograve"]
+        font.groups["public.kern2.O"] = ["O", "Ograve"]
+        font.kerning["A", "V"] = -100
+        font.kerning["public.kern1.O", "public.kern2.O"] = -50
+        font.kerning["O", "public.kern2.O"] = -30
+        font.kerning["O", "Ograve"] = -70
+        return font
+
+    def test_iterFlatKerning(self):
+        font = self.getFont_flatKerning()
+        flat = list(font.iterFlatKerning())
+        self.assertEqual(len(flat), 5)
+        self.assertEqual(dict(flat), font.getFlatKerning())
+
+    def test_iterFlatKerning_order(self):
+        font = self.getFont_flatKerning()
+        self.assertEqual(
+            [pair for pair, value in font.iterFlatKerning()],
+            [("Ograve", "O"), ("Ograve", "Ograve"), ("O", "O"),
+             ("A", "V"), ("O", "Ograve")]
+        )
+
+    def test_iterFlatKerning_isGenerator(self):
+        font = self.getFont_flatKerning()
+        iterator = font.iterFlatKerning()
+        self.assertEqual(iter(iterator), iterator)
+
+    def test_getCompactFlatKerning(self):
+        font = self.getFont_flatKerning()
+        glyphOrder = ["O", "Ograve", "A", "V"]
+        compact = font.getCompactFlatKerning(glyphOrder)
+        self.assertEqual(sorted(compact.keys()), [0, 1, 2])
+        rightIndexes, values = compact[0]
+        self.assertEqual(list(rightIndexes), [0, 1])
+        self.assertEqual(list(values), [-30, -70])
+        rightIndexes, values = compact[2]
+        self.assertEqual(list(rightIndexes), [3])
+        self.assertEqual(list(values), [-100])
+
+    def test_getCompactFlatKerning_skipsMissingGlyphs(self):
+        font = self.getFont_flatKerning()
+        compact = font.getCompactFlatKerning(["A", "O"])
+        self.assertEqual(list(compact.keys()), [1])
+        self.assertEqual(list(compact[1][0]), [1])
+
     # ----
     # Hash
     # ----
@@ -491,6 +540,235 @@ class TestFont(unittest.TestCase):
             ()
         )
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def getFont_outlines(self):
+        font, _ = self.objectGenerator("font")
+        background = font.newLayer("background")
+        for layer in (font.defaultLayer, background):
+            glyph = layer.newGlyph("A")
+            pen = glyph.getPen()
+            pen.moveTo((100, 0))
+            pen.lineTo((100, 500))
+            pen.lineTo((500, 500))
+            pen.closePath()
+            glyph.width = 600
+        font.appendGuideline((100, 100), 0)
+        return font
+
+    def test_transformBy(self):
+        font = self.getFont_outlines()
+        font.transformBy((2, 0, 0, 3, 10, 20))
+        for layer in font.layers:
+            self.assertEqual(
+                layer["A"].bounds,
+                (210, 20, 1010, 1520)
+            )
+            self.assertEqual(
+                layer["A"].width,
+                600
+            )
+        self.assertEqual(
+            (font.guidelines[0].x, font.guidelines[0].y),
+            (210, 320)
+        )
+
+    def test_moveBy(self):
+        font = self.getFont_outlines()
+        font.moveBy((10, -10))
+        for layer in font.layers:
+            self.assertEqual(
+                layer["A"].bounds,
+                (110, -10, 510, 490)
+            )
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def getFont_interpolation(self, offset):
+        font, _ = self.objectGenerator("font")
+        for layer in (font.defaultLayer, font.newLayer("background")):
+            for name in "ABC":
+                glyph = layer.newGlyph(name)
+                pen = glyph.getPen()
+                pen.moveTo((100, 0))
+                pen.lineTo((100, 500 + offset))
+                pen.lineTo((500 + offset, 500))
+                pen.closePath()
+                glyph.appendAnchor("top", (300 + offset, 500))
+                glyph.width = 600 + offset
+        font.groups["public.kern1.X"] = ["A", "B"]
+        font.kerning[("public.kern1.X", "C")] = -10 - offset
+        font.kerning[("C", "A")] = 5 + offset
+        font.info.ascender = 700 + offset
+        font.appendGuideline((0, 300 + offset), 0)
+        return font
+
+    def getFont_interpolated(self):
+        font, _ = self.objectGenerator("font")
+        font.interpolate(
+            0.5,
+            self.getFont_interpolation(0),
+            self.getFont_interpolation(101)
+        )
+        return font
+
+    def test_interpolate(self):
+        font = self.getFont_interpolated()
+        self.assertEqual(
+            font.layerOrder,
+            ["public.default", "background"]
+        )
+        glyph = font["B"]
+        self.assertEqual(
+            glyph.bounds,
+            (100, 0, 551, 551)
+        )
+        self.assertEqual(
+            glyph.width,
+            651
+        )
+
+    def assertFontsEqual(self, font, other):
+        self.assertEqual(
+            font.layerOrder,
+            other.layerOrder
+        )
+        for layer in font.layers:
+            otherLayer = other.getLayer(layer.name)
+            self.assertEqual(
+                list(layer.keys()),
+                list(otherLayer.keys())
+            )
+            for glyph in layer:
+                self.assertEqual(
+                    glyph.dumpToGLIF(),
+                    otherLayer[glyph.name].dumpToGLIF()
+                )
+        self.assertEqual(
+            font.kerning.asDict(),
+            other.kerning.asDict()
+        )
+        self.assertEqual(
+            font.groups.asDict(),
+            other.groups.asDict()
+        )
+        self.assertEqual(
+            font.info.ascender,
+            other.info.ascender
+        )
+        self.assertEqual(
+            [(guideline.x, guideline.y) for guideline in font.guidelines],
+            [(guideline.x, guideline.y) for guideline in other.guidelines]
+        )
+
+    def test_interpolationSession(self):
+        from fontParts.base.interpolation import InterpolationSession
+        minFont = self.getFont_interpolation(0)
+        maxFont = self.getFont_interpolation(101)
+        session = InterpolationSession(minFont, maxFont)
+        for factor in (0.25, 0.5, (0.5, 1.5)):
+            expected, _ = self.objectGenerator("font")
+            expected.interpolate(factor, minFont, maxFont)
+            font, _ = self.objectGenerator("font")
+            session.interpolate(factor, font)
+            self.assertFontsEqual(font, expected)
+
+    def test_interpolationSession_convertsOnce(self):
+        from fontParts.base.interpolation import InterpolationSession
+        minFont = self.getFont_interpolation(0)
+        maxFont = self.getFont_interpolation(101)
+        glyphClass = minFont["A"].__class__
+        infoClass = minFont.info.__class__
+        kerningClass = minFont.kerning.__class__
+        session = InterpolationSession(minFont, maxFont)
+        with mock.patch.object(glyphClass, "_toMathGlyph",
+                               autospec=True,
+                               side_effect=glyphClass._toMathGlyph) as toMathGlyph, \
+                mock.patch.object(infoClass, "_toMathInfo", autospec=True,
+                                  side_effect=infoClass._toMathInfo) as toMathInfo, \
+                mock.patch.object(kerningClass, "_getInterpolationData",
+                                  autospec=True,
+                                  side_effect=kerningClass._getInterpolationData) as getData:
+            for factor in (0.25, 0.75):
+                font, _ = self.objectGenerator("font")
+                session.interpolate(factor, font)
+        glyphCount = sum(len(layer) for layer in minFont.layers)
+        self.assertEqual(
+            toMathGlyph.call_count,
+            glyphCount * 2
+        )
+        self.assertEqual(
+            toMathInfo.call_count,
+            2
+        )
+        self.assertEqual(
+            getData.call_count,
+            2
+        )
+
+    def test_interpolationSession_environmentOverride(self):
+        from fontParts.base.interpolation import InterpolationSession
+        minFont = self.getFont_interpolation(0)
+        maxFont = self.getFont_interpolation(101)
+        font, _ = self.objectGenerator("font")
+        session = InterpolationSession(minFont, maxFont)
+        with mock.patch.object(font.__class__, "_interpolate",
+                               autospec=True) as interpolate:
+            session.interpolate(0.5, font)
+        interpolate.assert_called_once_with(
+            font, (0.5, 0.5), minFont, maxFont,
+            round=True, suppressError=True
+        )
+
+    def test_interpolationSession_incompatibleKerning(self):
+        from fontParts.base.interpolation import InterpolationSession
+        minFont = self.getFont_interpolation(0)
+        maxFont = self.getFont_interpolation(100)
+        maxFont.groups["public.kern1.X"] = ["A"]
+        session = InterpolationSession(minFont, maxFont)
+        font, _ = self.objectGenerator("font")
+        session.interpolate(0.5, font)
+        self.assertEqual(
+            len(font.kerning),
+            0
+        )
+        with self.assertRaises(ValueError):
+            session.interpolate(0.5, font, suppressError=False)
+
+    def test_isCompatible_failFast(self):
+        font1 = self.getFont_interpolation(0)
+        font2 = self.getFont_interpolation(100)
+        for layer in font2.layers:
+            for glyph in layer:
+                glyph.clearContours()
+        compatible, report = font1.isCompatible(font2)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.layers), 2)
+        compatible, report = font1.isCompatible(font2, failFast=True)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.layers), 1)
+        self.assertEqual(len(report.layers[0].glyphs), 1)
+
+    def test_isCompatible_afterGlyphChange(self):
+        font1 = self.getFont_interpolation(0)
+        font2 = self.getFont_interpolation(100)
+        self.assertTrue(font1.isCompatible(font2)[0])
+        font2["B"].anchors[0].name = "bottom"
+        compatible, report = font1.isCompatible(font2)
+        self.assertTrue(compatible)
+        self.assertTrue(report.warning)
+        glyphReports = report.layers[0].glyphs
+        self.assertEqual(len(glyphReports), 1)
+        self.assertEqual(glyphReports[0].anchorsMissingFromGlyph2, ["top"])
+        font2["C"].removeContour(0)
+        compatible, report = font1.isCompatible(font2)
+        self.assertFalse(compatible)
+        self.assertTrue(report.layers[0].glyphs[-1].contourCountDifference)
+
     # save
 
     def _saveFontPath(self, ext):
@@ -538,3 +816,391 @@ class TestFont(unittest.TestCase):
                     expectedFileStructure = UFOFileStructure(fileStructure)
                 self.assertEqual(reader.fileStructure, expectedFileStructure)
             self._save(testCases, fileStructure=fileStructure)
+
+    def _fileTimes(self, path, times=None):
+        fileTimes = {}
+        for directory, _, fileNames in os.walk(path):
+            for fileName in fileNames:
+                filePath = os.path.join(directory, fileName)
+                if times is not None:
+                    os.utime(filePath, times)
+                fileTimes[os.path.relpath(filePath, path)] = os.stat(filePath).st_mtime
+        return fileTimes
+
+    def test_save_incremental(self):
+        from fontTools.ufoLib import UFOReader
+
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        font.info.familyName = "Test"
+        font.save(path)
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        font["A"].width = 123
+        font.kerning["A", "B"] = -10
+        font.groups["public.kern1.A"] = ["A"]
+        font.lib["test"] = "incremental"
+        times = self._fileTimes(path, (1000000000, 1000000000))
+        font.save(incremental=True)
+        font.close()
+        glyphFileNames = UFOReader(path).getGlyphSet().contents
+        changed = [
+            fileName for fileName, time in self._fileTimes(path).items()
+            if time != times.get(fileName)
+        ]
+        self.assertIn(os.path.join("glyphs", glyphFileNames["A"]), changed)
+        self.assertIn("kerning.plist", changed)
+        self.assertIn("groups.plist", changed)
+        self.assertIn("lib.plist", changed)
+        for glyphName in "BCD":
+            self.assertNotIn(os.path.join("glyphs", glyphFileNames[glyphName]), changed)
+        self.assertNotIn("fontinfo.plist", changed)
+        font = self.objectGenerator("font")[0].__class__(path)
+        self.assertEqual(font["A"].width, 123)
+        self.assertEqual(font.kerning["A", "B"], -10)
+        self.assertEqual(font.groups["public.kern1.A"], ("A",))
+        self.assertEqual(font.lib["test"], "incremental")
+        self.assertEqual(font.info.familyName, "Test")
+        font.close()
+        self._tearDownPath(path)
+
+    def _fileContents(self, path):
+        contents = {}
+        for directory, _, fileNames in os.walk(path):
+            for fileName in fileNames:
+                filePath = os.path.join(directory, fileName)
+                with open(filePath, "rb") as f:
+                    contents[os.path.relpath(filePath, path)] = f.read()
+        return contents
+
+    def getFont_save(self):
+        font = self.getFont_interpolation(0)
+        glyph = font["A"]
+        glyph.unicodes = [65, 97]
+        glyph.note = "note"
+        glyph.lib["test"] = [1, 2]
+        glyph.appendGuideline((10, 20), 45, "guide")
+        glyph.image.data = testImageData
+        glyph.image.transformation = (2, 0, 0, 2, 10, 20)
+        font.getLayer("background").newGlyph("D")
+        return font
+
+    def test_save_workers(self):
+        serialPath = self._saveFontPath("ufo")
+        parallelPath = self._saveFontPath("ufo")
+        for path, workers in ((serialPath, None), (parallelPath, 2)):
+            font = self.getFont_save()
+            font.save(path, workers=workers)
+            font.close()
+        self.assertEqual(
+            self._fileContents(parallelPath),
+            self._fileContents(serialPath)
+        )
+        self._tearDownPath(serialPath)
+        self._tearDownPath(parallelPath)
+
+    def test_save_workers_inPlace(self):
+        serialPath = self._saveFontPath("ufo")
+        parallelPath = self._saveFontPath("ufo")
+        for path, workers in ((serialPath, None), (parallelPath, 2)):
+            font = self.getFont_save()
+            font.save(path)
+            font["B"].width = 1000
+            font.getLayer("background")["D"].appendAnchor("top", (1, 2))
+            font.getLayer("background").newGlyph("E")
+            font.save(workers=workers)
+            font.close()
+        self.assertEqual(
+            self._fileContents(parallelPath),
+            self._fileContents(serialPath)
+        )
+        self._tearDownPath(serialPath)
+        self._tearDownPath(parallelPath)
+
+    def test_save_atomic(self):
+        path = self._saveFontPath("ufo")
+        font = self.getFont_save()
+        font.save(path, atomic=True)
+        font["A"].width = 123
+        font.save(atomic=True)
+        self.assertEqual(font.path, path)
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["test.ufo"])
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        self.assertEqual(font["A"].width, 123)
+        self.assertEqual(font["A"].note, "note")
+        self.assertEqual(sorted(font.getLayer("background").keys()), ["A", "B", "C", "D"])
+        font.close()
+        self._tearDownPath(path)
+
+    def test_save_atomic_fileStructure(self):
+        path = self._saveFontPath("ufoz")
+        font = self.getFont_save()
+        font.save(path, fileStructure="zip", atomic=True)
+        font["A"].width = 123
+        font.save(atomic=True)
+        self.assertTrue(os.path.isfile(path))
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["test.ufoz"])
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        self.assertEqual(font["A"].width, 123)
+        font.close()
+        self._tearDownPath(path)
+
+    def test_save_atomic_incremental(self):
+        path = self._saveFontPath("ufo")
+        font = self.getFont_save()
+        font.save(path)
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        font["A"].width = 123
+        font.kerning["A", "B"] = -10
+        times = self._fileTimes(path, (1000000000, 1000000000))
+        font.save(incremental=True, atomic=True)
+        changed = [
+            fileName for fileName, time in self._fileTimes(path).items()
+            if time != times.get(fileName)
+        ]
+        self.assertEqual(
+            sorted(changed),
+            [os.path.join("glyphs", "A_.glif"), "kerning.plist"]
+        )
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["test.ufo"])
+        self.assertEqual(font["B"].width, 600)
+        font["B"].width = 456
+        font.save(atomic=True)
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        self.assertEqual(font["A"].width, 123)
+        self.assertEqual(font["B"].width, 456)
+        self.assertEqual(font.kerning["A", "B"], -10)
+        font.close()
+        self._tearDownPath(path)
+
+    def test_saveAsync(self):
+        import asyncio
+
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        asyncio.run(font.saveAsync(path))
+        self.assertEqual(font.path, path)
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        self.assertEqual(sorted(font.keys()), ["A", "B", "C", "D"])
+        font.close()
+        self._tearDownPath(path)
+
+    def test_saveAsync_cancelled(self):
+        import asyncio
+        import threading
+        from fontParts.base.base import runAsync, setAsyncWorkers
+
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        event = threading.Event()
+
+        async def saveCancelled():
+            blocker = asyncio.ensure_future(runAsync(event.wait, 5))
+            save = asyncio.ensure_future(font.saveAsync(path))
+            await asyncio.sleep(0)
+            save.cancel()
+            # Let the cancellation reach the executor
+            # before the blocking call frees the thread.
+            await asyncio.sleep(0)
+            event.set()
+            await blocker
+            with self.assertRaises(asyncio.CancelledError):
+                await save
+
+        setAsyncWorkers(1)
+        try:
+            asyncio.run(saveCancelled())
+        finally:
+            setAsyncWorkers(None)
+        self.assertFalse(os.path.exists(path))
+        self._tearDownPath(os.path.dirname(path))
+
+    def test_saveAsync_sameFont(self):
+        import asyncio
+        import time
+        from fontParts.base.base import setAsyncWorkers
+
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        other = font.__class__(font.naked())
+        saving = []
+        overlaps = []
+        save = font._save
+
+        def _save(**kwargs):
+            saving.append(True)
+            overlaps.append(len(saving) > 1)
+            time.sleep(0.05)
+            save(**kwargs)
+            saving.pop()
+
+        font._save = other._save = _save
+
+        async def saveTwice():
+            await asyncio.gather(font.saveAsync(path), other.saveAsync(path))
+
+        setAsyncWorkers(2)
+        try:
+            asyncio.run(saveTwice())
+        finally:
+            setAsyncWorkers(None)
+        self.assertEqual(overlaps, [False, False])
+        font.close()
+        self._tearDownPath(path)
+
+    def test_saveAsync_context(self):
+        import asyncio
+        from fontParts.base.base import _sharedProcessPool, sharedProcessPool
+
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        pools = []
+        save = font._save
+
+        def _save(**kwargs):
+            pools.append(_sharedProcessPool.get())
+            save(**kwargs)
+
+        font._save = _save
+
+        async def saveInPool():
+            with sharedProcessPool(2):
+                await font.saveAsync(path)
+                return _sharedProcessPool.get()
+
+        pool = asyncio.run(saveInPool())
+        self.assertIsNotNone(pool)
+        self.assertEqual(pools, [pool])
+        font.close()
+        self._tearDownPath(path)
+
+    def test_setAsyncWorkers_queuedCalls(self):
+        import asyncio
+        import threading
+        from fontParts.base.base import runAsync, setAsyncWorkers
+
+        event = threading.Event()
+
+        async def replaceWhileQueued():
+            blocker = asyncio.ensure_future(runAsync(event.wait, 5))
+            queued = asyncio.ensure_future(runAsync(lambda: "queued"))
+            await asyncio.sleep(0)
+            setAsyncWorkers(2)
+            later = await runAsync(lambda: "later")
+            event.set()
+            await blocker
+            return await queued, later
+
+        setAsyncWorkers(1)
+        try:
+            self.assertEqual(
+                asyncio.run(replaceWhileQueued()),
+                ("queued", "later")
+            )
+        finally:
+            setAsyncWorkers(None)
+
+    def test_generateAsync_noFormat(self):
+        import asyncio
+
+        font = self.getFont_glyphs()
+        with self.assertRaises(ValueError):
+            asyncio.run(font.generateAsync(None))
+
+    def test_save_incremental_newPath(self):
+        def testCases(path):
+            font = self.objectGenerator("font")[0].__class__(path)
+            self.assertEqual(sorted(font.keys()), ["A", "B", "C", "D"])
+        self._save(testCases, incremental=True)
+
+    def test_save_incremental_unchanged(self):
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        font.save(path)
+        font.close()
+        font = self.objectGenerator("font")[0].__class__(path)
+        font["A"]
+        times = self._fileTimes(path, (1000000000, 1000000000))
+        os.utime(path, (1000000000, 1000000000))
+        font.save(incremental=True)
+        self.assertEqual(self._fileTimes(path), times)
+        self.assertEqual(os.stat(path).st_mtime, 1000000000)
+        font["A"].width = 123
+        font.save(incremental=True)
+        self.assertNotEqual(os.stat(path).st_mtime, 1000000000)
+        font.close()
+        self._tearDownPath(path)
+
+    def test_save_incremental_invalid(self):
+        path = self._saveFontPath("ufo")
+        font = self.getFont_glyphs()
+        with self.assertRaises(ValueError):
+            font.save(path, incremental="yes")
+        with self.assertRaises(ValueError):
+            font.save(path, atomic="yes")
+        self.assertFalse(os.path.exists(path))
+        self._tearDownPath(os.path.dirname(path))
+
+    # open
+
+    def _openFontPath(self):
+        path = self._saveFontPath("ufo")
+        font = self.getFont_interpolation(0)
+        font.save(path)
+        font.close()
+        return path
+
+    def _dumpFont(self, font):
+        return {
+            (layer.name, glyph.name): glyph.dumpToGLIF()
+            for layer in font.layers
+            for glyph in layer
+        }
+
+    def test_open_lazy(self):
+        path = self._openFontPath()
+        font = self.objectGenerator("font")[0].__class__(path)
+        lazyFont = font.__class__(path, lazy=True)
+        self.assertEqual(lazyFont.layerOrder, font.layerOrder)
+        self.assertEqual(sorted(lazyFont.keys()), sorted(font.keys()))
+        self.assertEqual(self._dumpFont(lazyFont), self._dumpFont(font))
+        self._tearDownPath(path)
+
+    # preload
+
+    def test_preload(self):
+        path = self._openFontPath()
+        font = self.objectGenerator("font")[0].__class__(path)
+        lazyFont = font.__class__(path, lazy=True)
+        lazyFont.preload(["A", "B", "X"])
+        self.assertEqual(self._dumpFont(lazyFont), self._dumpFont(font))
+        self._tearDownPath(path)
+
+    def test_preload_all(self):
+        path = self._openFontPath()
+        font = self.objectGenerator("font")[0].__class__(path)
+        lazyFont = font.__class__(path, lazy=True)
+        lazyFont.preload()
+        self.assertEqual(self._dumpFont(lazyFont), self._dumpFont(font))
+        self._tearDownPath(path)
+
+    def test_preload_workers(self):
+        path = self._openFontPath()
+        font = self.objectGenerator("font")[0].__class__(path)
+        lazyFont = font.__class__(path, lazy=True)
+        lazyFont["A"].width = 1000
+        lazyFont.preload(workers=2)
+        self.assertEqual(lazyFont["A"].width, 1000)
+        lazyFont["A"].width = font["A"].width
+        self.assertEqual(self._dumpFont(lazyFont), self._dumpFont(font))
+        self._tearDownPath(path)
+
+    def test_preload_invalidWorkers(self):
+        font = self.getFont_glyphs()
+        with self.assertRaises(ValueError):
+            font.preload(workers=0)
@@ -1,8 +1,14 @@
 import unittest
 import collections
+from unittest import mock
 from fontParts.base import FontPartsError
 from .test_image import testImageData
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestGlyph(unittest.TestCase):
 
@@ -442,6 +448,51 @@ class TestGlyph(unittest.TestCase):
         glyph.clearContours()
         self.assertEqual(len(glyph), 0)
 
+    # -----------
+    # Coordinates
+    # -----------
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_coordinates(self):
+        glyph = self.getGlyph_generic()
+        coordinates = glyph.coordinates
+        self.assertEqual(coordinates.shape, (8, 2))
+        self.assertEqual(
+            coordinates[:4].tolist(),
+            glyph.contours[0].coordinates.tolist()
+        )
+        self.assertEqual(
+            coordinates[4:].tolist(),
+            glyph.contours[1].coordinates.tolist()
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_coordinates_empty(self):
+        glyph = self.get_generic_object("glyph")
+        self.assertEqual(glyph.coordinates.shape, (0, 2))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates(self):
+        glyph = self.getGlyph_generic()
+        expected = (glyph.coordinates + (10, 20)).tolist()
+        glyph.coordinates = glyph.coordinates + (10, 20)
+        self.assertEqual(glyph.coordinates.tolist(), expected)
+        self.assertEqual(glyph.contours[1].points[0].position, (120, 30))
+        self.assertEqual(glyph.anchors[0].position, (1, 2))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_set_coordinates_wrongCount(self):
+        glyph = self.getGlyph_generic()
+        with self.assertRaises(ValueError):
+            glyph.coordinates = glyph.coordinates[:4]
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_pointTypes(self):
+        glyph = self.getGlyph_generic()
+        pointTypes = glyph.pointTypes
+        self.assertEqual(len(pointTypes), 8)
+        self.assertEqual(set(pointTypes.tolist()), {"line"})
+
     # ----------
     # Components
     # ----------
@@ -1148,6 +1199,43 @@ class TestGlyph(unittest.TestCase):
         self.assertEqual(report.componentsMissingFromGlyph1, ["a", "b"])
         self.assertEqual(report.componentsMissingFromGlyph2, ["x", "y"])
 
+    def test_getCompatibilityData(self):
+        glyph1 = self.getGlyph_generic()
+        glyph2 = self.getGlyph_generic()
+        glyph2.moveBy((10, 20))
+        self.assertEqual(
+            glyph1._getCompatibilityData(),
+            glyph2._getCompatibilityData()
+        )
+
+    def test_getCompatibilityData_different(self):
+        glyph1 = self.getGlyph_generic()
+        glyph2 = self.getGlyph_generic()
+        glyph2.removeContour(0)
+        self.assertNotEqual(
+            glyph1._getCompatibilityData(),
+            glyph2._getCompatibilityData()
+        )
+
+    def test_getCompatibilityData_afterChange(self):
+        glyph = self.getGlyph_generic()
+        before = glyph._getCompatibilityData()
+        glyph.appendAnchor("top", (0, 0))
+        after = glyph._getCompatibilityData()
+        self.assertNotEqual(before, after)
+        self.assertEqual(after[2][-1], "top")
+        glyph.anchors[-1].name = "bottom"
+        self.assertEqual(glyph._getCompatibilityData()[2][-1], "bottom")
+
+    def test_isCompatible_afterChange(self):
+        glyph1 = self.getGlyph_generic()
+        glyph2 = self.getGlyph_generic()
+        self.assertTrue(glyph1.isCompatible(glyph2)[0])
+        glyph2.removeContour(0)
+        is_compatible, report = glyph1.isCompatible(glyph2)
+        self.assertFalse(is_compatible)
+        self.assertTrue(report.contourCountDifference)
+
     # -------------
     # Interpolation
     # -------------
@@ -1193,6 +1281,186 @@ class TestGlyph(unittest.TestCase):
             240
         )
 
+    # --------------
+    # Geometry Cache
+    # --------------
+
+    def test_bounds_afterMoveBy_inFont(self):
+        glyph = self.getGlyph_inFont()
+        self.assertEqual(
+            glyph.bounds,
+            (100, -10, 200, 100)
+        )
+        glyph.contours[0].points[0].x = 50
+        self.assertEqual(
+            glyph.bounds,
+            (50, -10, 200, 100)
+        )
+
+    def test_bounds_types(self):
+        for glyph in (self.getGlyph_generic(), self.getGlyph_inFont()):
+            for _ in range(2):
+                bounds = glyph.bounds
+                self.assertEqual(bounds, (100, -10, 200, 100))
+                self.assertEqual([type(value) for value in bounds], [int] * 4)
+
+    def test_bounds_sharedByWrappers(self):
+        glyph = self.getGlyph_inFont()
+        if glyph._getChangeToken() is None:
+            self.skipTest("The environment can't track changes.")
+        getBounds = glyph.__class__._get_bounds
+        with mock.patch.object(glyph.__class__, "_get_bounds", autospec=True,
+                               side_effect=getBounds) as patched:
+            glyph.bounds
+            otherGlyph = glyph.font[glyph.name]
+            self.assertEqual(
+                otherGlyph.bounds,
+                (100, -10, 200, 100)
+            )
+        self.assertEqual(
+            patched.call_count,
+            1
+        )
+
+    def test_leftMargin_normalized(self):
+        glyph = self.getGlyph_inFont()
+        with mock.patch("fontParts.base.normalizers.normalizeGlyphLeftMargin",
+                        side_effect=lambda value: value + 0.5):
+            for _ in range(2):
+                self.assertEqual(
+                    glyph.leftMargin,
+                    100.5
+                )
+
+    def test_margins_afterWidth_inFont(self):
+        glyph = self.getGlyph_inFont()
+        self.assertEqual(
+            glyph.rightMargin,
+            50
+        )
+        glyph.width = 300
+        self.assertEqual(
+            glyph.rightMargin,
+            100
+        )
+        glyph.leftMargin = 50
+        self.assertEqual(
+            (glyph.leftMargin, glyph.rightMargin, glyph.width),
+            (50, 100, 250)
+        )
+
+    def test_area_afterRemoveContour_inFont(self):
+        glyph = self.getGlyph_inFont()
+        self.assertEqual(
+            glyph.area,
+            16900
+        )
+        glyph.removeContour(1)
+        self.assertEqual(
+            glyph.area,
+            10500
+        )
+
+    # ------------
+    # Hold Changes
+    # ------------
+
+    def getGlyph_inFont(self):
+        font, _ = self.objectGenerator("font")
+        glyph = self.getGlyph_generic()
+        glyph.name = "A"
+        font["A"] = glyph
+        return font["A"]
+
+    def test_holdChanges(self):
+        glyph = self.getGlyph_inFont()
+        with glyph.holdChanges():
+            glyph.moveBy((100, 0))
+            glyph.width = 300
+        self.assertEqual(
+            glyph.bounds,
+            (200, -10, 300, 100)
+        )
+        self.assertEqual(
+            glyph.width,
+            300
+        )
+
+    def test_holdChanges_nested(self):
+        glyph = self.getGlyph_inFont()
+        with glyph.font.holdChanges():
+            with glyph.holdChanges():
+                glyph.moveBy((100, 0))
+            glyph.moveBy((0, 10))
+        self.assertEqual(
+            glyph.bounds,
+            (200, 0, 300, 110)
+        )
+
+    def test_holdChanges_exception(self):
+        glyph = self.getGlyph_inFont()
+        with self.assertRaises(ValueError):
+            with glyph.holdChanges():
+                glyph.moveBy((100, 0))
+                raise ValueError
+        self.assertEqual(
+            glyph.bounds,
+            (200, -10, 300, 100)
+        )
+        glyph.moveBy((100, 0))
+        self.assertEqual(
+            glyph.bounds,
+            (300, -10, 400, 100)
+        )
+
+    def test_holdChanges_notInFont(self):
+        glyph = self.getGlyph_generic()
+        with glyph.holdChanges():
+            glyph.moveBy((100, 0))
+        self.assertEqual(
+            glyph.bounds,
+            (200, -10, 300, 100)
+        )
+
+    def test_holdChanges_boundsInside(self):
+        glyph = self.getGlyph_inFont()
+        with glyph.holdChanges():
+            glyph.moveBy((50, 0))
+            self.assertEqual(
+                glyph.bounds,
+                (150, -10, 250, 100)
+            )
+
+    def test_holdChanges_leftMarginInside(self):
+        glyph = self.getGlyph_inFont()
+        with glyph.holdChanges():
+            glyph.moveBy((50, 0))
+            glyph.leftMargin = 10
+            self.assertEqual(
+                glyph.leftMargin,
+                10
+            )
+        self.assertEqual(
+            glyph.leftMargin,
+            10
+        )
+
+    def test_holdChanges_renameInside(self):
+        glyph = self.getGlyph_inFont()
+        font = glyph.font
+        with glyph.holdChanges():
+            glyph.name = "B"
+            self.assertIn("B", font)
+            self.assertNotIn("A", font)
+            self.assertEqual(
+                font["B"].bounds,
+                (100, -10, 200, 100)
+            )
+        self.assertEqual(
+            list(font.keys()),
+            ["B"]
+        )
+
     # ---
     # API
     # ---
@@ -152,6 +152,51 @@ class TestGroups(unittest.TestCase):
         with self.assertRaises(TypeError):
             groups.findGlyph(5)
 
+    def getGroups_inFont(self):
+        font, _ = self.objectGenerator("font")
+        groups = font.groups
+        groups.update(self.getGroups_generic())
+        return groups
+
+    def test_find_afterSet(self):
+        groups = self.getGroups_inFont()
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 1", "group 4"])
+        groups["group 1"] = ["B"]
+        groups["group 5"] = ["A", "x"]
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 4", "group 5"])
+        self.assertEqual(sorted(groups.findGlyph("x")), ["group 2", "group 5"])
+        self.assertEqual(groups.findGlyph("B"), ["group 1"])
+
+    def test_find_afterDelete(self):
+        groups = self.getGroups_inFont()
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 1", "group 4"])
+        del groups["group 4"]
+        self.assertEqual(groups.findGlyph("A"), ["group 1"])
+        groups.pop("group 1")
+        self.assertEqual(groups.findGlyph("A"), [])
+
+    def test_find_afterUpdate(self):
+        groups = self.getGroups_inFont()
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 1", "group 4"])
+        groups.update({"group 4": ["B"], "group 2": ["A"]})
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 1", "group 2"])
+        self.assertEqual(groups.findGlyph("x"), [])
+
+    def test_find_afterClear(self):
+        groups = self.getGroups_inFont()
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 1", "group 4"])
+        groups.clear()
+        self.assertEqual(groups.findGlyph("A"), [])
+
+    def test_find_afterChangeInOtherObject(self):
+        groups = self.getGroups_inFont()
+        self.assertEqual(sorted(groups.findGlyph("A")), ["group 1", "group 4"])
+        groups.font.groups["group 2"] = ["A"]
+        self.assertEqual(
+            sorted(groups.findGlyph("A")),
+            ["group 1", "group 2", "group 4"]
+        )
+
     def test_contains_found(self):
         groups = self.getGroups_generic()
         self.assertTrue("group 4" in groups)
@@ -196,6 +241,19 @@ class TestGroups(unittest.TestCase):
         self.assertEqual(groups.side1KerningGroups, expected)
         # self.assertEqual(super(groups, self)._get_side1KerningGroups(), expected)
 
+    def test_side1KerningGroups_insideHoldChanges(self):
+        font, _ = self.objectGenerator("font")
+        groups = font.groups
+        groups.update(self.getGroups_kerning())
+        with groups.holdChanges():
+            groups.side1KerningGroups
+            groups["public.kern1.A"] = ["A"]
+            expected = {
+                "public.kern1.A": ("A",),
+                "public.kern1.O": ("O", "D")
+            }
+            self.assertEqual(groups.side1KerningGroups, expected)
+
     def test_get_side1KerningGroups(self):
         groups = self.getGroups_kerning()
         expected = {
@@ -213,6 +271,19 @@ class TestGroups(unittest.TestCase):
         }
         self.assertEqual(groups.side2KerningGroups, expected)
 
+    def test_side1KerningGroups_afterSet(self):
+        font, _ = self.objectGenerator("font")
+        groups = font.groups
+        groups.update(self.getGroups_kerning())
+        side1KerningGroups = groups.side1KerningGroups
+        side1KerningGroups["public.kern1.X"] = ("X",)
+        groups["public.kern1.A"] = ["A"]
+        expected = {
+            "public.kern1.A": ("A",),
+            "public.kern1.O": ("O", "D")
+        }
+        self.assertEqual(groups.side1KerningGroups, expected)
+
     def test_get_side2KerningGroups(self):
         groups = self.getGroups_kerning()
         expected = {
@@ -1,5 +1,14 @@
 import unittest
 import collections
+import math
+from unittest import mock
+from fontParts.base import kerning as baseKerning
+from fontParts.base.kerning import BaseKerning, KerningMatrix
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestKerning(unittest.TestCase):
@@ -102,6 +111,35 @@ class TestKerning(unittest.TestCase):
             False
         )
 
+    # ----
+    # iter
+    # ----
+
+    def test_iter(self):
+        kerning = self.getKerning_generic()
+        self.assertEqual(
+            sorted(kerning),
+            sorted(kerning.keys())
+        )
+
+    def test_iter_isGenerator(self):
+        kerning = self.getKerning_generic()
+        iterator = iter(kerning)
+        self.assertEqual(
+            iter(iterator),
+            iterator
+        )
+        self.assertIsInstance(next(iterator), tuple)
+
+    def test_iter_remove(self):
+        kerning = self.getKerning_generic()
+        for pair in kerning:
+            del kerning[pair]
+        self.assertEqual(
+            len(kerning),
+            0
+        )
+
     # ---
     # get
     # ---
@@ -227,6 +265,233 @@ class TestKerning(unittest.TestCase):
             100
         )
 
+    def test_find_default(self):
+        kerning = self.getKerning_generic()
+        self.assertEqual(
+            kerning.find(('D', 'D'), 0),
+            0
+        )
+
+    def test_find_afterKerningChange(self):
+        kerning = self.getKerning_generic()
+        self.assertEqual(
+            kerning.find(('C', 'C')),
+            100
+        )
+        kerning[("public.kern1.X", "public.kern2.X")] = 50
+        self.assertEqual(
+            kerning.find(('C', 'C')),
+            50
+        )
+
+    def test_find_afterGroupsChange(self):
+        kerning = self.getKerning_generic()
+        self.assertEqual(
+            kerning.find(('C', 'C')),
+            100
+        )
+        kerning.font.groups["public.kern1.X"] = ["A", "B"]
+        self.assertEqual(
+            kerning.find(('C', 'C')),
+            None
+        )
+
+    def test_findMany(self):
+        kerning = self.getKerning_generic()
+        self.assertEqual(
+            kerning.findMany([('A', 'A'), ('A', 'B'), ('D', 'D'), ('C', 'C')]),
+            [103, 102, None, 100]
+        )
+
+    def test_findMany_default(self):
+        kerning = self.getKerning_generic()
+        self.assertEqual(
+            kerning.findMany([('D', 'D'), ('B', 'B')], 0),
+            [0, 101]
+        )
+
+    def test_findMany_invalid(self):
+        kerning = self.getKerning_generic()
+        with self.assertRaises(TypeError):
+            kerning.findMany([('A', 1)])
+
+    def test_findMany_cacheSize(self):
+        kerning = self.getKerning_generic()
+        pairs = [('A', 'A'), ('A', 'B'), ('D', 'D'), ('C', 'C')]
+        with mock.patch.object(baseKerning, "_findCacheSize", 2):
+            self.assertEqual(
+                kerning.findMany(pairs),
+                [103, 102, None, 100]
+            )
+            self.assertEqual(
+                kerning.findMany(pairs),
+                [103, 102, None, 100]
+            )
+            if kerning._findCache is not None:
+                self.assertLessEqual(len(kerning._findCache[1]), 2)
+
+    def test_findMany_cacheEviction(self):
+        kerning = self.getKerning_generic()
+        if kerning._getChangeToken() is None:
+            self.skipTest("The environment can't track changes.")
+        find = kerning.__class__._find
+        with mock.patch.object(baseKerning, "_findCacheSize", 2), \
+                mock.patch.object(kerning.__class__, "_find", autospec=True,
+                                  side_effect=find) as patched:
+            kerning.findMany([('A', 'A'), ('A', 'B')])
+            # ('A', 'A') is used again, so ('A', 'B') is the
+            # least recently used pair when ('C', 'C') is added.
+            kerning.findMany([('A', 'A'), ('C', 'C')])
+            self.assertEqual(
+                list(kerning._findCache[1]),
+                [('A', 'A'), ('C', 'C')]
+            )
+            patched.reset_mock()
+            self.assertEqual(
+                kerning.findMany([('A', 'A'), ('C', 'C'), ('A', 'B')]),
+                [103, 100, 102]
+            )
+            self.assertEqual(
+                [call.args[1] for call in patched.call_args_list],
+                [('A', 'B')]
+            )
+
+    def test_find_base(self):
+        kerning = self.getKerning_generic()
+        pairs = [
+            (('A', 'A'), 103),
+            (('A', 'B'), 102),
+            (('B', 'B'), 101),
+            (('C', 'C'), 100),
+            (('public.kern1.X', 'C'), 100),
+            (('C', 'public.kern2.X'), 100),
+            (('D', 'D'), 0)
+        ]
+        for pair, value in pairs:
+            self.assertEqual(BaseKerning._find(kerning, pair, 0), value)
+
+    # --------------
+    # Transformation
+    # --------------
+
+    def test_scaleBy(self):
+        kerning = self.getKerning_generic()
+        kerning.scaleBy(1.5)
+        self.assertEqual(
+            sorted(kerning.items()),
+            [(("A", "A"), 154.5),
+             (("B", "public.kern2.X"), 151.5),
+             (("public.kern1.X", "B"), 153),
+             (("public.kern1.X", "public.kern2.X"), 150)]
+        )
+
+    def test_round(self):
+        kerning = self.getKerning_generic()
+        kerning.round(5)
+        self.assertEqual(
+            sorted(kerning.items()),
+            [(("A", "A"), 105),
+             (("B", "public.kern2.X"), 100),
+             (("public.kern1.X", "B"), 100),
+             (("public.kern1.X", "public.kern2.X"), 100)]
+        )
+
+    # ------
+    # Matrix
+    # ------
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_asMatrix(self):
+        kerning = self.getKerning_generic()
+        kerning[("public.kern1.Y", "A")] = 5
+        kerning.font.groups["public.kern1.Y"] = ["D"]
+        kerning[("public.kern1.Y", "public.kern2.X")] = 6
+        matrix = kerning.asMatrix()
+        self.assertIsInstance(matrix, KerningMatrix)
+        self.assertEqual(
+            matrix.side1Groups,
+            ("public.kern1.X", "public.kern1.Y")
+        )
+        self.assertEqual(matrix.side2Groups, ("public.kern2.X",))
+        self.assertEqual(matrix.groupValues.tolist(), [[100], [6]])
+        self.assertEqual(
+            sorted(zip(matrix.exceptionPairs, matrix.exceptionValues)),
+            [(("A", "A"), 103),
+             (("B", "public.kern2.X"), 101),
+             (("public.kern1.X", "B"), 102),
+             (("public.kern1.Y", "A"), 5)]
+        )
+        self.assertEqual(len(matrix), 6)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_asMatrix_missingGroupPair(self):
+        kerning = self.getKerning_generic()
+        kerning[("public.kern1.Y", "public.kern2.Y")] = 6
+        matrix = kerning.asMatrix()
+        self.assertEqual(matrix.groupValues.shape, (2, 2))
+        self.assertTrue(math.isnan(matrix.groupValues[0, 1]))
+        self.assertEqual(len(matrix), 5)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_asMatrix_isCopy(self):
+        kerning = self.getKerning_generic()
+        matrix = kerning.asMatrix()
+        matrix.scaleBy(2)
+        self.assertEqual(kerning[("A", "A")], 103)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_fromMatrix(self):
+        kerning = self.getKerning_generic()
+        other = self.getKerning_font2()
+        other.fromMatrix(kerning.asMatrix())
+        self.assertEqual(
+            sorted(other.items()),
+            sorted(kerning.items())
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_fromMatrix_replaces(self):
+        kerning = self.getKerning_generic()
+        kerning.fromMatrix(KerningMatrix.fromItems([(("A", "B"), 1)]))
+        self.assertEqual(kerning.items(), [(("A", "B"), 1)])
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_fromMatrix_invalid(self):
+        kerning = self.getKerning_generic()
+        with self.assertRaises(TypeError):
+            kerning.fromMatrix({("A", "B"): 1})
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_matrix_scaleBy(self):
+        matrix = self.getKerning_generic().asMatrix()
+        matrix.scaleBy(0.5)
+        self.assertEqual(
+            dict(matrix.items()),
+            {("public.kern1.X", "public.kern2.X"): 50,
+             ("B", "public.kern2.X"): 50.5,
+             ("public.kern1.X", "B"): 51,
+             ("A", "A"): 51.5}
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_matrix_round(self):
+        matrix = self.getKerning_generic().asMatrix()
+        matrix.round(10)
+        self.assertEqual(
+            sorted(matrix.items()),
+            [(("A", "A"), 100),
+             (("B", "public.kern2.X"), 100),
+             (("public.kern1.X", "B"), 100),
+             (("public.kern1.X", "public.kern2.X"), 100)]
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_matrix_invalidValues(self):
+        with self.assertRaises(ValueError):
+            KerningMatrix(("public.kern1.X",), ("public.kern2.X",), [1, 2])
+        with self.assertRaises(ValueError):
+            KerningMatrix(exceptionPairs=[("A", "B")], exceptionValues=[])
+
     # ----
     # Hash
     # ----
@@ -299,3 +564,100 @@ class TestKerning(unittest.TestCase):
             interpolated[("public.kern1.X", "public.kern2.X")],
             152
         )
+
+    def test_interpolation_missingPair(self):
+        interpolated = self.getKerning_generic()
+        kerning_min = self.getKerning_generic()
+        kerning_max = self.getKerning_font2()
+        del kerning_max[("A", "A")]
+        interpolated.interpolate(0.5, kerning_min, kerning_max, round=False)
+        self.assertEqual(
+            interpolated[("A", "A")],
+            151.5
+        )
+
+    def test_interpolation_removesZeroPairs(self):
+        interpolated = self.getKerning_generic()
+        kerning_min = self.getKerning_generic()
+        kerning_min[("D", "D")] = -10
+        kerning_max = self.getKerning_font2()
+        kerning_max[("D", "D")] = 10
+        interpolated.interpolate(0.5, kerning_min, kerning_max)
+        self.assertNotIn(("D", "D"), interpolated)
+        self.assertEqual(len(interpolated), 4)
+
+    def test_interpolation_keepsZeroExceptions(self):
+        interpolated = self.getKerning_generic()
+        kerning_min = self.getKerning_generic()
+        kerning_min[("A", "D")] = -10
+        kerning_max = self.getKerning_font2()
+        kerning_max[("A", "D")] = 10
+        interpolated.interpolate(0.5, kerning_min, kerning_max)
+        self.assertEqual(interpolated[("A", "D")], 0)
+
+    def getKerning_parity(self, pairs):
+        font, _ = self.objectGenerator("font")
+        font.groups.update({
+            "public.kern1.O": ["O", "D", "Q"],
+            "public.kern2.O": ["O", "C"],
+            "public.kern1.A": ["A"],
+            "public.kern2.V": ["V", "W"]
+        })
+        font.kerning.update(pairs)
+        return font.kerning
+
+    def test_interpolation_fontMathParity(self):
+        import fontMath
+
+        # Group pairs, exceptions, zero exceptions and
+        # pairs that are only in one of the masters.
+        kerning_min = self.getKerning_parity({
+            ("public.kern1.O", "public.kern2.O"): -10,
+            ("O", "public.kern2.O"): -20,
+            ("public.kern1.O", "C"): 0,
+            ("A", "V"): -30,
+            ("T", "a"): -40,
+            ("public.kern1.A", "public.kern2.V"): -50
+        })
+        kerning_max = self.getKerning_parity({
+            ("public.kern1.O", "public.kern2.O"): -30,
+            ("Q", "public.kern2.O"): -5,
+            ("T", "a"): -40,
+            ("T", "o"): -15,
+            ("public.kern1.A", "public.kern2.V"): -70,
+            ("D", "C"): 10
+        })
+        math_min = fontMath.MathKerning(kerning_min.asDict(),
+                                        kerning_min.font.groups.asDict())
+        math_max = fontMath.MathKerning(kerning_max.asDict(),
+                                        kerning_max.font.groups.asDict())
+        for factor in (0, 0.25, 0.5, 1, 1.5):
+            expected = math_min + (math_max - math_min) * factor
+            expectedKerning = {}
+            for pair in expected.keys():
+                expectedKerning[pair] = expected[pair]
+            interpolated = self.getKerning_parity({})
+            interpolated.interpolate(factor, kerning_min, kerning_max,
+                                     round=False)
+            self.assertEqual(
+                interpolated.asDict(returnIntegers=False),
+                expectedKerning
+            )
+            self.assertEqual(
+                baseKerning._interpolateKerning(
+                    factor, kerning_min.asDict(), kerning_max.asDict(),
+                    kerning_min.font.groups._getKerningGroupIndex()
+                ),
+                expectedKerning
+            )
+
+    def test_interpolation_incompatibleGroups(self):
+        interpolated = self.getKerning_generic()
+        kerning_min = self.getKerning_generic()
+        kerning_max = self.getKerning_font2()
+        kerning_max.font.groups["public.kern1.X"] = ["A"]
+        with self.assertRaises(ValueError):
+            interpolated.interpolate(0.5, kerning_min, kerning_max,
+                                     suppressError=False)
+        interpolated.interpolate(0.5, kerning_min, kerning_max)
+        self.assertEqual(len(interpolated), 0)
@@ -1,5 +1,6 @@
 import unittest
 import collections
+from fontParts.base import FontPartsError
 
 
 class TestLayer(unittest.TestCase):
@@ -57,6 +58,258 @@ class TestLayer(unittest.TestCase):
         with self.assertRaises(KeyError):
             layer["E"]
 
+    # --------------
+    # Transformation
+    # --------------
+
+    def getLayer_outlines(self):
+        layer, _ = self.objectGenerator("layer")
+        for name in "AB":
+            glyph = layer.newGlyph(name)
+            pen = glyph.getPen()
+            pen.moveTo((100, 0))
+            pen.lineTo((100, 500))
+            pen.lineTo((500, 500))
+            pen.closePath()
+            glyph.appendAnchor("top", (300, 500))
+            glyph.width = 600
+        return layer
+
+    def test_transformBy(self):
+        layer = self.getLayer_outlines()
+        layer.transformBy((2, 0, 0, 3, 10, 20))
+        for glyph in layer:
+            self.assertEqual(
+                glyph.bounds,
+                (210, 20, 1010, 1520)
+            )
+            self.assertEqual(
+                (glyph.anchors[0].x, glyph.anchors[0].y),
+                (610, 1520)
+            )
+            self.assertEqual(
+                glyph.width,
+                600
+            )
+
+    def test_moveBy(self):
+        layer = self.getLayer_outlines()
+        layer.moveBy((10, -10))
+        for glyph in layer:
+            self.assertEqual(
+                glyph.bounds,
+                (110, -10, 510, 490)
+            )
+
+    def test_scaleBy_origin(self):
+        layer = self.getLayer_outlines()
+        layer.scaleBy(2, origin=(100, 0))
+        for glyph in layer:
+            self.assertEqual(
+                glyph.bounds,
+                (100, 0, 900, 1000)
+            )
+
+    # -------------
+    # Interpolation
+    # -------------
+
+    def getLayer_interpolation(self, offset, contours=1):
+        layer, _ = self.objectGenerator("layer")
+        for name in "ABC":
+            glyph = layer.newGlyph(name)
+            pen = glyph.getPen()
+            for i in range(contours):
+                pen.moveTo((100, 0))
+                pen.lineTo((100, 500 + offset))
+                pen.lineTo((500 + offset, 500))
+                pen.closePath()
+            glyph.width = 600 + offset
+        return layer
+
+    # -------------
+    # Compatibility
+    # -------------
+
+    def test_isCompatible(self):
+        layer1 = self.getLayer_interpolation(0)
+        layer2 = self.getLayer_interpolation(100)
+        compatible, report = layer1.isCompatible(layer2)
+        self.assertTrue(compatible)
+        self.assertEqual(report.glyphs, [])
+
+    def test_isCompatible_failFast(self):
+        layer1 = self.getLayer_interpolation(0)
+        layer2 = self.getLayer_interpolation(100, contours=2)
+        compatible, report = layer1.isCompatible(layer2)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.glyphs), 3)
+        compatible, report = layer1.isCompatible(layer2, failFast=True)
+        self.assertFalse(compatible)
+        self.assertEqual(len(report.glyphs), 1)
+
+    # ----
+    # GLIF
+    # ----
+
+    def getLayer_glif(self):
+        layer, _ = self.objectGenerator("layer")
+        for i, name in enumerate("ABCD"):
+            glyph = layer.newGlyph(name)
+            glyph.width = 100 * i
+            glyph.unicodes = [65 + i]
+            pen = glyph.getPen()
+            pen.moveTo((0, 0))
+            pen.lineTo((i, 100))
+            pen.curveTo((10, 20), (30, 40), (50, 0))
+            pen.closePath()
+            glyph.appendAnchor("top", (i, 100))
+            glyph.lib["index"] = i
+        return layer
+
+    def test_dumpToGLIFs(self):
+        layer = self.getLayer_glif()
+        glifs = layer.dumpToGLIFs()
+        self.assertEqual(
+            glifs,
+            {glyph.name: glyph.dumpToGLIF() for glyph in layer}
+        )
+
+    def test_dumpToGLIFs_workers(self):
+        layer = self.getLayer_glif()
+        self.assertEqual(
+            layer.dumpToGLIFs(["D", "A"], glyphFormatVersion=1, workers=2),
+            {name: layer[name].dumpToGLIF(1) for name in ["D", "A"]}
+        )
+
+    def test_dumpToGLIFs_missing(self):
+        layer = self.getLayer_glif()
+        with self.assertRaises(KeyError):
+            layer.dumpToGLIFs(["A", "X"])
+
+    def test_iterDumpToGLIFs(self):
+        layer = self.getLayer_glif()
+        glifs = layer.iterDumpToGLIFs(["C", "A", "B"], workers=2)
+        self.assertFalse(isinstance(glifs, (list, tuple, dict)))
+        self.assertEqual(
+            list(glifs),
+            [(name, layer[name].dumpToGLIF()) for name in ["C", "A", "B"]]
+        )
+
+    def test_loadFromGLIFs(self):
+        layer = self.getLayer_glif()
+        other, _ = self.objectGenerator("layer")
+        other.newGlyph("A").width = 1000
+        other.loadFromGLIFs(layer.dumpToGLIFs())
+        self.assertEqual(sorted(other.keys()), ["A", "B", "C", "D"])
+        self.assertEqual(other.dumpToGLIFs(), layer.dumpToGLIFs())
+
+    def test_loadFromGLIFs_workers(self):
+        layer = self.getLayer_glif()
+        other, _ = self.objectGenerator("layer")
+        other.loadFromGLIFs(layer.iterDumpToGLIFs(workers=2), workers=2)
+        self.assertEqual(other.dumpToGLIFs(), layer.dumpToGLIFs())
+
+    def test_loadFromGLIFs_invalid(self):
+        layer, _ = self.objectGenerator("layer")
+        with self.assertRaises(FontPartsError):
+            layer.loadFromGLIFs({"A": "<glyph name='A' format='2'><foo/></glyph>"})
+
+    def test_loadFromGLIFs_invalidKeepsGlyph(self):
+        layer = self.getLayer_glif()
+        expected = layer["A"].dumpToGLIF()
+        with self.assertRaises(FontPartsError):
+            layer.loadFromGLIFs({"A": "<glyph name='A' format='2'><foo/></glyph>"})
+        self.assertEqual(layer["A"].dumpToGLIF(), expected)
+
+    def test_loadFromGLIFs_invalidNotAdded(self):
+        layer, _ = self.objectGenerator("layer")
+        with self.assertRaises(FontPartsError):
+            layer.loadFromGLIFs({"X": "<glyph name='X' format='2'><foo/></glyph>"})
+        self.assertNotIn("X", layer)
+
+    def test_loadFromGLIFs_partialFailure(self):
+        layer = self.getLayer_glif()
+        other, _ = self.objectGenerator("layer")
+        glifs = [
+            ("A", layer["A"].dumpToGLIF()),
+            ("B", "<glyph name='B' format='2'><foo/></glyph>"),
+            ("C", layer["C"].dumpToGLIF())
+        ]
+        other.newGlyph("A").width = 1000
+        with self.assertRaises(FontPartsError):
+            other.loadFromGLIFs(glifs)
+        self.assertEqual(list(other.keys()), ["A"])
+        self.assertEqual(other["A"].width, 1000)
+
+    def test_loadFromGLIFs_namesFromKeys(self):
+        layer = self.getLayer_glif()
+        other, _ = self.objectGenerator("layer")
+        other.loadFromGLIFs({"X": layer["A"].dumpToGLIF()})
+        self.assertEqual(list(other.keys()), ["X"])
+        self.assertEqual(other["X"].name, "X")
+        self.assertEqual(other["X"].width, layer["A"].width)
+
+    def test_loadFromGLIFs_base(self):
+        from fontParts.base import BaseLayer
+
+        layer = self.getLayer_glif()
+        other, _ = self.objectGenerator("layer")
+        other.newGlyph("A").width = 1000
+        BaseLayer._loadFromGLIFs(
+            other,
+            iter([("X", layer["B"].dumpToGLIF()),
+                  ("A", layer["A"].dumpToGLIF())])
+        )
+        self.assertEqual(sorted(other.keys()), ["A", "X"])
+        self.assertEqual(other["X"].width, layer["B"].width)
+        self.assertEqual(other["A"].dumpToGLIF(), layer["A"].dumpToGLIF())
+        with self.assertRaises(FontPartsError):
+            BaseLayer._loadFromGLIFs(
+                other,
+                iter([("Y", layer["C"].dumpToGLIF()),
+                      ("A", "<glyph name='A' format='2'><foo/></glyph>")])
+            )
+        self.assertEqual(other["A"].dumpToGLIF(), layer["A"].dumpToGLIF())
+        self.assertEqual(sorted(other.keys()), ["A", "X"])
+
+    def test_loadFromGLIFs_partialFailureWorkers(self):
+        layer = self.getLayer_glif()
+        other, _ = self.objectGenerator("layer")
+        other.newGlyph("A").width = 1000
+        glifs = [(name, layer[name].dumpToGLIF()) for name in "ABCD"] * 100
+        glifs.append(("X", "<glyph name='X' format='2'><foo/></glyph>"))
+        with self.assertRaises(FontPartsError):
+            other.loadFromGLIFs(glifs, workers=2)
+        self.assertEqual(list(other.keys()), ["A"])
+        self.assertEqual(other["A"].width, 1000)
+
+    def test_iterDumpToGLIFs_sharedPool(self):
+        import concurrent.futures
+        from unittest import mock
+        from fontParts.base.base import sharedProcessPool
+
+        layer = self.getLayer_glif()
+        with sharedProcessPool(2):
+            with mock.patch.object(concurrent.futures, "ProcessPoolExecutor",
+                                   side_effect=AssertionError):
+                glifs = list(layer.iterDumpToGLIFs(["A", "B"], workers=2))
+        self.assertEqual(
+            glifs,
+            [(name, layer[name].dumpToGLIF()) for name in ["A", "B"]]
+        )
+
+    def test_iterDumpToGLIFs_close(self):
+        layer = self.getLayer_glif()
+        import multiprocessing
+        from fontParts.base.base import _sharedProcessPool
+
+        glifs = layer.iterDumpToGLIFs(["A", "B"], workers=2)
+        self.assertEqual(next(glifs)[0], "A")
+        self.assertIsNone(_sharedProcessPool.get())
+        glifs.close()
+        self.assertEqual(multiprocessing.active_children(), [])
+
     # ----
     # Hash
     # ----
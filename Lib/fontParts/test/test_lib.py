@@ -123,6 +123,38 @@ class TestLib(unittest.TestCase):
             ["A", "B", "C"]
         )
 
+    # ------
+    # Update
+    # ------
+
+    def test_update(self):
+        lib = self.getLib_generic()
+        lib.update({"key 1": ["X"], "key 5": 5})
+        self.assertEqual(
+            lib["key 1"],
+            ["X"]
+        )
+        self.assertEqual(
+            lib["key 5"],
+            5
+        )
+
+    def test_update_copiesValues(self):
+        lib = self.getLib_generic()
+        value = ["X"]
+        lib.update({"key 5": value})
+        value.append("Y")
+        self.assertEqual(
+            lib["key 5"],
+            ["X"]
+        )
+
+    def test_update_invalidValue(self):
+        lib = self.getLib_generic()
+        with self.assertRaises(ValueError):
+            lib.update({"key 5": None})
+        self.assertFalse("key 5" in lib)
+
     # ----
     # Hash
     # ----
@@ -4,6 +4,46 @@ from fontParts.base import normalizers
 
 class TestNormalizers(unittest.TestCase):
 
+    # ------------
+    # Trusted Mode
+    # ------------
+
+    def test_trustedMode_inactive(self):
+        self.assertFalse(normalizers.isTrustedMode())
+        with self.assertRaises(ValueError):
+            normalizers.normalizeKerningKey(("A", "public.kern1.B"))
+
+    def test_trustedMode_active(self):
+        with normalizers.trustedMode():
+            self.assertTrue(normalizers.isTrustedMode())
+            result = normalizers.normalizeKerningKey(["A", "B"])
+        self.assertEqual(result, ("A", "B"))
+        self.assertIsInstance(result, tuple)
+
+    def test_trustedMode_reset(self):
+        with normalizers.trustedMode():
+            pass
+        self.assertFalse(normalizers.isTrustedMode())
+        with self.assertRaises(TypeError):
+            normalizers.normalizeCoordinateTuple(("1", 2))
+
+    def test_trustedMode_resetAfterError(self):
+        with self.assertRaises(KeyError):
+            with normalizers.trustedMode():
+                raise KeyError
+        self.assertFalse(normalizers.isTrustedMode())
+
+    def test_trustedMode_copy(self):
+        glyph, _ = self.objectGenerator("glyph")
+        glyph.appendAnchor("top", (10, 20))
+        glyph.lib["key"] = ["A", "B"]
+        copied = glyph.copy()
+        self.assertFalse(normalizers.isTrustedMode())
+        self.assertEqual(copied.anchors[0].position, (10, 20))
+        self.assertEqual(copied.lib["key"], ["A", "B"])
+        with self.assertRaises(ValueError):
+            copied.lib["key"] = None
+
     # ----
     # Font
     # ----
@@ -1548,6 +1588,28 @@ class TestNormalizers(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalizers.normalizeInterpolationFactor((2, 2, 2))
 
+    # normalizeWorkers
+
+    def test_normalizeWorkers_none(self):
+        result = normalizers.normalizeWorkers(None)
+        self.assertIsNone(result)
+
+    def test_normalizeWorkers_int(self):
+        result = normalizers.normalizeWorkers(4)
+        self.assertEqual(result, 4)
+
+    def test_normalizeWorkers_zero(self):
+        with self.assertRaises(ValueError):
+            normalizers.normalizeWorkers(0)
+
+    def test_normalizeWorkers_float(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeWorkers(2.0)
+
+    def test_normalizeWorkers_bool(self):
+        with self.assertRaises(TypeError):
+            normalizers.normalizeWorkers(True)
+
     # normalizeRotationAngle
 
     def test_normalizeRotationAngle_zero(self):
@@ -279,6 +279,56 @@ class TestPoint(unittest.TestCase):
         with self.assertRaises(TypeError):
             point.x = "100"
 
+    def test_get_x_subclassOverride(self):
+        point = self.getPoint_generic()
+
+        class PointSubclass(point.__class__):
+
+            def _get_x(self):
+                return 1000
+
+        point.__class__ = PointSubclass
+        self.assertEqual(
+            point.x,
+            1000
+        )
+
+    def test_get_x_classMutation(self):
+        point = self.getPoint_generic()
+
+        class PointSubclass(point.__class__):
+            pass
+
+        class PointSubSubclass(PointSubclass):
+            pass
+
+        point.__class__ = PointSubSubclass
+        PointSubclass._get_x = lambda self: 1000
+        self.assertEqual(
+            point.x,
+            1000
+        )
+        del PointSubclass._get_x
+        self.assertEqual(
+            point.x,
+            101
+        )
+
+    def test_set_x_classMutation(self):
+        point = self.getPoint_generic()
+
+        class PointSubclass(point.__class__):
+            pass
+
+        point.__class__ = PointSubclass
+        values = []
+        PointSubclass._set_x = lambda self, value: values.append(value)
+        point.x = 5
+        self.assertEqual(
+            values,
+            [5]
+        )
+
     # y
 
     def test_get_y(self):
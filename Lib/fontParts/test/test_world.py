@@ -1,7 +1,9 @@
 import unittest
 import tempfile
 import os
-from fontParts.world import RFont, FontList, OpenFont
+from fontParts.world import (
+    RFont, FontList, OpenFont, OpenFontAsync, OpenFonts, InterpolateFonts
+)
 
 class TestFontList(unittest.TestCase):
 
@@ -280,7 +282,27 @@ class TestFontList(unittest.TestCase):
         found = fonts.getFontsByFamilyNameStyleName("A", "1")
         self.assertEqual(found, [font1, font4])
 
-class TestFontOpen(unittest.TestCase):
+class TestInterpolateFonts(unittest.TestCase):
+
+    def getFont(self, offset):
+        font, _ = self.objectGenerator("font")
+        glyph = font.newGlyph("A")
+        pen = glyph.getPen()
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 100 + offset))
+        pen.lineTo((100 + offset, 100))
+        pen.closePath()
+        glyph.width = 200 + offset
+        return font
+
+    def test_interpolateFonts(self):
+        minFont = self.getFont(0)
+        maxFont = self.getFont(100)
+        fonts = InterpolateFonts([0, 0.5, 1], minFont, maxFont)
+        self.assertEqual(
+            [font["A"].width for font in fonts],
+            [200, 250, 300]
+        )
 
     def setUp(self):
         font, _ = self.objectGenerator("font")
@@ -295,8 +317,251 @@ class TestFontOpen(unittest.TestCase):
     def test_font_open(self):
         OpenFont(self.font_path)
 
+    def test_font_open_lazy(self):
+        OpenFont(self.font_path, lazy=True)
+
+    def test_font_open_withoutLazy(self):
+        from fontParts.world import dispatcher
+
+        opened = []
+
+        def openFont(pathOrObject, showInterface=True):
+            opened.append(pathOrObject)
+
+        original = dispatcher["OpenFont"]
+        dispatcher["OpenFont"] = openFont
+        try:
+            OpenFont(self.font_path)
+        finally:
+            dispatcher["OpenFont"] = original
+        self.assertEqual(opened, [self.font_path])
+
+    def test_font_open_async(self):
+        import asyncio
+
+        font = asyncio.run(OpenFontAsync(self.font_path))
+        self.assertEqual(font.path, self.font_path)
+
+    def _fontPaths(self):
+        paths = []
+        for i in range(3):
+            font, _ = self.objectGenerator("font")
+            for name in "ABC":
+                glyph = font.newGlyph(name)
+                glyph.width = i * 100
+                pen = glyph.getPen()
+                pen.moveTo((0, 0))
+                pen.lineTo((i, 100))
+                pen.lineTo((100, 0))
+                pen.closePath()
+            path = os.path.join(self.font_dir, "test%d.ufo" % i)
+            font.save(path)
+            paths.append(path)
+        return paths
+
+    def test_fonts_open(self):
+        paths = self._fontPaths()
+        fonts = OpenFonts(paths)
+        self.assertEqual(
+            [font.path for font in fonts],
+            paths
+        )
+        self.assertEqual(
+            [font["B"].width for font in fonts],
+            [0, 100, 200]
+        )
+        self.assertEqual(len(fonts.openTimes), len(paths))
+
+    def test_fonts_open_duplicatePaths(self):
+        paths = self._fontPaths()
+        paths = [paths[0], paths[1], paths[0]]
+        fonts = OpenFonts(paths)
+        self.assertEqual(
+            [font.path for font in fonts],
+            paths
+        )
+        self.assertEqual(len(fonts.openTimes), 3)
+
+    def test_fonts_open_workers(self):
+        paths = self._fontPaths()
+        serial = OpenFonts(paths)
+        parallel = OpenFonts(paths, workers=2)
+        self.assertEqual(
+            [font["A"].dumpToGLIF() for font in parallel],
+            [font["A"].dumpToGLIF() for font in serial]
+        )
+
+    def test_fonts_open_lazy(self):
+        from unittest import mock
+
+        paths = self._fontPaths()
+        with mock.patch("concurrent.futures.ProcessPoolExecutor",
+                        side_effect=AssertionError):
+            fonts = OpenFonts(paths, lazy=True, workers=2)
+        self.assertEqual(
+            [font["C"].width for font in fonts],
+            [0, 100, 200]
+        )
+
+    def test_fonts_open_sharedPoolPerThread(self):
+        import threading
+        from fontParts.base.base import _sharedProcessPool, sharedProcessPool
+
+        seen = []
+        thread = threading.Thread(
+            target=lambda: seen.append(_sharedProcessPool.get())
+        )
+        with sharedProcessPool(2):
+            self.assertIsNotNone(_sharedProcessPool.get())
+            thread.start()
+            thread.join()
+        self.assertEqual(seen, [None])
+        self.assertIsNone(_sharedProcessPool.get())
+
 
 class TestFontShell_RFont(unittest.TestCase):
 
     def test_fontshell_RFont_empty(self):
         RFont()
+
+    def _saveFont(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(__import__("shutil").rmtree, directory)
+        path = os.path.join(directory, "test.ufo")
+        font = RFont()
+        font.newGlyph("A").width = 100
+        font.save(path)
+        return font, path
+
+    def test_fontshell_RFont_saveAtomic_staleBackup(self):
+        font, path = self._saveFont()
+        os.mkdir(path + ".bak")
+        font["A"].width = 200
+        font.save(atomic=True)
+        self.assertFalse(os.path.exists(path + ".bak"))
+        self.assertEqual(RFont(path)["A"].width, 200)
+        self.assertEqual(font.path, path)
+
+    def test_fontshell_RFont_saveAtomic_exchange(self):
+        from unittest import mock
+        from fontParts.fontshell import font as fontshellFont
+
+        if fontshellFont._getRenameat2() is None:
+            self.skipTest("renameat2 is not available.")
+        font, path = self._saveFont()
+        font["A"].width = 200
+        with mock.patch.object(fontshellFont.os, "rename",
+                               side_effect=AssertionError):
+            try:
+                font.save(atomic=True)
+            except OSError:
+                self.skipTest("The file system can't exchange paths.")
+        self.assertEqual(RFont(path)["A"].width, 200)
+        self.assertEqual(
+            sorted(os.listdir(os.path.dirname(path))),
+            ["test.ufo"]
+        )
+
+    def test_fontshell_RFont_saveAtomic_interrupted(self):
+        from unittest import mock
+        from fontParts.fontshell import font as fontshellFont
+
+        font, path = self._saveFont()
+        font.newGlyph("B").width = 50
+        font.save()
+        font = RFont(path)
+        font["A"].width = 200
+        rename = os.rename
+        calls = []
+
+        def interruptedRename(source, destination):
+            calls.append(destination)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            rename(source, destination)
+
+        with mock.patch.object(fontshellFont, "_exchangePaths",
+                               return_value=False), \
+                mock.patch.object(fontshellFont.os, "rename",
+                                  interruptedRename):
+            with self.assertRaises(KeyboardInterrupt):
+                font.save(atomic=True)
+        self.assertEqual(calls, [path + ".bak", path])
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(RFont(path + ".bak")["A"].width, 100)
+        self.assertTrue(font["A"].naked().dirty)
+        # The next save moves the previous font back first.
+        font.save(atomic=True)
+        self.assertFalse(os.path.exists(path + ".bak"))
+        saved = RFont(path)
+        self.assertEqual(saved["A"].width, 200)
+        self.assertEqual(saved["B"].width, 50)
+        self.assertEqual(font["B"].width, 50)
+
+    def _saveInvalidGlyph(self):
+        font, path = self._saveFont()
+        font.newGlyph("B").width = 100
+        font.save()
+        glifPath = os.path.join(path, "glyphs", "B_.glif")
+        with open(glifPath) as f:
+            text = f.read()
+        text = text.replace("<advance", "<advance width=\"200\"/>\n  <advance")
+        with open(glifPath, "w") as f:
+            f.write(text)
+        return path
+
+    def test_fontshell_RFont_lazy_validatesGlyphs(self):
+        from fontTools.ufoLib.glifLib import GlifLibError
+
+        path = self._saveInvalidGlyph()
+        os.remove(os.path.join(path, "glyphs", "A_.glif"))
+        font = OpenFont(path, lazy=True)
+        self.assertEqual(sorted(font.keys()), ["A", "B"])
+        with self.assertRaises(GlifLibError):
+            font["B"]
+
+    def test_fontshell_RFont_lazy_validatesGlyphsAfterSave(self):
+        from fontTools.ufoLib.glifLib import GlifLibError
+
+        path = self._saveInvalidGlyph()
+        for incremental in (False, True):
+            font = OpenFont(path, lazy=True)
+            font["A"].width = 300
+            font.save(incremental=incremental)
+            with self.assertRaises(GlifLibError):
+                font["B"]
+
+    def test_fontshell_RFont_lazy_validatesPreload(self):
+        from fontTools.ufoLib.glifLib import GlifLibError
+
+        path = self._saveInvalidGlyph()
+        for workers in (None, 2):
+            font = OpenFont(path, lazy=True)
+            with self.assertRaises(GlifLibError):
+                font.preload(workers=workers)
+
+    def test_fontshell_writeGLIFData_fileNames(self):
+        from fontTools.ufoLib.glifLib import GlyphSet
+        from fontParts.fontshell._defcon import writeGLIFData
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(__import__("shutil").rmtree, directory)
+        glyphSet = GlyphSet(directory)
+        glyph = RFont().newGlyph("a_")
+        writeGLIFData(glyphSet, "A", glyph.dumpToGLIF().encode("utf-8"))
+        glyphSet.writeGlyph("a_", glyph.naked(), glyph.naked().drawPoints)
+        glyphSet.writeContents()
+        self.assertEqual(
+            len(set(fileName.lower() for fileName in glyphSet.contents.values())),
+            2
+        )
+        self.assertEqual(sorted(GlyphSet(directory).keys()), ["A", "a_"])
+
+    def test_fontshell_RFont_save_workers_defconFont(self):
+        import defcon
+
+        font, path = self._saveFont()
+        font = RFont(defcon.Font(path))
+        font["A"].width = 200
+        font.save(workers=2)
+        self.assertEqual(RFont(path)["A"].width, 200)
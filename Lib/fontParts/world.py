@@ -1,9 +1,13 @@
-def OpenFont(path, showInterface=True):
+def OpenFont(path, showInterface=True, lazy=False):
     """
     Open font located at **path**. If **showInterface**
     is ``False``, the font should be opened without
     graphical interface. The default for **showInterface**
-    is ``True``.
+    is ``True``. If **lazy** is ``True``, only the font's
+    metadata is read up front and the rest of the font is
+    read when it is first accessed. See :class:`BaseFont`
+    and :meth:`BaseFont.preload`. The default for **lazy**
+    is ``False``.
 
     ::
 
@@ -11,8 +15,78 @@ def OpenFont(path, showInterface=True):
 
         font = OpenFont("/path/to/my/font.ufo")
         font = OpenFont("/path/to/my/font.ufo", showInterface=False)
+        font = OpenFont("/path/to/my/font.ufo", lazy=True)
+    """
+    # Only pass lazy when it is requested so that environments
+    # that don't support it can still open fonts.
+    kwargs = {}
+    if lazy:
+        kwargs["lazy"] = True
+    return dispatcher["OpenFont"](pathOrObject=path, showInterface=showInterface,
+                                  **kwargs)
+
+
+async def OpenFontAsync(path, showInterface=True, lazy=False):
     """
-    return dispatcher["OpenFont"](pathOrObject=path, showInterface=showInterface)
+    Open the font located at **path** without blocking
+    the event loop. The arguments are the same as in
+    :func:`OpenFont`. The font is opened with
+    :func:`fontParts.base.base.runAsync`.
+
+    ::
+
+        from fontParts.world import *
+
+        font = await OpenFontAsync("/path/to/my/font.ufo")
+    """
+    from fontParts.base.base import runAsync
+
+    return await runAsync(OpenFont, path, showInterface=showInterface,
+                          lazy=lazy)
+
+
+def OpenFonts(paths, showInterface=True, lazy=False, workers=None):
+    """
+    Open the fonts located at **paths** and return them
+    in a :func:`FontList` in the order of **paths**.
+    **showInterface** and **lazy** are the same as in
+    :func:`OpenFont`. The fonts are opened one after the
+    other in this process. Unless **lazy** is ``True``, the
+    glyphs of every font are then read with
+    :meth:`BaseFont.preload`, which parses them in one
+    shared pool of **workers** processes. Only the glyph
+    parsing is done in parallel, and **workers** is not
+    used when **lazy** is ``True``. The number of seconds
+    it took to open each font is stored in the list's
+    ``openTimes`` attribute, a ``list`` in the order of
+    **paths**.
+
+    ::
+
+        from fontParts.world import *
+
+        fonts = OpenFonts(["/path/to/light.ufo", "/path/to/bold.ufo"])
+        fonts = OpenFonts(masterPaths, workers=4)
+        fonts = OpenFonts(masterPaths, lazy=True)
+    """
+    import time
+    from fontParts.base import normalizers
+    from fontParts.base.base import sharedProcessPool
+
+    workers = normalizers.normalizeWorkers(workers)
+    if lazy:
+        workers = None
+    fonts = FontList()
+    fonts.openTimes = []
+    with sharedProcessPool(workers):
+        for path in paths:
+            start = time.perf_counter()
+            font = OpenFont(path, showInterface=showInterface, lazy=lazy)
+            if not lazy:
+                font.preload(workers=workers)
+            fonts.append(font)
+            fonts.openTimes.append(time.perf_counter() - start)
+    return fonts
 
 
 def NewFont(familyName=None, styleName=None, showInterface=True):
@@ -37,6 +111,36 @@ def NewFont(familyName=None, styleName=None, showInterface=True):
                                  showInterface=showInterface)
 
 
+def InterpolateFonts(factors, minFont, maxFont, round=True,
+                     suppressError=True):
+    """
+    Create a new font for each factor in **factors** and
+    interpolate it between **minFont** and **maxFont**.
+    **round** and **suppressError** are the same as in
+    :meth:`BaseFont.interpolate`. The masters are
+    converted once with an :class:`InterpolationSession
+    <fontParts.base.interpolation.InterpolationSession>`.
+    The fonts are returned in a :func:`FontList` in the order
+    of **factors**.
+
+    ::
+
+        from fontParts.world import *
+
+        fonts = InterpolateFonts([0.25, 0.5, 0.75], light, bold)
+    """
+    from fontParts.base.interpolation import InterpolationSession
+
+    session = InterpolationSession(minFont, maxFont)
+    fonts = FontList()
+    for factor in factors:
+        font = NewFont(showInterface=False)
+        session.interpolate(factor, font, round=round,
+                            suppressError=suppressError)
+        fonts.append(font)
+    return fonts
+
+
 def CurrentFont():
     """
     Get the "current" font.
@@ -627,8 +731,9 @@ try:
 
     # OpenFont, RFont
 
-    def _fontshellRFont(pathOrObject=None, showInterface=True):
-        return fontshell.RFont(pathOrObject=pathOrObject, showInterface=showInterface)
+    def _fontshellRFont(pathOrObject=None, showInterface=True, lazy=False):
+        return fontshell.RFont(pathOrObject=pathOrObject, showInterface=showInterface,
+                               lazy=lazy)
 
     dispatcher["OpenFont"] = _fontshellRFont
     dispatcher["RFont"] = _fontshellRFont
@@ -0,0 +1,67 @@
+"""
+Time iterating and updating kerning.
+
+BaseDict._iter walks a snapshot of the keys once and
+BaseDict.update normalizes the items and passes them to the
+environment in one call. The previous versions, which sliced
+the key list after every key and set the items one by one,
+are timed alongside them.
+
+    PYTHONPATH=Lib python benchmarks/dict.py
+"""
+import time
+from copy import deepcopy
+from fontParts.fontshell import RFont
+
+
+def previousIter(kerning):
+    keys = kerning.keys()
+    while keys:
+        key = keys[0]
+        yield key
+        keys = keys[1:]
+
+
+def previousUpdate(kerning, other):
+    other = deepcopy(other)
+    for key, value in other.items():
+        kerning[key] = value
+
+
+def makePairs(count):
+    pairs = {}
+    for i in range(count):
+        pairs["glyph%d" % (i // 1000), "glyph%d" % (i % 1000)] = i % 100
+    return pairs
+
+
+def timeit(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    print("%8s  %10s  %10s  %10s  %11s" % (
+        "pairs", "iter", "iter prev", "update", "update prev"))
+    for count in (1000, 10000, 100000):
+        pairs = makePairs(count)
+        kerning = RFont().kerning
+        updateTime = timeit(lambda: kerning.update(pairs))
+        iterTime = timeit(lambda: list(kerning))
+        # The previous iteration is quadratic. It is
+        # only timed where it finishes in seconds.
+        if count <= 10000:
+            previousIterTime = "%9.3fs" % timeit(
+                lambda: list(previousIter(kerning)))
+        else:
+            previousIterTime = "%10s" % "-"
+        previous = RFont().kerning
+        previousUpdateTime = timeit(lambda: previousUpdate(previous, pairs))
+        print("%8d  %9.3fs  %s  %9.3fs  %10.3fs" % (
+            count, iterTime, previousIterTime, updateTime,
+            previousUpdateTime))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Time the interpolation of 100,000 kerning pairs.
+
+BaseKerning._interpolate resolves the pairs in one pass with
+_interpolateKerning. The result is compared with, and timed
+against, the fontMath MathKerning interpolation it replaced.
+
+    PYTHONPATH=Lib python benchmarks/kerning.py
+"""
+import random
+import time
+import fontMath
+from fontParts.fontshell import RFont
+from fontParts.base.base import interpolate
+from fontParts.base.kerning import _interpolateKerning
+
+
+def makeFont(seed, pairCount=100000):
+    rng = random.Random(seed)
+    font = RFont()
+    glyphNames = ["glyph%03d" % i for i in range(400)]
+    groups = {}
+    for i in range(20):
+        members = glyphNames[i * 10:(i + 1) * 10]
+        groups["public.kern1.group%d" % i] = members
+        groups["public.kern2.group%d" % i] = members
+    font.groups.update(groups)
+    side1 = [name for name in groups if name.startswith("public.kern1.")]
+    side2 = [name for name in groups if name.startswith("public.kern2.")]
+    kerning = {}
+    for first in side1:
+        for second in side2:
+            kerning[first, second] = rng.randint(-100, 100)
+    firstNames = glyphNames + side1
+    secondNames = glyphNames + side2
+    while len(kerning) < pairCount:
+        pair = (rng.choice(firstNames), rng.choice(secondNames))
+        kerning[pair] = rng.randint(-100, 100)
+    font.kerning.update(kerning)
+    return font
+
+
+def timeit(function, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    minFont = makeFont(1)
+    maxFont = makeFont(2)
+    # The two masters share their group pairs, the other
+    # pairs are mostly in only one of them.
+    print("pairs: %d / %d" % (len(minFont.kerning), len(maxFont.kerning)))
+
+    def withFontMath():
+        minKerning = fontMath.MathKerning(kerning=minFont.kerning,
+                                          groups=minFont.groups)
+        maxKerning = fontMath.MathKerning(kerning=maxFont.kerning,
+                                          groups=maxFont.groups)
+        result = interpolate(minKerning, maxKerning, 0.5)
+        return {pair: result[pair] for pair in result.keys()}
+
+    def withOnePass():
+        return _interpolateKerning(
+            0.5, dict(minFont.kerning.items()), dict(maxFont.kerning.items()),
+            minFont.groups._getKerningGroupIndex()
+        )
+
+    def withFont():
+        font = RFont()
+        font.kerning.interpolate(0.5, minFont.kerning, maxFont.kerning,
+                                 round=False)
+        return font
+
+    mathTime, expected = timeit(withFontMath)
+    passTime, result = timeit(withOnePass)
+    fontTime, _ = timeit(withFont)
+    assert result == expected
+    print("fontMath.MathKerning:     %.2fs" % mathTime)
+    print("_interpolateKerning:      %.2fs" % passTime)
+    print("BaseKerning.interpolate:  %.2fs" % fontTime)
+
+
+if __name__ == "__main__":
+    main()
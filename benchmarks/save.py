@@ -0,0 +1,65 @@
+"""
+Time the overhead of atomic saving.
+
+A font with 2,000 glyphs is saved in place with one changed
+glyph, with and without atomic=True. The atomic save clones
+the UFO next to it, hard linking the GLIF files that aren't
+written, and then moves the clone into place. The move is
+timed with renameat2(RENAME_EXCHANGE), where available, and
+with the two renames through <path>.bak.
+
+    PYTHONPATH=Lib python benchmarks/save.py
+"""
+import os
+import shutil
+import tempfile
+import time
+from unittest import mock
+from fontParts.fontshell import RFont
+from fontParts.fontshell import font as fontshellFont
+
+
+def makeFont(path, glyphCount=2000):
+    font = RFont()
+    for i in range(glyphCount):
+        glyph = font.newGlyph("glyph%04d" % i)
+        glyph.width = 500
+        pen = glyph.getPen()
+        for j in range(4):
+            pen.moveTo((j * 10, 0))
+            pen.curveTo((j * 10, 100), (j * 10 + 100, 100), (j * 10 + 100, 0))
+            pen.closePath()
+    font.save(path)
+
+
+def timeSaves(path, repeat=5, **kwargs):
+    font = RFont(path)
+    times = []
+    for i in range(repeat):
+        font["glyph0000"].width = 500 + i + 1
+        start = time.perf_counter()
+        font.save(**kwargs)
+        times.append(time.perf_counter() - start)
+    font.close()
+    return min(times)
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "test.ufo")
+        makeFont(path)
+        print("save():                       %.3fs" % timeSaves(path))
+        if fontshellFont._getRenameat2() is not None:
+            print("save(atomic=True), exchange:  %.3fs"
+                  % timeSaves(path, atomic=True))
+        with mock.patch.object(fontshellFont, "_exchangePaths",
+                               return_value=False):
+            print("save(atomic=True), renames:   %.3fs"
+                  % timeSaves(path, atomic=True))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Time font copying and interpolation with and without
+normalizers.trustedMode.
+
+fontParts enters trusted mode around BaseObject.copy,
+BaseFont.interpolate and other places where every value comes
+from fontParts objects. The normalizers then skip validation.
+For comparison, trustedMode is replaced by a context manager
+that does nothing.
+
+    PYTHONPATH=Lib python benchmarks/trusted.py
+"""
+import contextlib
+import time
+from unittest import mock
+from fontParts.base import normalizers
+from fontParts.fontshell import RFont
+
+
+def makeFont(offset, glyphCount=300, pairCount=30000):
+    font = RFont()
+    glyphNames = ["glyph%03d" % i for i in range(glyphCount)]
+    for glyphName in glyphNames:
+        glyph = font.newGlyph(glyphName)
+        glyph.width = 500 + offset
+        pen = glyph.getPen()
+        for j in range(4):
+            pen.moveTo((j * 10, 0))
+            pen.curveTo((j * 10, 100 + offset), (j * 10 + 100, 100),
+                        (j * 10 + 100, 0))
+            pen.closePath()
+        glyph.appendAnchor("top", (250, 700 + offset))
+        glyph.lib["com.example.data"] = {
+            "values": list(range(20)),
+            "nested": {"names": glyphNames[:20]}
+        }
+    kerning = {}
+    for i in range(pairCount):
+        pair = (glyphNames[i % glyphCount], glyphNames[i // 100 % glyphCount])
+        kerning[pair] = (i % 100) + offset
+    font.kerning.update(kerning)
+    return font
+
+
+def best(function, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(minFont, maxFont):
+    copyTime = best(minFont.copy)
+    interpolateTime = best(
+        lambda: RFont().interpolate(0.5, minFont, maxFont)
+    )
+    return copyTime, interpolateTime
+
+
+def main():
+    minFont = makeFont(0)
+    maxFont = makeFont(100)
+    trusted = run(minFont, maxFont)
+    with mock.patch.object(normalizers, "trustedMode", contextlib.nullcontext):
+        untrusted = run(minFont, maxFont)
+    print("%-12s  %10s  %10s" % ("", "trusted", "untrusted"))
+    for name, trustedTime, untrustedTime in zip(
+            ("copy", "interpolate"), trusted, untrusted):
+        print("%-12s  %9.2fs  %9.2fs" % (name, trustedTime, untrustedTime))
+
+
+if __name__ == "__main__":
+    main()
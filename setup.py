@@ -25,9 +25,9 @@ setup_params = dict(
     },
     setup_requires=['setuptools_scm'],
     install_requires=[
-        "FontTools[ufo,lxml,unicode]>=3.32.0",
+        "FontTools[ufo,lxml,unicode]>=4.28.5",
         "fontMath>=0.4.8",
-        "defcon[pens]>=0.6.0",
+        "defcon[pens]>=0.10.0",
         "booleanOperations>=0.9.0",
     ],
     classifiers=[